@@ -1,10 +1,25 @@
+import hashlib
+import io
+import json
+import os
+import sys
+from pathlib import Path
+
 import streamlit as st
-import matplotlib.pyplot as plt
 import numpy as np
 
+# Paket inti (labcore) ada di akar repo; modul grafik Matplotlib baru dimuat saat dipakai
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from labcore import perf, viz
+from labcore.cache import LRUCache
+from labcore.quadratic import SWEEP_LABELS, as_coefficients, sweep_nbytes, sweep_slice, vega_lite_spec, vertex
+
 # --- Konfigurasi Halaman ---
 st.set_page_config(layout="wide", page_title="Virtual Lab Grafik Fungsi Kuadrat")
 
+# Pengukuran waktu per fase rerun (aktif bila LAB_PERF=1)
+timer = perf.start("gacorrrr")
+
 st.title("🔬 Virtual Lab Grafik Fungsi Kuadrat")
 st.markdown("Aplikasi interaktif untuk memahami pengaruh koefisien **$a$**, **$b$**, dan **$c$** pada grafik fungsi kuadrat $f(x) = ax^2 + bx + c$.")
 
@@ -13,8 +28,26 @@ st.divider()
 # --- Kontrol Interaktif (Sidebar) ---
 st.sidebar.header("Kontrol Koefisien F(x) = ax² + bx + c")
 
+lab_mode = st.sidebar.radio(
+    "Mode Lab",
+    ("Grafik Tunggal", "Keluarga Kurva", "Sapuan Parameter"),
+    help="Keluarga Kurva menumpuk banyak parabola sekaligus (sapuan nilai a atau koefisien unggahan). "
+         "Sapuan Parameter memetakan diskriminan dan akar di seluruh bidang b-c untuk nilai a saat ini."
+)
+
 MAX_VAL_SMALL = 10.0
 MIN_VAL_SMALL = -10.0
+A_STEP = 0.1
+BC_STEP = 0.5
+
+# Batas cache grafik (bisa diatur lewat environment variable)
+PLOT_CACHE_MAX_ENTRIES = int(os.environ.get("PLOT_CACHE_MAX_ENTRIES", 512))
+PLOT_CACHE_MAX_MB = float(os.environ.get("PLOT_CACHE_MAX_MB", 64))
+PLOT_IMAGE_FORMAT = os.environ.get("PLOT_IMAGE_FORMAT", "png")  # "png" atau "svg"
+PLOT_RENDERER = os.environ.get("PLOT_RENDERER", PLOT_IMAGE_FORMAT)  # "png", "svg", atau "plotly"
+MAX_FAMILY_CURVES = 5000
+SWEEP_CACHE_MAX_MB = float(os.environ.get("SWEEP_CACHE_MAX_MB", 256))
+
 
 # Koefisien a (Kecekungan/Kelancipan)
 a = st.sidebar.slider(
@@ -22,7 +55,7 @@ a = st.sidebar.slider(
     min_value=-5.0, # Batas a sedikit diperkecil agar grafik tidak terlalu lancip
     max_value=5.0,
     value=1.0,
-    step=0.1,
+    step=A_STEP,
     help="a > 0: terbuka ke atas. a < 0: terbuka ke bawah. Semakin besar |a|, grafik semakin sempit."
 )
 
@@ -32,7 +65,7 @@ b = st.sidebar.slider(
     min_value=MIN_VAL_SMALL,
     max_value=MAX_VAL_SMALL,
     value=0.0,
-    step=0.5,
+    step=BC_STEP,
     help="Menggeser sumbu simetri secara horizontal."
 )
 
@@ -42,7 +75,7 @@ c = st.sidebar.slider(
     min_value=MIN_VAL_SMALL,
     max_value=MAX_VAL_SMALL,
     value=0.0,
-    step=0.5,
+    step=BC_STEP,
     help="Menggeser grafik secara vertikal."
 )
 
@@ -67,50 +100,199 @@ st.latex(formula_display.replace("f(x)=", ""))
 
 # --- Visualisasi Grafik ---
 
-# Hitung Titik Puncak
-if a != 0:
-    x_puncak = -b / (2 * a)
-    y_puncak = a * x_puncak**2 + b * x_puncak + c
-else:
-    x_puncak = 0
-    y_puncak = c
+def quantize_coefficients(a, b, c):
+    """Bulatkan koefisien ke grid slider (a: 0.1, b/c: 0.5) sebagai kunci cache."""
+    return (round(a / A_STEP), round(b / BC_STEP), round(c / BC_STEP))
+
+def figure_pool():
+    """Figure Matplotlib milik sesi ini, dipakai ulang antar-rerun."""
+    if "figure_pool" not in st.session_state:
+        st.session_state.figure_pool = viz.backend.FigurePool()
+    return st.session_state.figure_pool
+
+def render_parabola(qa, qb, qc, image_format="png"):
+    """Gambar grafik untuk koefisien terkuantisasi dan kembalikan bytes gambar + metrik."""
+    return viz.quadratic.render_parabola(qa * A_STEP, qb * BC_STEP, qc * BC_STEP, image_format, pool=figure_pool())
+
+def load_coefficients(uploaded_file):
+    """Baca file CSV berisi kolom a,b,c (header opsional) menjadi array (K, 3)."""
+    raw = uploaded_file.getvalue().decode("utf-8")
+    try:
+        coeffs = np.loadtxt(io.StringIO(raw), delimiter=",", ndmin=2)
+    except ValueError:
+        coeffs = np.loadtxt(io.StringIO(raw), delimiter=",", ndmin=2, skiprows=1)
+    return as_coefficients(coeffs)
+
+def show_image(entry):
+    """Tampilkan entri grafik (PNG atau SVG) ke Streamlit."""
+    with timer.phase("serialize"):
+        if entry["format"] == "svg":
+            st.image(entry["image"].decode("utf-8"), use_container_width=True)
+        else:
+            st.image(entry["image"], use_container_width=True)
+    timer.record_bytes("image", len(entry["image"]))
+
+def plot_entry_size(entry):
+    """Perkiraan ukuran entri cache grafik dalam byte."""
+    return len(entry["image"]) + 512
+
+@st.cache_resource
+def get_plot_cache():
+    """Cache grafik yang dibagi oleh semua sesi dalam satu proses server."""
+    return LRUCache(
+        max_entries=PLOT_CACHE_MAX_ENTRIES,
+        max_bytes=PLOT_CACHE_MAX_MB * 1024 * 1024,
+        sizeof=plot_entry_size,
+    )
+
+@st.cache_resource
+def get_sweep_cache():
+    """Cache hasil sapuan per irisan a, dibagi oleh semua sesi."""
+    return LRUCache(max_entries=64, max_bytes=SWEEP_CACHE_MAX_MB * 1024 * 1024, sizeof=sweep_nbytes)
+
+def show_cache_stats(cache):
+    """Tampilkan statistik cache grafik di sidebar."""
+    with st.sidebar.expander("Statistik Cache Grafik"):
+        stats = cache.stats()
+        st.write(
+            f"Entri: {stats['entries']}/{stats['max_entries']} · "
+            f"Ukuran: {stats['bytes'] / 1024:.0f}/{stats['max_bytes'] / 1024:.0f} KB"
+        )
+        st.write(f"Hit: {stats['hits']} · Miss: {stats['misses']} · Dibuang: {stats['evictions']} · Rasio hit: {stats['hit_rate']:.0%}")
 
-# Rentang X untuk Plot
-x_plot = np.linspace(-10, 10, 400)
-y_plot = a * x_plot**2 + b * x_plot + c
+plot_cache = get_plot_cache()
 
-# Tentukan rentang Y plot agar adaptif tetapi fokus di sekitar rentang X [-10, 10]
-min_y_plot = np.min(y_plot)
-max_y_plot = np.max(y_plot)
-y_buffer = max(1.0, (max_y_plot - min_y_plot) * 0.1) # Buffer minimal 1.0
+if lab_mode == "Keluarga Kurva":
+    st.sidebar.markdown("---")
+    st.sidebar.subheader("Keluarga Kurva")
+    family_source = st.sidebar.selectbox(
+        "Sumber Koefisien",
+        ("Sapuan nilai a (b, c tetap)", "Unggah koefisien (CSV a,b,c)")
+    )
+    coeffs = None
+    if family_source == "Sapuan nilai a (b, c tetap)":
+        a_min, a_max = st.sidebar.slider("Rentang a", -5.0, 5.0, (-3.0, 3.0), A_STEP)
+        n_curves = st.sidebar.slider("Jumlah Kurva", 2, 200, 25)
+        coeffs = np.column_stack([
+            np.linspace(a_min, a_max, n_curves),
+            np.full(n_curves, b),
+            np.full(n_curves, c),
+        ])
+    else:
+        uploaded = st.sidebar.file_uploader("File CSV (kolom a,b,c)", type=["csv", "txt"])
+        if uploaded is not None:
+            try:
+                with timer.phase("input"):
+                    coeffs = load_coefficients(uploaded)[:MAX_FAMILY_CURVES]
+            except ValueError as exc:
+                st.sidebar.error(f"Format file koefisien salah: {exc}")
 
-ax_min_y = min_y_plot - y_buffer
-ax_max_y = max_y_plot + y_buffer
+    st.header("Keluarga Parabola")
+    if coeffs is None or len(coeffs) == 0:
+        st.info("Unggah file CSV berisi koefisien a,b,c (satu parabola per baris).")
+    else:
+        family_key = ("family", hashlib.sha1(coeffs.tobytes()).hexdigest(), PLOT_IMAGE_FORMAT)
+        with timer.phase("figure"):
+            family_entry = plot_cache.get_or_create(family_key, lambda: viz.quadratic.render_family(coeffs, PLOT_IMAGE_FORMAT))
+        show_image(family_entry)
+        st.caption(
+            f"{len(coeffs)} kurva digambar dengan satu LineCollection; sampel x dirapatkan di sekitar "
+            "titik puncak dan akar tiap kurva."
+        )
+    show_cache_stats(plot_cache)
+    viz.backend.show_gauges()
+    perf.show_panel(timer)
+    timer.finish()
+    st.stop()
 
-# Buat Plot Matplotlib
-fig, ax = plt.subplots(figsize=(10, 6))
-ax.plot(x_plot, y_plot, label=f"a={format_value(a)}, b={format_value(b)}, c={format_value(c)}", color='orange', linewidth=3)
+if lab_mode == "Sapuan Parameter":
+    st.sidebar.markdown("---")
+    st.sidebar.subheader("Sapuan Parameter")
+    quantity = st.sidebar.selectbox(
+        "Besaran yang Dipetakan",
+        list(SWEEP_LABELS),
+        format_func=SWEEP_LABELS.get
+    )
+    resolution = st.sidebar.select_slider(
+        "Resolusi Grid (b × c)",
+        options=[250, 500, 1000, 1500, 2000],
+        value=1000
+    )
 
-# Scatter titik puncak dan titik potong Y (jika dalam batas sumbu)
-ax.scatter(x_puncak, y_puncak, color='red', zorder=5, label='Titik Puncak') 
-ax.scatter(0, c, color='blue', zorder=5, label='Titik Potong Y')
+    # Irisan untuk a yang sama dipakai ulang saat slider a digeser bolak-balik
+    sweep_cache = get_sweep_cache()
+    sweep_key = (quantize_coefficients(a, 0, 0)[0], resolution)
+    with timer.phase("compute"):
+        sweep = sweep_cache.get_or_create(
+            sweep_key, lambda: sweep_slice(sweep_key[0] * A_STEP, resolution=(resolution, resolution))
+        )
+    sweep_plot_key = ("sweep", quantity) + sweep_key + quantize_coefficients(0, b, c)[1:] + (PLOT_IMAGE_FORMAT,)
+    with timer.phase("figure"):
+        sweep_entry = plot_cache.get_or_create(
+            sweep_plot_key, lambda: viz.quadratic.render_sweep(sweep, quantity, b, c, PLOT_IMAGE_FORMAT)
+        )
 
-# Pengaturan Sumbu dan Garis Bantu
-ax.axhline(0, color='gray', linewidth=0.8, linestyle='--')
-ax.axvline(0, color='gray', linewidth=0.8, linestyle='--')
-ax.grid(True, linestyle=':', alpha=0.6)
-ax.set_xlabel('Sumbu X', fontsize=12)
-ax.set_ylabel('Sumbu Y / f(x)', fontsize=12)
-ax.set_title('Grafik Parabola')
+    st.header(f"Sapuan Parameter untuk a = {format_value(a)}")
+    show_image(sweep_entry)
+    counts = np.bincount(sweep["root_count"].ravel(), minlength=3)
+    total = counts.sum()
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Tanpa akar real", f"{counts[0] / total:.1%}")
+    col2.metric("Satu akar", f"{counts[1] / total:.1%}")
+    col3.metric("Dua akar", f"{counts[2] / total:.1%}")
+    sweep_stats = sweep_cache.stats()
+    st.caption(
+        f"Grid {resolution}×{resolution} dihitung per blok baris. Cache irisan: {sweep_stats['entries']} irisan, "
+        f"{sweep_stats['bytes'] / 1024**2:.0f} MB, hit {sweep_stats['hits']} / miss {sweep_stats['misses']}."
+    )
+    show_cache_stats(plot_cache)
+    viz.backend.show_gauges()
+    perf.show_panel(timer)
+    timer.finish()
+    st.stop()
+
+render_mode = st.sidebar.radio(
+    "Mode Render Grafik",
+    ("Server (Matplotlib)", "Klien (Interaktif di Browser)"),
+    help="Mode klien menghitung kurva langsung di browser sehingga menggeser slider tidak membebani server."
+)
 
-# Terapkan batas sumbu tetap X (-10 s.d. 10) dan Y adaptif
-ax.set_xlim(-10, 10) 
-ax.set_ylim(ax_min_y, ax_max_y)
+if render_mode == "Server (Matplotlib)":
+    renderers = list(viz.backend.RENDERERS)
+    plot_renderer = st.sidebar.selectbox(
+        "Renderer Grafik", renderers, index=renderers.index(PLOT_RENDERER), format_func=viz.backend.RENDERERS.get,
+        help="PNG/SVG dirender Matplotlib di server (figure sesi dipakai ulang); Plotly digambar di browser."
+    )
+    if plot_renderer == "plotly":
+        with timer.phase("figure"):
+            fig, metrics = viz.quadratic.build_parabola_figure(a, b, c)
+        with timer.phase("serialize"):
+            st.plotly_chart(fig, use_container_width=True)
+    else:
+        cache_key = quantize_coefficients(a, b, c) + (plot_renderer,)
+        with timer.phase("figure"):
+            plot_entry = plot_cache.get_or_create(cache_key, lambda: render_parabola(*cache_key))
+        metrics = plot_entry["metrics"]
 
-ax.legend()
+        # Tampilkan plot ke Streamlit
+        show_image(plot_entry)
+    x_puncak = metrics["x_puncak"]
+    y_puncak = metrics["y_puncak"]
+else:
+    x_puncak, y_puncak = vertex(a, b, c)
+    with timer.phase("figure"):
+        spec = vega_lite_spec(a, b, c)
+    with timer.phase("serialize"):
+        st.vega_lite_chart(spec=spec, use_container_width=True)
+    timer.record_bytes("vega", lambda: len(json.dumps(spec)))
+    st.caption(
+        "Geser slider di bawah grafik untuk mengubah a, b, c secara langsung di browser. "
+        "Analisis di bawah mengikuti nilai slider di sidebar."
+    )
 
-# Tampilkan plot ke Streamlit
-st.pyplot(fig)
+show_cache_stats(plot_cache)
+viz.backend.show_gauges()
+perf.show_panel(timer)
 
 st.divider()
 
@@ -152,3 +334,5 @@ st.info(f"""
 3.  **Pengaruh 'c' ({format_value(c)}):**
     * Mengontrol pergeseran vertikal, yaitu tempat grafik **memotong sumbu Y** di $(0, c)$.
 """)
+
+timer.finish()
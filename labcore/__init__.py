@@ -0,0 +1,25 @@
+"""Kernel komputasi bersama untuk semua lab (hanya bergantung pada NumPy).
+
+Submodul dimuat saat pertama kali diakses, misalnya ``labcore.quadratic`` atau
+``from labcore import transforms``, sehingga ``import labcore`` hampir gratis.
+Kode grafik (Matplotlib/Plotly) ada di ``labcore.viz`` dan SciPy/pandas/Pillow
+hanya diimpor di dalam fungsi yang membutuhkannya.
+"""
+import importlib
+
+_SUBMODULES = (
+    "cache", "cross_section", "hypercube", "ingest", "lod", "perf", "persegi", "pipeline", "projection",
+    "quadratic", "raster", "table", "transforms", "tween", "viz",
+)
+
+__all__ = list(_SUBMODULES)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES))
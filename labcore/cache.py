@@ -0,0 +1,82 @@
+import sys
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Cache LRU thread-safe dengan batas jumlah entri dan total ukuran (byte).
+
+    Entri yang paling lama tidak dipakai dibuang lebih dulu sampai kedua batas
+    terpenuhi. Ukuran tiap entri dihitung dengan fungsi ``sizeof``.
+    """
+
+    def __init__(self, max_entries=256, max_bytes=64 * 1024 * 1024, sizeof=sys.getsizeof):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        """Ambil entri dan tandai sebagai yang terbaru dipakai."""
+        with self._lock:
+            if key not in self._data:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return self._data[key][0]
+
+    def put(self, key, value):
+        """Simpan entri, lalu buang entri lama bila melewati batas."""
+        size = self._sizeof(value)
+        with self._lock:
+            if key in self._data:
+                self.total_bytes -= self._data.pop(key)[1]
+            # Entri yang lebih besar dari seluruh kapasitas tidak disimpan
+            if size > self.max_bytes:
+                return value
+            self._data[key] = (value, size)
+            self.total_bytes += size
+            while len(self._data) > self.max_entries or self.total_bytes > self.max_bytes:
+                _, (_, old_size) = self._data.popitem(last=False)
+                self.total_bytes -= old_size
+                self.evictions += 1
+        return value
+
+    def get_or_create(self, key, factory):
+        """Ambil entri dari cache atau buat dengan ``factory()`` bila belum ada."""
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            value = self.put(key, factory())
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.total_bytes = 0
+
+    def stats(self):
+        """Ringkasan statistik cache (untuk ditampilkan di aplikasi)."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._data),
+            "max_entries": self.max_entries,
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
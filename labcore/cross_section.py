@@ -0,0 +1,89 @@
+from functools import lru_cache
+
+import numpy as np
+
+from .hypercube import hypercube_edges, hypercube_vertices
+from .projection import perspective_project
+
+KNIFE_DIRECTIONS = ("Diagonal utama", "Sumbu terakhir")
+
+
+def knife_normal(n, direction):
+    """Vektor normal satuan hyper-pisau untuk arah yang dipilih."""
+    if direction == "Sumbu terakhir":
+        normal = np.zeros(n)
+        normal[-1] = 1.0
+    else:
+        normal = np.ones(n) / np.sqrt(n)
+    return normal
+
+
+@lru_cache(maxsize=64)
+def edge_classification(n, direction):
+    """Klasifikasi rusuk terhadap arah pisau; dihitung sekali per (dimensi, arah).
+
+    Menyimpan ketinggian tiap titik sudut sepanjang normal (h = v · n), rentang
+    ketinggian tiap rusuk, serta titik awal dan vektor arah rusuk. Saat pisau
+    digeser, yang perlu dihitung hanya masker rusuk yang terpotong dan parameter
+    potongnya, bukan geometri rusuk dari awal.
+    """
+    vertices = hypercube_vertices(n)
+    edges, _ = hypercube_edges(n)
+    normal = knife_normal(n, direction)
+    heights = vertices @ normal
+    h_start, h_end = heights[edges[:, 0]], heights[edges[:, 1]]
+
+    # Basis ortonormal hyperplane (N-1 vektor yang tegak lurus normal)
+    basis = np.linalg.svd(normal[np.newaxis, :])[2][1:].T
+
+    return {
+        "heights": heights,
+        "h_start": h_start,
+        "h_low": np.minimum(h_start, h_end),
+        "h_high": np.maximum(h_start, h_end),
+        "h_delta": h_end - h_start,
+        "origin": vertices[edges[:, 0]],
+        "direction": vertices[edges[:, 1]] - vertices[edges[:, 0]],
+        "normal": normal,
+        "basis": basis,
+        "max_height": float(np.abs(heights).max()),
+    }
+
+
+def slice_points(n, direction, offset):
+    """Titik potong semua rusuk dengan hyperplane v · n = offset, dalam satu operasi array.
+
+    Hasilnya berupa koordinat (M, N-1) di dalam hyperplane. Titik kembar (misalnya
+    saat pisau tepat melewati titik sudut) digabung.
+    """
+    info = edge_classification(n, direction)
+    crossing = (info["h_low"] <= offset) & (info["h_high"] >= offset) & (info["h_delta"] != 0)
+    t = (offset - info["h_start"][crossing]) / info["h_delta"][crossing]
+    points = info["origin"][crossing] + t[:, np.newaxis] * info["direction"][crossing]
+    if len(points) == 0:
+        return np.empty((0, n - 1))
+    local = (points - offset * info["normal"]) @ info["basis"]
+    return np.unique(np.round(local, 9), axis=0)
+
+
+def slice_polytope(n, direction, offset, w_factor=0.5):
+    """Titik irisan dalam 3D beserta segitiga hull-nya (None bila irisan datar/degenerate).
+
+    Irisan kubus-N berdimensi N-1. Untuk N = 4 irisan langsung 3D; untuk N > 4
+    irisan diproyeksikan ke 3D dengan perspektif yang sama seperti hypercube.
+    """
+    # SciPy baru dimuat saat irisan pertama dihitung
+    from scipy.spatial import ConvexHull, QhullError
+
+    local = slice_points(n, direction, offset)
+    if local.shape[1] > 3:
+        local = perspective_project(local, w_factor)
+    elif local.shape[1] < 3:
+        local = np.pad(local, ((0, 0), (0, 3 - local.shape[1])))
+    simplices = None
+    if len(local) >= 4:
+        try:
+            simplices = ConvexHull(local).simplices
+        except QhullError:
+            simplices = None
+    return local, simplices
@@ -0,0 +1,94 @@
+from functools import lru_cache
+
+import numpy as np
+
+MAX_DIMENSION = 10
+
+
+def _check_dimension(n):
+    if not 1 <= n <= MAX_DIMENSION:
+        raise ValueError(f"Dimensi hypercube harus antara 1 dan {MAX_DIMENSION}, bukan {n}.")
+
+
+@lru_cache(maxsize=None)
+def hypercube_vertices(n):
+    """Titik sudut hypercube N dimensi, array (2^N, N) berisi -1 dan 1.
+
+    Bit ke-k dari indeks titik menentukan koordinat ke-k, sehingga urutannya sama
+    dengan daftar titik tesseract yang ditulis manual (koordinat X berubah paling cepat).
+    Hasil di-cache per dimensi dan dibuat read-only karena dipakai bersama.
+    """
+    _check_dimension(n)
+    index = np.arange(2**n)
+    vertices = (((index[:, np.newaxis] >> np.arange(n)) & 1) * 2 - 1).astype(float)
+    vertices.flags.writeable = False
+    return vertices
+
+
+@lru_cache(maxsize=None)
+def hypercube_edges(n):
+    """Rusuk hypercube N dimensi dengan membalik satu bit, O(N * 2^N).
+
+    Mengembalikan ``(edges, axes)``: ``edges`` berbentuk (N * 2^(N-1), 2) berisi
+    pasangan indeks titik, dan ``axes`` berisi sumbu yang dilalui tiap rusuk.
+    """
+    _check_dimension(n)
+    index = np.arange(2**n)
+    starts, ends, axes = [], [], []
+    for k in range(n):
+        # Titik dengan bit k = 0 terhubung ke pasangannya dengan bit k = 1
+        lower = index[((index >> k) & 1) == 0]
+        starts.append(lower)
+        ends.append(lower | (1 << k))
+        axes.append(np.full(len(lower), k))
+    edges = np.column_stack([np.concatenate(starts), np.concatenate(ends)])
+    axes = np.concatenate(axes)
+    edges.flags.writeable = False
+    axes.flags.writeable = False
+    return edges, axes
+
+
+@lru_cache(maxsize=None)
+def hypercube_edge_path(n):
+    """Urutan indeks titik yang menelusuri setiap rusuk tepat sekali; -1 menandai putusnya garis.
+
+    Untuk N genap semua titik berderajat genap sehingga seluruh rusuk bisa
+    ditelusuri dalam satu lintasan Euler (E + 1 titik, bukan 2E). Untuk N ganjil
+    ditambahkan rusuk virtual sejajar sumbu X agar derajatnya genap; lintasan
+    diputus di setiap rusuk virtual. Dipakai untuk mengecilkan payload gambar.
+    """
+    edges, _ = hypercube_edges(n)
+    pairs = [tuple(edge) for edge in edges.tolist()]
+    n_real = len(pairs)
+    if n % 2 == 1:
+        pairs += [(i, i | 1) for i in range(0, 2**n, 2)]
+
+    adjacency = [[] for _ in range(2**n)]
+    for edge_id, (u, v) in enumerate(pairs):
+        adjacency[u].append((v, edge_id))
+        adjacency[v].append((u, edge_id))
+
+    # Algoritma Hierholzer (iteratif): tumpukan berisi (titik, rusuk yang dilalui untuk tiba)
+    used = [False] * len(pairs)
+    stack = [(0, -1)]
+    circuit = []
+    while stack:
+        vertex, _ = stack[-1]
+        neighbours = adjacency[vertex]
+        while neighbours and used[neighbours[-1][1]]:
+            neighbours.pop()
+        if neighbours:
+            nxt, edge_id = neighbours.pop()
+            used[edge_id] = True
+            stack.append((nxt, edge_id))
+        else:
+            circuit.append(stack.pop())
+
+    path = [circuit[0][0]]
+    for (_, edge_id), (vertex, _) in zip(circuit, circuit[1:]):
+        if edge_id >= n_real:
+            path.append(-1)
+        path.append(vertex)
+    path = np.array(path)
+    path.flags.writeable = False
+    return path
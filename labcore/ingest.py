@@ -0,0 +1,216 @@
+import hashlib
+import io
+import os
+import tempfile
+import warnings
+from pathlib import Path
+
+import numpy as np
+
+# File unggahan disalin sekali ke disk (nama = hash isi) agar bisa di-memory-map;
+# file yang paling lama tidak dipakai dihapus bila total isinya melewati batas
+CACHE_DIR = Path(tempfile.gettempdir()) / "lab_transformasi_geometri"
+SPOOL_MAX_BYTES = int(float(os.environ.get("UPLOAD_SPOOL_MAX_MB", 512)) * 1024 * 1024)
+
+# Format biner sederhana: pasangan (x, y) little-endian tanpa header
+BINARY_DTYPES = {".f64": "<f8", ".bin": "<f8", ".f32": "<f4"}
+UPLOAD_TYPES = ["csv", "txt", "npy", "f64", "bin", "f32"]
+
+MAX_REPORTED_ERRORS = 10
+
+
+class CoordinateParseError(ValueError):
+    """Kesalahan format koordinat beserta daftar lokasi (baris, kolom) yang salah."""
+
+    def __init__(self, errors):
+        self.errors = errors
+        summary = "; ".join(f"baris {line}, kolom {column}: {message}" for line, column, message in errors)
+        super().__init__(summary)
+
+
+def content_hash(data):
+    """Hash isi file/teks sebagai kunci cache."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha1(data).hexdigest()
+
+
+def _diagnose(lines, delimiter=","):
+    """Cari baris dan kolom (posisi karakter, mulai dari 1) yang tidak bisa dibaca.
+
+    Hanya dipanggil bila pembacaan cepat gagal, jadi boleh berupa loop Python.
+    """
+    errors = []
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        tokens = line.split(delimiter)
+        if len(tokens) != 2:
+            errors.append((line_number, 1, f"harus berisi 2 nilai (x{delimiter}y), ditemukan {len(tokens)}"))
+        else:
+            column = 1
+            for token in tokens:
+                try:
+                    float(token)
+                except ValueError:
+                    offset = len(token) - len(token.lstrip())
+                    errors.append((line_number, column + offset, f"'{token.strip()}' bukan angka"))
+                column += len(token) + len(delimiter)
+        if len(errors) >= MAX_REPORTED_ERRORS:
+            break
+    return errors
+
+
+def _parse_rows(text, delimiter=",", skip_header=False):
+    """Baca baris-baris "x,y" dengan parser NumPy (C) sekaligus; hasil (N, 2)."""
+    lines = text.splitlines()
+    if skip_header:
+        lines = lines[1:]
+    try:
+        # Input kosong ditangani pemanggil; peringatan "input contained no data" tidak perlu bocor
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            points = np.loadtxt(io.StringIO("\n".join(lines)), delimiter=delimiter, ndmin=2, comments="#")
+    except ValueError:
+        errors = _diagnose(lines, delimiter)
+        raise CoordinateParseError(errors or [(1, 1, "format tidak dikenali")]) from None
+    if points.size == 0:
+        return np.empty((0, 2))
+    if points.shape[1] != 2:
+        raise CoordinateParseError(_diagnose(lines, delimiter))
+    return points
+
+
+def parse_text(text):
+    """Parse input teks "x1,y1; x2,y2; ..." (titik koma atau baris baru sebagai pemisah).
+
+    Nomor baris pada pesan kesalahan = urutan titik.
+    """
+    return _parse_rows(text.replace(";", "\n"))
+
+
+def _has_header(text):
+    first = text.lstrip().split("\n", 1)[0]
+    try:
+        [float(token) for token in first.split(",")]
+    except ValueError:
+        return True
+    return False
+
+
+def parse_csv(data):
+    """Parse CSV dua kolom (x, y), dengan baris header opsional."""
+    try:
+        text = data.decode("utf-8-sig")
+    except UnicodeDecodeError as exc:
+        line = data[:exc.start].count(b"\n") + 1
+        column = exc.start - (data.rfind(b"\n", 0, exc.start) + 1) + 1
+        raise CoordinateParseError([(line, column, "file bukan teks UTF-8")]) from None
+    skip_header = _has_header(text)
+    try:
+        return _parse_rows(text, skip_header=skip_header)
+    except CoordinateParseError as exc:
+        if skip_header:
+            # Nomor baris dilaporkan sesuai file asli (termasuk header)
+            raise CoordinateParseError([(line + 1, column, message) for line, column, message in exc.errors]) from None
+        raise
+
+
+def _spool(data, digest, suffix):
+    """Salin isi unggahan ke disk sekali (per hash isi) lalu kembalikan path-nya."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = CACHE_DIR / f"{digest}{suffix}"
+    if path.exists():
+        # Waktu modifikasi = waktu terakhir dipakai (urutan LRU untuk _prune_spool)
+        os.utime(path)
+    else:
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+        _prune_spool(keep=path)
+    return path
+
+
+def _prune_spool(keep, max_bytes=SPOOL_MAX_BYTES):
+    """Hapus file spool yang paling lama tidak dipakai sampai total ukurannya di bawah batas."""
+    files = []
+    for path in CACHE_DIR.iterdir():
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        files.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in files)
+    for _, size, path in sorted(files):
+        if total <= max_bytes:
+            break
+        if path == keep:
+            continue
+        try:
+            # Di Linux array yang masih memory-map tetap bisa dibaca setelah file dihapus
+            path.unlink()
+        except OSError:  # masih dipakai (Windows) atau sudah dihapus proses lain
+            continue
+        total -= size
+
+
+def _discard(path):
+    """Hapus file spool yang ternyata tidak valid."""
+    try:
+        path.unlink()
+    except OSError:
+        pass
+
+
+def _check_pairs(points, name):
+    if points.ndim != 2 or points.shape[1] != 2:
+        raise CoordinateParseError([(1, 1, f"{name} harus berisi array (N, 2), bukan {points.shape}")])
+    if points.dtype.kind not in "iuf":
+        raise CoordinateParseError([(1, 1, f"{name} harus berisi angka real, bukan tipe {points.dtype}")])
+    return points
+
+
+def load_npy(path):
+    """Muat file .npy berbentuk (N, 2) dengan memory-map (tidak dibaca seluruhnya ke RAM)."""
+    try:
+        points = np.load(path, mmap_mode="r", allow_pickle=False)
+    except (ValueError, EOFError) as exc:
+        # File rusak/terpotong, atau array objek (butuh pickle, yang tidak diizinkan)
+        raise CoordinateParseError([(1, 1, f"file NPY tidak bisa dibaca ({exc})")]) from None
+    if not isinstance(points, np.ndarray):
+        # Arsip .npz (zip) yang diberi nama .npy
+        points.close()
+        raise CoordinateParseError([(1, 1, "file NPY berisi arsip NPZ, bukan satu array")])
+    return _check_pairs(points, "File NPY")
+
+
+def load_binary(path, dtype="<f8"):
+    """Muat file biner berisi pasangan float (x, y) tanpa header dengan memory-map."""
+    itemsize = np.dtype(dtype).itemsize
+    size = path.stat().st_size
+    if size % (2 * itemsize) != 0:
+        raise CoordinateParseError([(1, 1, f"ukuran file {size} byte bukan kelipatan {2 * itemsize} (pasangan x, y)")])
+    if size == 0:
+        return np.empty((0, 2), dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r").reshape(-1, 2)
+
+
+def load_upload(file_name, data, digest=None):
+    """Muat titik dari isi file unggahan sesuai ekstensinya (CSV/TXT, NPY, atau biner)."""
+    suffix = Path(file_name).suffix.lower()
+    digest = digest or content_hash(data)
+    if suffix in (".csv", ".txt"):
+        return parse_csv(data)
+    if suffix == ".npy":
+        loader = load_npy
+    elif suffix in BINARY_DTYPES:
+        def loader(path):
+            return load_binary(path, BINARY_DTYPES[suffix])
+    else:
+        raise CoordinateParseError([(1, 1, f"ekstensi {suffix} tidak didukung")])
+    path = _spool(data, digest, suffix)
+    try:
+        return loader(path)
+    except CoordinateParseError:
+        _discard(path)
+        raise
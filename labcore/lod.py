@@ -0,0 +1,42 @@
+import numpy as np
+
+# Batas jumlah titik untuk label koordinat dan penanda titik
+LABEL_THRESHOLD = 50
+MARKER_THRESHOLD = 2000
+
+
+def symmetric_limit(*point_sets):
+    """Batas sumbu simetris (-L, L) yang memuat semua titik, dihitung tanpa menggabungkan array."""
+    max_abs = max(float(np.abs(points).max()) for points in point_sets if len(points))
+    return np.ceil(max_abs) + 1
+
+
+def decimate_to_pixels(points, xlim, ylim, resolution):
+    """Kurangi polyline sampai resolusi piksel: titik berurutan di piksel yang sama digabung.
+
+    Bentuk garis tetap sama persis pada layar (selisihnya < 1 piksel), tetapi
+    jumlah titik menjadi sebanding dengan panjang garis dalam piksel, bukan
+    jumlah titik asli. Titik pertama dan terakhir selalu dipertahankan.
+    """
+    points = np.asarray(points)
+    if len(points) <= 2:
+        return points
+    width, height = resolution
+    px = np.floor((points[:, 0] - xlim[0]) / (xlim[1] - xlim[0]) * width)
+    py = np.floor((points[:, 1] - ylim[0]) / (ylim[1] - ylim[0]) * height)
+    keep = np.empty(len(points), dtype=bool)
+    keep[0] = keep[-1] = True
+    keep[1:-1] = (px[1:-1] != px[:-2]) | (py[1:-1] != py[:-2])
+    return points[keep]
+
+
+def label_indices(points, xlim, ylim, threshold=LABEL_THRESHOLD):
+    """Indeks titik yang diberi label: semua bila sedikit, atau yang ada di area tampilan bila cukup sedikit."""
+    if len(points) <= threshold:
+        return np.arange(len(points))
+    inside = (
+        (points[:, 0] >= xlim[0]) & (points[:, 0] <= xlim[1])
+        & (points[:, 1] >= ylim[0]) & (points[:, 1] <= ylim[1])
+    )
+    indices = np.flatnonzero(inside)
+    return indices if len(indices) <= threshold else indices[:0]
@@ -0,0 +1,207 @@
+"""Pengukuran waktu per fase untuk setiap rerun aplikasi Streamlit.
+
+Aktifkan dengan environment variable ``LAB_PERF=1``. Setiap rerun menulis satu
+baris JSON (waktu per fase dalam ms dan ukuran payload dalam byte) ke file log
+yang dirotasi (``LAB_PERF_LOG``, default di folder temp). Bila tidak aktif,
+``start`` mengembalikan timer kosong sehingga biaya pengukuran hampir nol.
+
+Contoh:
+    timer = perf.start("plonterrr")
+    with timer.phase("compute"):
+        ...
+    timer.record_bytes("figure", lambda: len(png))
+    perf.show_panel(timer)
+    timer.finish()
+"""
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+ENABLED = os.environ.get("LAB_PERF", "").lower() in ("1", "true", "yes", "on")
+LOG_PATH = Path(os.environ.get("LAB_PERF_LOG", Path(tempfile.gettempdir()) / "lab_perf" / "perf.jsonl"))
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUPS = 3
+HISTORY = int(os.environ.get("LAB_PERF_HISTORY", 200))
+
+# Riwayat rerun terakhir per aplikasi (dibagi semua sesi dalam satu proses)
+_history = {}
+_lock = threading.Lock()
+_logger = None
+
+
+def _get_logger():
+    global _logger
+    with _lock:
+        if _logger is None:
+            LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+            handler = RotatingFileHandler(LOG_PATH, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS, encoding="utf-8")
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            logger = logging.getLogger("labcore.perf")
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+            logger.addHandler(handler)
+            _logger = logger
+    return _logger
+
+
+class _Phase:
+    __slots__ = ("timer", "name", "start")
+
+    def __init__(self, timer, name):
+        self.timer, self.name = timer, name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = (time.perf_counter() - self.start) * 1000
+        phases = self.timer.phases
+        phases[self.name] = phases.get(self.name, 0.0) + elapsed
+        return False
+
+
+class PhaseTimer:
+    """Timer untuk satu rerun: waktu per fase (ms, dijumlahkan bila fase berulang) dan payload."""
+
+    enabled = True
+
+    def __init__(self, app):
+        self.app = app
+        self.started = time.perf_counter()
+        self.phases = {}
+        self.payload = {}
+        self.overhead = 0.0
+        self.finished = False
+
+    def phase(self, name):
+        return _Phase(self, name)
+
+    def record_bytes(self, name, size):
+        """Catat ukuran payload; ``size`` boleh callable agar hanya dihitung saat aktif.
+
+        Waktu untuk menghitung ukuran (misalnya serialisasi ulang) tidak ikut total rerun.
+        """
+        if callable(size):
+            start = time.perf_counter()
+            size = size()
+            self.overhead += time.perf_counter() - start
+        self.payload[name] = self.payload.get(name, 0) + int(size)
+
+    def finish(self):
+        """Tutup rerun: simpan ke riwayat dan tulis satu baris ke log JSONL (sekali per rerun)."""
+        if self.finished:
+            return None
+        self.finished = True
+        record = {
+            "ts": time.time(),
+            "app": self.app,
+            "total_ms": (time.perf_counter() - self.started - self.overhead) * 1000,
+            "phases": self.phases,
+            "bytes": self.payload,
+        }
+        with _lock:
+            _history.setdefault(self.app, deque(maxlen=HISTORY)).append(record)
+        _get_logger().info(json.dumps(record))
+        return record
+
+
+class _NullTimer:
+    """Timer kosong saat pengukuran tidak aktif."""
+
+    enabled = False
+    _phase = nullcontext()
+
+    def phase(self, name):
+        return self._phase
+
+    def record_bytes(self, name, size):
+        pass
+
+    def finish(self):
+        return None
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def rss_bytes():
+    """Memori resident proses saat ini (byte), atau ``None`` bila tidak bisa dibaca.
+
+    Memakai /proc (Linux); di sistem lain jatuh ke puncak RSS dari ``resource``.
+    """
+    try:
+        with open("/proc/self/statm", "rb") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS melaporkan byte, Linux/BSD dalam KB
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def start(app, enabled=None):
+    """Mulai mengukur satu rerun aplikasi ``app``."""
+    if not (ENABLED if enabled is None else enabled):
+        return _NULL_TIMER
+    return PhaseTimer(app)
+
+
+def history(app):
+    with _lock:
+        return list(_history.get(app, ()))
+
+
+def summary(app):
+    """p50/p95 per fase (ms) dan payload (byte) dari rerun-rerun terakhir."""
+    # NumPy diimpor di sini agar ``rss_bytes`` bisa dipakai host multipage tanpa memuatnya
+    import numpy as np
+
+    records = history(app)
+    samples = {("total", "total"): [record["total_ms"] for record in records]}
+    for record in records:
+        for kind in ("phases", "bytes"):
+            for name, value in record[kind].items():
+                samples.setdefault((kind, name), []).append(value)
+    rows = {}
+    for key, values in samples.items():
+        if values:
+            p50, p95 = np.percentile(values, [50, 95])
+            rows[key] = {"count": len(values), "p50": float(p50), "p95": float(p95)}
+    return rows
+
+
+def show_panel(timer):
+    """Panel developer di sidebar: p50/p95 per fase dari rerun-rerun sebelumnya."""
+    if not timer.enabled:
+        return
+    import streamlit as st
+
+    with st.sidebar.expander("⏱️ Performa (Developer)"):
+        rows = summary(timer.app)
+        if not rows:
+            st.caption("Belum ada data; lakukan beberapa rerun.")
+            return
+        table = {"Jenis": [], "Fase": [], "Jumlah": [], "p50": [], "p95": []}
+        for (kind, name), stats in rows.items():
+            unit = "KB" if kind == "bytes" else "ms"
+            scale = 1 / 1024 if kind == "bytes" else 1
+            table["Jenis"].append({"total": "Total", "phases": "Waktu", "bytes": "Payload"}[kind])
+            table["Fase"].append(name)
+            table["Jumlah"].append(stats["count"])
+            table["p50"].append(f"{stats['p50'] * scale:,.1f} {unit}")
+            table["p95"].append(f"{stats['p95'] * scale:,.1f} {unit}")
+        st.dataframe(table, hide_index=True, use_container_width=True)
+        st.caption(f"Log JSONL: {LOG_PATH}")
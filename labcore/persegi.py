@@ -0,0 +1,168 @@
+"""Kernel luas persegi yang bisa dipakai tanpa Streamlit.
+
+Contoh CLI (dari akar repo):
+    python -m labcore.persegi sisi.csv --satuan cm --ke m -o luas.csv
+    echo "1 2.5 3" | python -m labcore.persegi -
+"""
+import argparse
+import io
+import re
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Panjang satu satuan dalam meter
+UNITS = {"mm": 0.001, "cm": 0.01, "m": 1.0, "km": 1000.0, "in": 0.0254, "ft": 0.3048, "satuan": 1.0}
+UPLOAD_TYPES = ["csv", "txt", "npy"]
+CHUNK_SIZE = 10_000
+MAX_REPORTED_ERRORS = 10
+
+
+class SideParseError(ValueError):
+    """Daftar sisi tidak bisa dibaca; ``errors`` berisi (nomor, teks) yang salah.
+
+    Kesalahan tingkat file (bukan per nilai) memakai ``errors`` kosong dan ``message``.
+    """
+
+    def __init__(self, errors, message=None):
+        self.errors = errors
+        super().__init__(message or "; ".join(f"nilai ke-{index}: '{token}' bukan angka" for index, token in errors))
+
+
+# --- Kernel ---
+
+def luas_persegi(sisi):
+    """Menghitung luas persegi: sisi * sisi (angka tunggal atau array NumPy)"""
+    luas = sisi * sisi
+    return luas
+
+
+def area_factor(unit_in="satuan", unit_out=None):
+    """Faktor pengali luas dari satuan sisi ke satuan luas keluaran (kuadrat rasio panjang)."""
+    unit_out = unit_out or unit_in
+    return (UNITS[unit_in] / UNITS[unit_out]) ** 2
+
+
+def invalid_sides(sides):
+    """Masker sisi yang tidak sah: negatif, NaN, atau tak hingga."""
+    return ~np.isfinite(sides) | (sides < 0)
+
+
+def luas_persegi_batch(sides, unit_in="satuan", unit_out=None):
+    """Luas semua persegi sekaligus; sisi tidak sah menghasilkan NaN.
+
+    Mengembalikan ``(luas, masker_tidak_sah)``.
+    """
+    sides = np.asarray(sides, dtype=float)
+    invalid = invalid_sides(sides)
+    areas = luas_persegi(sides) * area_factor(unit_in, unit_out)
+    areas[invalid] = np.nan
+    return areas, invalid
+
+
+def iter_luas_chunks(sides, unit_in="satuan", unit_out=None, chunk_size=CHUNK_SIZE):
+    """Hitung luas per potongan; menghasilkan ``(awal, sisi, luas, masker_tidak_sah)``."""
+    for start in range(0, len(sides), chunk_size):
+        chunk = np.asarray(sides[start:start + chunk_size], dtype=float)
+        areas, invalid = luas_persegi_batch(chunk, unit_in, unit_out)
+        yield start, chunk, areas, invalid
+
+
+# --- Input ---
+
+def parse_sides(text):
+    """Baca daftar sisi yang dipisah spasi, koma, titik koma, atau baris baru."""
+    tokens = [token for token in re.split(r"[\s,;]+", text.strip()) if token]
+    try:
+        return np.array(tokens, dtype=float)
+    except ValueError:
+        errors = []
+        for index, token in enumerate(tokens, start=1):
+            try:
+                float(token)
+            except ValueError:
+                errors.append((index, token))
+                if len(errors) >= MAX_REPORTED_ERRORS:
+                    break
+        raise SideParseError(errors) from None
+
+
+def parse_sides_csv(text):
+    """Kolom pertama file CSV/TXT sebagai daftar sisi (baris header opsional dilewati)."""
+    lines = [line for line in text.splitlines() if line.strip()]
+    column = [re.split(r"[,;\t]", line, maxsplit=1)[0] for line in lines]
+    if column:
+        try:
+            float(column[0])
+        except ValueError:
+            column = column[1:]
+    return parse_sides("\n".join(column))
+
+
+def load_sides(file_name, data):
+    """Muat daftar sisi dari isi file unggahan (CSV/TXT kolom pertama, atau NPY 1D)."""
+    if Path(file_name).suffix.lower() == ".npy":
+        try:
+            sides = np.load(io.BytesIO(data), allow_pickle=False)
+        except (ValueError, EOFError) as exc:
+            # File rusak/terpotong, atau array objek (butuh pickle, yang tidak diizinkan)
+            raise SideParseError([], f"file NPY tidak bisa dibaca ({exc})") from None
+        if not isinstance(sides, np.ndarray):
+            # Arsip .npz (zip) yang diberi nama .npy
+            sides.close()
+            raise SideParseError([], "file NPY berisi arsip NPZ, bukan satu array")
+        # (N, 1) masih dianggap satu kolom; tabel beberapa kolom tidak diratakan diam-diam
+        if sides.ndim > 2 or (sides.ndim == 2 and sides.shape[1] != 1):
+            raise SideParseError([], f"file NPY harus berisi array 1D (N,) atau (N, 1), bukan {sides.shape}")
+        if sides.dtype.kind not in "iuf":
+            raise SideParseError([], f"file NPY harus berisi angka real, bukan tipe {sides.dtype}")
+        return sides.astype(float).ravel()
+    try:
+        text = data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise SideParseError([], "file bukan teks UTF-8") from None
+    return parse_sides_csv(text)
+
+
+# --- CLI ---
+
+def write_csv(sides, output, unit_in="satuan", unit_out=None, chunk_size=CHUNK_SIZE):
+    """Tulis hasil (sisi, luas, status) ke file teks per potongan."""
+    output.write("sisi,luas,status\n")
+    for _, chunk, areas, invalid in iter_luas_chunks(sides, unit_in, unit_out, chunk_size):
+        lines = (
+            f"{side:.10g},,tidak sah\n" if bad else f"{side:.10g},{area:.10g},ok\n"
+            for side, area, bad in zip(chunk, areas, invalid)
+        )
+        output.writelines(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hitung luas banyak persegi dari daftar panjang sisi.")
+    parser.add_argument("input", help="File CSV/TXT/NPY berisi sisi, atau '-' untuk stdin")
+    parser.add_argument("--satuan", default="satuan", choices=UNITS, help="Satuan panjang sisi")
+    parser.add_argument("--ke", default=None, choices=UNITS, help="Satuan luas keluaran (default: sama)")
+    parser.add_argument("-o", "--output", default="-", help="File CSV keluaran (default: stdout)")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.input == "-":
+            sides = parse_sides(sys.stdin.read())
+        else:
+            sides = load_sides(args.input, Path(args.input).read_bytes())
+    except SideParseError as exc:
+        parser.exit(1, f"Kesalahan: {exc}\n")
+    except OSError as exc:
+        parser.error(f"tidak bisa membaca {args.input}: {exc.strerror}")
+
+    if args.output == "-":
+        write_csv(sides, sys.stdout, args.satuan, args.ke)
+    else:
+        with open(args.output, "w", encoding="utf-8") as output:
+            write_csv(sides, output, args.satuan, args.ke)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,254 @@
+"""Graf tahap (parse → transform → layout → render) dengan komputasi ulang inkremental.
+
+Setiap tahap punya kunci yang diturunkan dari hash isi input dan kunci tahap
+sebelumnya. Setelah rerun, tahap yang kuncinya tidak berubah diambil dari
+cache (per sesi atau global, keduanya LRU terbatas); hanya tahap di hilir input
+yang berubah yang dihitung lagi. Tahap juga dihitung malas: tahap yang tidak
+dipakai pada rerun ini tidak dijalankan sama sekali.
+
+Contoh:
+    pipeline = Pipeline(session_cache("plonterrr"), global_cache("plonterrr"))
+
+    @pipeline.stage("transform", "points", "steps", scope="global")
+    def transform(points, steps):
+        return apply_chain(points, steps)
+
+    pipeline.feed(points=Keyed(points, digest), steps=steps)
+    transformed, _ = pipeline["transform"]
+"""
+import hashlib
+import os
+import sys
+import threading
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from .cache import LRUCache
+
+SCOPES = ("session", "global")
+SESSION_CACHE_MAX_MB = float(os.environ.get("SESSION_STAGE_CACHE_MAX_MB", 64))
+GLOBAL_CACHE_MAX_MB = float(os.environ.get("GLOBAL_STAGE_CACHE_MAX_MB", 256))
+
+# Cache global per aplikasi (dibagi semua sesi dalam satu proses)
+_global_caches = {}
+_global_lock = threading.Lock()
+
+
+class Keyed(namedtuple("Keyed", ["value", "key"])):
+    """Input dengan sidik jari yang sudah diketahui (misalnya hash file unggahan)."""
+
+
+def _update(hasher, value):
+    if isinstance(value, Keyed):
+        hasher.update(b"K" + str(value.key).encode())
+    elif isinstance(value, np.ndarray):
+        hasher.update(f"A{value.dtype.str}{value.shape}".encode())
+        hasher.update(np.ascontiguousarray(value).data)
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        hasher.update(b"B%d:" % len(value))
+        hasher.update(value)
+    elif isinstance(value, str):
+        hasher.update(b"S%d:" % len(value) + value.encode("utf-8"))
+    elif value is None or isinstance(value, (bool, int, float, complex, np.generic)):
+        hasher.update(f"N{type(value).__name__}:{value!r}".encode())
+    elif isinstance(value, (tuple, list)):
+        hasher.update(b"T%d(" % len(value))
+        for item in value:
+            _update(hasher, item)
+        hasher.update(b")")
+    elif isinstance(value, dict):
+        hasher.update(b"D%d{" % len(value))
+        for name in sorted(value, key=repr):
+            _update(hasher, name)
+            _update(hasher, value[name])
+        hasher.update(b"}")
+    else:
+        raise TypeError(f"tidak bisa membuat sidik jari untuk {type(value).__name__}; bungkus dengan Keyed(nilai, kunci)")
+
+
+def fingerprint(value):
+    """Hash isi sebuah input (array, teks, angka, atau tuple/list/dict darinya)."""
+    hasher = hashlib.sha1()
+    _update(hasher, value)
+    return hasher.hexdigest()
+
+
+def nbytes(value):
+    """Perkiraan ukuran hasil tahap dalam byte (array, DataFrame, bytes, tuple/list)."""
+    if isinstance(value, np.ndarray):
+        # Memory-map tidak menempati RAM proses
+        return 0 if isinstance(value, np.memmap) else value.nbytes
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(nbytes(item) for item in value)
+    if hasattr(value, "memory_usage"):  # DataFrame pandas
+        return int(value.memory_usage(index=True).sum())
+    return sys.getsizeof(value)
+
+
+class StageCache:
+    """Hasil tahap dalam LRU terbatas, plus hit/miss dan waktu hitung per tahap."""
+
+    def __init__(self, max_entries=64, max_bytes=64 * 1024 * 1024):
+        self.entries = LRUCache(max_entries=max_entries, max_bytes=max_bytes, sizeof=lambda entry: entry[1])
+        self._counts = {}  # tahap -> [hit, miss, total ms]
+        self._lock = threading.Lock()
+
+    def lookup(self, stage, key, compute, sizeof=nbytes):
+        sentinel = object()
+        entry = self.entries.get(key, sentinel)
+        if entry is not sentinel:
+            self._count(stage, hit=True)
+            return entry[0]
+        start = time.perf_counter()
+        value = compute()
+        elapsed = (time.perf_counter() - start) * 1000
+        self.entries.put(key, (value, sizeof(value)))
+        self._count(stage, hit=False, elapsed=elapsed)
+        return value
+
+    def _count(self, stage, hit, elapsed=0.0):
+        with self._lock:
+            counts = self._counts.setdefault(stage, [0, 0, 0.0])
+            counts[0 if hit else 1] += 1
+            counts[2] += elapsed
+
+    def stats(self):
+        with self._lock:
+            counts = {stage: list(values) for stage, values in self._counts.items()}
+        return {
+            stage: {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+                "compute_ms": total_ms,
+            }
+            for stage, (hits, misses, total_ms) in counts.items()
+        }
+
+
+def _code_digest(code, hasher=None):
+    """Hash bytecode fungsi beserta konstanta dan fungsi bersarangnya (tanpa alamat memori)."""
+    hasher = hasher or hashlib.sha1()
+    hasher.update(code.co_code)
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            _code_digest(const, hasher)
+        else:
+            hasher.update(repr(const).encode())
+    return hasher.hexdigest()
+
+
+def global_cache(app, max_entries=256, max_mb=GLOBAL_CACHE_MAX_MB):
+    """Cache tahap global milik aplikasi ``app``."""
+    with _global_lock:
+        if app not in _global_caches:
+            _global_caches[app] = StageCache(max_entries, int(max_mb * 1024 * 1024))
+        return _global_caches[app]
+
+
+def session_cache(app, max_entries=32, max_mb=SESSION_CACHE_MAX_MB):
+    """Cache tahap milik sesi Streamlit saat ini (dipisah per aplikasi di host multipage)."""
+    import streamlit as st
+
+    name = f"stage_cache_{app}"
+    if name not in st.session_state:
+        st.session_state[name] = StageCache(max_entries, int(max_mb * 1024 * 1024))
+    return st.session_state[name]
+
+
+_Stage = namedtuple("_Stage", ["name", "func", "deps", "scope", "sizeof", "code"])
+
+
+class Pipeline:
+    """Graf tahap untuk satu rerun. Dibuat ulang setiap rerun (murah); cache-nya yang bertahan."""
+
+    def __init__(self, session_cache, global_cache):
+        self.caches = {"session": session_cache, "global": global_cache}
+        self._stages = {}
+        self._inputs = {}
+        self._keys = {}
+        self._values = {}
+
+    def stage(self, name, *deps, scope="session", sizeof=nbytes):
+        """Daftarkan tahap ``name`` yang bergantung pada input atau tahap ``deps``.
+
+        ``scope="global"`` untuk hasil yang boleh dibagi semua sesi (fungsi murni),
+        ``"session"`` untuk hasil milik satu sesi (misalnya figure atau halaman tabel).
+        """
+        if scope not in SCOPES:
+            raise ValueError(f"scope harus salah satu dari {SCOPES}, bukan {scope!r}")
+
+        def register(func):
+            # Kode fungsi ikut kunci agar hasil lama tidak dipakai setelah fungsi diubah
+            self._stages[name] = _Stage(name, func, deps, scope, sizeof, _code_digest(func.__code__))
+            return func
+        return register
+
+    def feed(self, **inputs):
+        """Isi (atau ganti) nilai input; kunci tahap di hilirnya dihitung ulang saat diminta."""
+        self._inputs.update(inputs)
+        for name in (*inputs, *self._stages):
+            self._keys.pop(name, None)
+
+    def key(self, name):
+        """Kunci isi input atau tahap ``name`` (tanpa menjalankan tahap apa pun)."""
+        if name not in self._keys:
+            if name in self._stages:
+                stage = self._stages[name]
+                self._keys[name] = fingerprint((name, stage.code) + tuple(self.key(dep) for dep in stage.deps))
+            elif name in self._inputs:
+                self._keys[name] = fingerprint(self._inputs[name])
+            else:
+                raise KeyError(f"input atau tahap {name!r} belum ada")
+        return self._keys[name]
+
+    def __getitem__(self, name):
+        """Hasil tahap (dari cache bila kuncinya sudah pernah dihitung) atau nilai input."""
+        if name not in self._stages:
+            value = self._inputs[name]
+            return value.value if isinstance(value, Keyed) else value
+        key = self.key(name)
+        if key not in self._values:
+            stage = self._stages[name]
+            self._values[key] = self.caches[stage.scope].lookup(
+                name, key, lambda: stage.func(*(self[dep] for dep in stage.deps)), stage.sizeof
+            )
+        return self._values[key]
+
+    def stats(self):
+        """Hit/miss per tahap (sesi ini untuk tahap sesi, seluruh proses untuk tahap global)."""
+        rows = {}
+        for stage in self._stages.values():
+            stats = self.caches[stage.scope].stats().get(stage.name)
+            if stats is not None:
+                rows[stage.name] = {"scope": stage.scope, **stats}
+        return rows
+
+    def show_panel(self, label="🧩 Statistik Tahap"):
+        """Panel sidebar berisi rasio hit per tahap, untuk menyetel ukuran cache."""
+        import streamlit as st
+
+        with st.sidebar.expander(label):
+            rows = self.stats()
+            if not rows:
+                st.caption("Belum ada tahap yang dijalankan.")
+                return
+            st.dataframe({
+                "Tahap": list(rows),
+                "Cakupan": [{"session": "Sesi", "global": "Global"}[row["scope"]] for row in rows.values()],
+                "Hit": [row["hits"] for row in rows.values()],
+                "Miss": [row["misses"] for row in rows.values()],
+                "Rasio Hit": [f"{row['hit_rate']:.0%}" for row in rows.values()],
+                "Waktu Hitung": [f"{row['compute_ms']:,.1f} ms" for row in rows.values()],
+            }, hide_index=True, use_container_width=True)
+            for scope, cache in self.caches.items():
+                entries = cache.entries.stats()
+                st.caption(
+                    f"Cache {'sesi' if scope == 'session' else 'global'}: {entries['entries']}/{entries['max_entries']} entri, "
+                    f"{entries['bytes'] / 1024 ** 2:,.1f}/{entries['max_bytes'] / 1024 ** 2:,.0f} MB, "
+                    f"dibuang {entries['evictions']}"
+                )
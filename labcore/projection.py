@@ -0,0 +1,82 @@
+from functools import lru_cache
+from itertools import combinations
+
+import numpy as np
+
+# Nama sumbu: X, Y, Z, lalu W dan seterusnya untuk dimensi yang lebih tinggi
+AXIS_NAMES = "XYZWVUTSRQ"
+
+
+def rotation_planes(n):
+    """Semua C(N, 2) bidang rotasi (i, j) dengan i < j untuk ruang N dimensi."""
+    return list(combinations(range(n), 2))
+
+
+def plane_name(plane):
+    """Nama bidang rotasi, misalnya (0, 3) -> "XW"."""
+    i, j = plane
+    return AXIS_NAMES[i] + AXIS_NAMES[j]
+
+
+@lru_cache(maxsize=1024)
+def rotation_matrix(n, plane_angles):
+    """Matriks rotasi N x N gabungan dari beberapa rotasi bidang.
+
+    ``plane_angles`` adalah tuple ``((i, j), sudut_derajat)`` dan diterapkan dengan
+    urutan yang sama seperti R_xy @ R_xz @ R_yz pada rotasi 4D lama. Hasil di-cache
+    per tuple sudut dan dibuat read-only.
+    """
+    matrix = np.eye(n)
+    for (i, j), angle in plane_angles:
+        if angle % 360 == 0:
+            continue
+        theta = np.radians(angle)
+        cos, sin = np.cos(theta), np.sin(theta)
+        # Mengalikan dari kanan hanya mengubah kolom i dan j
+        col_i, col_j = matrix[:, i].copy(), matrix[:, j].copy()
+        matrix[:, i] = col_i * cos + col_j * sin
+        matrix[:, j] = col_j * cos - col_i * sin
+    matrix.flags.writeable = False
+    return matrix
+
+
+def rotate_points(points, plane_angles):
+    """Rotasi titik (M, N) dengan satu perkalian matriks gabungan."""
+    points = np.asarray(points, dtype=float)
+    return points @ rotation_matrix(points.shape[-1], tuple(plane_angles)).T
+
+
+def perspective_project(points, w_factor=0.5, target_dim=3):
+    """Proyeksi perspektif bertahap N -> N-1 -> ... -> ``target_dim`` untuk array (..., N).
+
+    Tiap langkah membagi koordinat lain dengan (w_factor - koordinat terakhir).
+    Titik dengan pembagi nol dibiarkan tanpa skala, sama seperti proyeksi 4D lama,
+    tetapi ditangani dengan masking array alih-alih percabangan per titik.
+    """
+    points = np.asarray(points, dtype=float)
+    for k in range(points.shape[-1] - 1, target_dim - 1, -1):
+        divisor = w_factor - points[..., k]
+        scale = 1.0 / np.where(divisor == 0, 1.0, divisor)
+        points = points[..., :k] * scale[..., np.newaxis]
+    return points
+
+
+def rotation_matrices(n, planes, angles, base=None):
+    """Tumpukan matriks rotasi (F, N, N) untuk F set sudut sekaligus.
+
+    ``angles`` berbentuk (F, P) dalam derajat untuk P bidang di ``planes``. Bila
+    ``base`` (matriks N x N) diberikan, rotasi bidang dikalikan dari kanan padanya,
+    seperti pada ``rotation_matrix``. Loop hanya atas bidang; semua frame dihitung
+    dalam satu operasi array.
+    """
+    angles = np.radians(np.asarray(angles, dtype=float))
+    n_frames = angles.shape[0]
+    start = np.eye(n) if base is None else np.asarray(base, dtype=float)
+    matrices = np.repeat(start[np.newaxis], n_frames, axis=0)
+    for p, (i, j) in enumerate(planes):
+        cos = np.cos(angles[:, p])[:, np.newaxis]
+        sin = np.sin(angles[:, p])[:, np.newaxis]
+        col_i, col_j = matrices[:, :, i].copy(), matrices[:, :, j].copy()
+        matrices[:, :, i] = col_i * cos + col_j * sin
+        matrices[:, :, j] = col_j * cos - col_i * sin
+    return matrices
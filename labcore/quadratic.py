@@ -0,0 +1,320 @@
+"""Logika fungsi kuadrat yang dipakai bersama oleh mode server dan mode klien.
+
+Setiap fungsi Python di sini punya padanan ekspresi Vega di ``vega_lite_spec``
+sehingga titik puncak dan rentang sumbu Y di browser sama persis dengan yang
+dihitung di server.
+"""
+
+import numpy as np
+
+X_MIN = -10.0
+X_MAX = 10.0
+Y_BUFFER_MIN = 1.0
+Y_BUFFER_RATIO = 0.1
+
+
+def vertex(a, b, c):
+    """Titik puncak (x, y). Untuk a = 0 (fungsi linear) dipakai titik (0, c)."""
+    if a != 0:
+        x_puncak = -b / (2 * a)
+        return x_puncak, a * x_puncak**2 + b * x_puncak + c
+    return 0.0, c
+
+
+def y_axis_limits(a, b, c, x_min=X_MIN, x_max=X_MAX):
+    """Batas sumbu Y adaptif: nilai ekstrem f(x) pada [x_min, x_max] ditambah buffer.
+
+    Ekstrem dihitung secara analitik (ujung interval dan titik puncak bila ada di
+    dalam interval), jadi tidak bergantung pada jumlah titik sampel kurva.
+    """
+    candidates = [a * x_min**2 + b * x_min + c, a * x_max**2 + b * x_max + c]
+    if a != 0:
+        x_puncak, y_puncak = vertex(a, b, c)
+        if x_min <= x_puncak <= x_max:
+            candidates.append(y_puncak)
+    y_min, y_max = min(candidates), max(candidates)
+    y_buffer = max(Y_BUFFER_MIN, (y_max - y_min) * Y_BUFFER_RATIO)
+    return y_min - y_buffer, y_max + y_buffer
+
+
+def compute_metrics(a, b, c, n_samples=400):
+    """Hitung titik puncak, kurva, dan batas sumbu Y grafik."""
+    # Titik puncak dan batas sumbu Y memakai logika yang sama dengan mode klien
+    x_puncak, y_puncak = vertex(a, b, c)
+    ax_min_y, ax_max_y = y_axis_limits(a, b, c)
+
+    # Rentang X untuk Plot
+    x_plot = np.linspace(X_MIN, X_MAX, n_samples)
+    y_plot = a * x_plot**2 + b * x_plot + c
+
+    return {
+        "x_puncak": float(x_puncak),
+        "y_puncak": float(y_puncak),
+        "ax_min_y": float(ax_min_y),
+        "ax_max_y": float(ax_max_y),
+    }, x_plot, y_plot
+
+
+# Padanan ekspresi Vega untuk ``vertex`` dan ``y_axis_limits`` (nama parameter: a, b, c)
+_VEGA_F = "(a * {x} * {x} + b * {x} + c)"
+_VEGA_PARAMS = [
+    {"name": "xv", "expr": "a != 0 ? -b / (2 * a) : 0"},
+    {"name": "yv", "expr": "a != 0 ? a * xv * xv + b * xv + c : c"},
+    {"name": "f_lo", "expr": _VEGA_F.format(x=f"({X_MIN})")},
+    {"name": "f_hi", "expr": _VEGA_F.format(x=f"({X_MAX})")},
+    {"name": "vertex_inside", "expr": f"a != 0 && xv >= {X_MIN} && xv <= {X_MAX}"},
+    {"name": "y_lo", "expr": "vertex_inside ? min(f_lo, f_hi, yv) : min(f_lo, f_hi)"},
+    {"name": "y_hi", "expr": "vertex_inside ? max(f_lo, f_hi, yv) : max(f_lo, f_hi)"},
+    {"name": "y_buffer", "expr": f"max({Y_BUFFER_MIN}, (y_hi - y_lo) * {Y_BUFFER_RATIO})"},
+]
+
+
+def vega_lite_spec(a, b, c, a_range=(-5.0, 5.0, 0.1), bc_range=(-10.0, 10.0, 0.5), x_step=0.05):
+    """Spesifikasi Vega-Lite: kurva, titik puncak, dan titik potong Y dihitung di browser.
+
+    Slider a, b, c terikat ke parameter Vega sehingga menggeser slider tidak
+    memicu rerun Streamlit sama sekali.
+    """
+    def slider(name, value, lo, hi, step):
+        return {
+            "name": name,
+            "value": value,
+            "bind": {"input": "range", "min": lo, "max": hi, "step": step, "name": f"Koefisien {name} "},
+        }
+
+    point_data = {"values": [{}]}
+    y_scale = {"domainMin": {"expr": "y_lo - y_buffer"}, "domainMax": {"expr": "y_hi + y_buffer"}, "nice": False}
+    x_scale = {"domain": [X_MIN, X_MAX], "nice": False}
+
+    def point_layer(x_expr, y_expr, color, label):
+        return {
+            "data": point_data,
+            "transform": [
+                {"calculate": x_expr, "as": "x"},
+                {"calculate": y_expr, "as": "y"},
+                {"calculate": f"'{label}'", "as": "titik"},
+            ],
+            "mark": {"type": "point", "filled": True, "size": 90, "color": color, "clip": True},
+            "encoding": {
+                "x": {"field": "x", "type": "quantitative", "scale": x_scale},
+                "y": {"field": "y", "type": "quantitative", "scale": y_scale},
+                "tooltip": [
+                    {"field": "titik", "type": "nominal", "title": "Titik"},
+                    {"field": "x", "type": "quantitative", "format": ".2f"},
+                    {"field": "y", "type": "quantitative", "format": ".2f"},
+                ],
+            },
+        }
+
+    return {
+        "title": "Grafik Parabola (dihitung di browser)",
+        "height": 450,
+        "params": [
+            slider("a", a, *a_range),
+            slider("b", b, *bc_range),
+            slider("c", c, *bc_range),
+            *_VEGA_PARAMS,
+        ],
+        "layer": [
+            {
+                "data": {"sequence": {"start": X_MIN, "stop": X_MAX + x_step / 2, "step": x_step, "as": "x"}},
+                "transform": [{"calculate": _VEGA_F.format(x="datum.x"), "as": "y"}],
+                "mark": {"type": "line", "color": "orange", "strokeWidth": 3, "clip": True},
+                "encoding": {
+                    "x": {"field": "x", "type": "quantitative", "scale": x_scale, "title": "Sumbu X"},
+                    "y": {"field": "y", "type": "quantitative", "scale": y_scale, "title": "Sumbu Y / f(x)"},
+                },
+            },
+            {
+                "data": point_data,
+                "mark": {"type": "rule", "color": "gray", "strokeDash": [4, 4]},
+                "encoding": {"y": {"datum": 0, "type": "quantitative", "scale": y_scale}},
+            },
+            {
+                "data": point_data,
+                "mark": {"type": "rule", "color": "gray", "strokeDash": [4, 4]},
+                "encoding": {"x": {"datum": 0, "type": "quantitative", "scale": x_scale}},
+            },
+            point_layer("xv", "yv", "red", "Titik Puncak"),
+            point_layer("0", "c", "blue", "Titik Potong Y"),
+        ],
+    }
+
+
+# --- Evaluasi Keluarga Kurva (batch) ---
+
+def as_coefficients(coeffs):
+    """Ubah masukan menjadi array koefisien float berbentuk (K, 3)."""
+    coeffs = np.asarray(coeffs, dtype=float)
+    if coeffs.ndim == 1:
+        coeffs = coeffs[np.newaxis, :]
+    if coeffs.ndim != 2 or coeffs.shape[1] != 3:
+        raise ValueError(f"Koefisien harus berbentuk (K, 3), bukan {coeffs.shape}.")
+    return coeffs
+
+
+def vertices(coeffs):
+    """Titik puncak untuk K kurva sekaligus, hasil (K, 2). Sama dengan ``vertex``."""
+    a, b, c = as_coefficients(coeffs).T
+    nonzero = a != 0
+    safe_a = np.where(nonzero, a, 1.0)
+    x_puncak = np.where(nonzero, -b / (2 * safe_a), 0.0)
+    y_puncak = np.where(nonzero, a * x_puncak**2 + b * x_puncak + c, c)
+    return np.column_stack([x_puncak, y_puncak])
+
+
+def real_roots(coeffs):
+    """Akar real terurut untuk K kurva, hasil (K, 2); NaN bila akar tidak ada.
+
+    Fungsi linear (a = 0, b != 0) punya satu akar yang diisi di kolom pertama.
+    """
+    a, b, c = as_coefficients(coeffs).T
+    roots = np.full((len(a), 2), np.nan)
+    quadratic = a != 0
+    disc = b**2 - 4 * a * c
+    has_roots = quadratic & (disc >= 0)
+    sqrt_disc = np.sqrt(np.where(has_roots, disc, 0.0))
+    denom = np.where(has_roots, 2 * a, 1.0)
+    roots[has_roots, 0] = ((-b - sqrt_disc) / denom)[has_roots]
+    roots[has_roots, 1] = ((-b + sqrt_disc) / denom)[has_roots]
+    roots.sort(axis=1)
+    linear = ~quadratic & (b != 0)
+    roots[linear, 0] = -c[linear] / b[linear]
+    return roots
+
+
+def curve_extremes(coeffs, x_min=X_MIN, x_max=X_MAX):
+    """Nilai minimum dan maksimum tiap kurva pada [x_min, x_max], hasil (K, 2).
+
+    Versi vektor dari aturan di ``y_axis_limits`` (tanpa buffer).
+    """
+    coeffs = as_coefficients(coeffs)
+    a, b, c = coeffs.T
+    f_lo = a * x_min**2 + b * x_min + c
+    f_hi = a * x_max**2 + b * x_max + c
+    x_puncak, y_puncak = vertices(coeffs).T
+    inside = (a != 0) & (x_puncak >= x_min) & (x_puncak <= x_max)
+    lo = np.minimum(f_lo, f_hi)
+    hi = np.maximum(f_lo, f_hi)
+    lo = np.where(inside, np.minimum(lo, y_puncak), lo)
+    hi = np.where(inside, np.maximum(hi, y_puncak), hi)
+    return np.column_stack([lo, hi])
+
+
+def adaptive_samples(coeffs, n_samples=400, x_min=X_MIN, x_max=X_MAX, focus_fraction=0.5, focus_width=0.08):
+    """Titik sampel x per kurva (K, N) yang dirapatkan di sekitar titik puncak dan akar.
+
+    Sebagian sampel tersebar merata, sisanya dikumpulkan di sekitar titik penting
+    dengan kerapatan tertinggi tepat di titik tersebut. Titik penting yang tidak
+    ada (misalnya akar imajiner) diganti dengan sampel merata.
+    """
+    coeffs = as_coefficients(coeffs)
+    k = len(coeffs)
+    features = np.column_stack([vertices(coeffs)[:, 0], real_roots(coeffs)])  # (K, 3)
+    n_per_feature = int(n_samples * focus_fraction) // features.shape[1]
+    n_uniform = n_samples - n_per_feature * features.shape[1]
+
+    # Pola offset simetris yang makin rapat di tengah (u * |u|)
+    u = np.linspace(-1.0, 1.0, n_per_feature)
+    offsets = u * np.abs(u) * focus_width * (x_max - x_min)
+
+    focus = features[:, :, np.newaxis] + offsets  # (K, 3, n_per_feature)
+    spare = np.linspace(x_min, x_max, n_per_feature + 2)[1:-1]
+    missing = ~np.isfinite(features) | (features < x_min) | (features > x_max)
+    focus = np.where(missing[:, :, np.newaxis], spare, focus).reshape(k, -1)
+
+    uniform = np.broadcast_to(np.linspace(x_min, x_max, n_uniform), (k, n_uniform))
+    x = np.clip(np.concatenate([uniform, focus], axis=1), x_min, x_max)
+    x.sort(axis=1)
+    return x
+
+
+def evaluate_family(coeffs, n_samples=400, adaptive=True, x_min=X_MIN, x_max=X_MAX):
+    """Evaluasi K parabola sekaligus dalam satu broadcast NumPy.
+
+    Mengembalikan dict berisi ``x`` dan ``y`` (K, N), ``vertices`` (K, 2) dan
+    ``y_limits`` (batas sumbu Y bersama untuk semua kurva, dengan buffer yang
+    sama seperti ``y_axis_limits``).
+    """
+    coeffs = as_coefficients(coeffs)
+    if adaptive:
+        x = adaptive_samples(coeffs, n_samples, x_min, x_max)
+    else:
+        x = np.broadcast_to(np.linspace(x_min, x_max, n_samples), (len(coeffs), n_samples))
+    a, b, c = (coeffs[:, i:i + 1] for i in range(3))
+    y = (a * x + b) * x + c
+
+    extremes = curve_extremes(coeffs, x_min, x_max)
+    y_min, y_max = extremes[:, 0].min(), extremes[:, 1].max()
+    y_buffer = max(Y_BUFFER_MIN, (y_max - y_min) * Y_BUFFER_RATIO)
+    return {
+        "x": x,
+        "y": y,
+        "vertices": vertices(coeffs),
+        "y_limits": (float(y_min - y_buffer), float(y_max + y_buffer)),
+    }
+
+
+# --- Sapuan Ruang Parameter ---
+
+SWEEP_QUANTITIES = ("root_count", "discriminant", "root_lo", "root_hi", "vertex_x", "vertex_y")
+SWEEP_LABELS = {
+    "root_count": "Jumlah akar real",
+    "discriminant": "Diskriminan (b² - 4ac)",
+    "root_lo": "Akar terkecil",
+    "root_hi": "Akar terbesar",
+    "vertex_x": "Posisi puncak x",
+    "vertex_y": "Posisi puncak y",
+}
+
+
+def sweep_slice(a, b_range=(-10.0, 10.0), c_range=(-10.0, 10.0), resolution=(1000, 1000), chunk_rows=128):
+    """Hitung diskriminan, jumlah akar, akar, dan titik puncak di grid bidang b-c untuk satu nilai a.
+
+    Grid berukuran (n_c, n_b): baris = nilai c, kolom = nilai b. Perhitungan
+    dilakukan per blok ``chunk_rows`` baris sehingga memori sementara tetap
+    O(chunk_rows * n_b) berapa pun ukuran grid. Hasil disimpan sebagai float32
+    (jumlah akar sebagai int8). Fungsi konstan (a = b = 0) dihitung punya 0 akar.
+    """
+    n_b, n_c = resolution
+    b_values = np.linspace(*b_range, n_b)
+    c_values = np.linspace(*c_range, n_c)
+    result = {name: np.empty((n_c, n_b), dtype=np.float32) for name in SWEEP_QUANTITIES if name != "root_count"}
+    result["root_count"] = np.empty((n_c, n_b), dtype=np.int8)
+
+    b = b_values[np.newaxis, :]
+    for start in range(0, n_c, chunk_rows):
+        rows = slice(start, min(start + chunk_rows, n_c))
+        c = c_values[rows, np.newaxis]
+        disc = b**2 - 4 * a * c
+        with np.errstate(invalid="ignore", divide="ignore"):
+            if a != 0:
+                sqrt_disc = np.sqrt(np.where(disc >= 0, disc, np.nan))
+                r1 = (-b - sqrt_disc) / (2 * a)
+                r2 = (-b + sqrt_disc) / (2 * a)
+                root_lo, root_hi = np.fmin(r1, r2), np.fmax(r1, r2)
+                count = np.where(disc > 0, 2, np.where(disc == 0, 1, 0))
+                x_puncak = np.broadcast_to(-b / (2 * a), disc.shape)
+                y_puncak = c - b**2 / (4 * a)
+            else:
+                # Fungsi linear: satu akar bila b != 0
+                root_lo = np.where(b != 0, -c / b, np.nan)
+                root_hi = root_lo
+                count = np.broadcast_to(np.where(b != 0, 1, 0), disc.shape)
+                x_puncak = np.zeros_like(disc)
+                y_puncak = np.broadcast_to(c, disc.shape)
+        result["discriminant"][rows] = disc
+        result["root_count"][rows] = count
+        result["root_lo"][rows] = root_lo
+        result["root_hi"][rows] = root_hi
+        result["vertex_x"][rows] = x_puncak
+        result["vertex_y"][rows] = y_puncak
+
+    result["b"] = b_values
+    result["c"] = c_values
+    return result
+
+
+def sweep_nbytes(result):
+    """Total ukuran array hasil ``sweep_slice`` dalam byte."""
+    return sum(value.nbytes for value in result.values())
@@ -0,0 +1,151 @@
+import io
+
+import numpy as np
+
+from .ingest import CoordinateParseError
+
+IMAGE_TYPES = ["png", "jpg", "jpeg", "bmp", "gif", "webp"]
+RESAMPLING_METHODS = ("Bilinear", "Nearest")
+
+# Batas memori kerja per tile dan ukuran maksimum gambar hasil
+MEMORY_BUDGET = 32 * 1024 * 1024
+MAX_OUTPUT_PIXELS = 8_000_000
+
+
+def load_image(data):
+    """Decode file gambar (PNG/JPG/...) dengan Pillow menjadi array RGBA uint8 (H, W, 4)."""
+    from PIL import Image, UnidentifiedImageError
+
+    # Gambar rusak/bukan gambar dilaporkan lewat jalur galat parsing yang sama seperti file koordinat
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            return np.asarray(image.convert("RGBA"))
+    except UnidentifiedImageError:
+        raise CoordinateParseError([(1, 1, "file gambar rusak atau formatnya tidak didukung")]) from None
+    except Image.DecompressionBombError:
+        raise CoordinateParseError([(1, 1, "resolusi gambar terlalu besar")]) from None
+    except OSError as exc:
+        raise CoordinateParseError([(1, 1, f"file gambar tidak bisa dibaca ({exc})")]) from None
+
+
+def image_extent(shape, size=5.0):
+    """Letak gambar pada bidang kartesius: (xmin, xmax, ymin, ymax), sisi terpanjang = size."""
+    height, width = shape[:2]
+    scale = size / max(height, width)
+    return (0.0, width * scale, 0.0, height * scale)
+
+
+def image_corners(extent):
+    """Empat titik sudut gambar (berlawanan arah jarum jam dari kiri bawah)."""
+    xmin, xmax, ymin, ymax = extent
+    return np.array([[xmin, ymin], [xmax, ymin], [xmax, ymax], [xmin, ymax]])
+
+
+def transformed_extent(matrix, extent):
+    """Kotak pembatas gambar setelah ditransformasi matriks homogen 3x3."""
+    corners = image_corners(extent) @ matrix[:2, :2].T + matrix[:2, 2]
+    (xmin, ymin), (xmax, ymax) = corners.min(axis=0), corners.max(axis=0)
+    return (xmin, xmax, ymin, ymax)
+
+
+def _pixel_to_world(extent, shape):
+    """Matriks dari indeks piksel (kolom, baris) ke koordinat (x, y); pusat piksel di +0.5."""
+    xmin, xmax, ymin, ymax = extent
+    height, width = shape[:2]
+    sx, sy = (xmax - xmin) / width, (ymax - ymin) / height
+    # Baris 0 ada di atas (y terbesar)
+    return np.array([[sx, 0.0, xmin + 0.5 * sx],
+                     [0.0, -sy, ymax - 0.5 * sy],
+                     [0.0, 0.0, 1.0]])
+
+
+def output_shape(source_shape, source_extent, extent, max_pixels=MAX_OUTPUT_PIXELS):
+    """Ukuran gambar hasil dengan kerapatan piksel sama seperti sumber (dibatasi max_pixels)."""
+    height, width = source_shape[:2]
+    density = width / (source_extent[1] - source_extent[0])
+    out_width = max(1.0, (extent[1] - extent[0]) * density)
+    out_height = max(1.0, (extent[3] - extent[2]) * density)
+    shrink = min(1.0, np.sqrt(max_pixels / (out_width * out_height)))
+    return max(1, int(round(out_height * shrink))), max(1, int(round(out_width * shrink)))
+
+
+def _tile_rows(width, channels, memory_budget):
+    # Perkiraan byte kerja per piksel: koordinat dan indeks (float64/intp) + array sementara float32 per kanal
+    bytes_per_pixel = 8 * 12 + 4 * 6 * channels
+    return max(1, memory_budget // (width * bytes_per_pixel))
+
+
+def _sample_nearest(image, col, row):
+    height, width = image.shape[:2]
+    c = np.floor(col + 0.5).astype(np.intp)
+    r = np.floor(row + 0.5).astype(np.intp)
+    inside = (c >= 0) & (c < width) & (r >= 0) & (r < height)
+    np.clip(c, 0, width - 1, out=c)
+    np.clip(r, 0, height - 1, out=r)
+    values = image.reshape(-1, image.shape[2]).take(r * width + c, axis=0)
+    return values, inside
+
+
+def _sample_bilinear(image, col, row):
+    height, width = image.shape[:2]
+    pixels = image.reshape(-1, image.shape[2])
+    c0, r0 = np.floor(col), np.floor(row)
+    fc = (col - c0).astype(np.float32)[..., np.newaxis]
+    fr = (row - r0).astype(np.float32)[..., np.newaxis]
+    c0, r0 = c0.astype(np.intp), r0.astype(np.intp)
+    # Setengah piksel di luar tepi masih dianggap di dalam (tepi disalin)
+    inside = (col >= -0.5) & (col <= width - 0.5) & (row >= -0.5) & (row <= height - 0.5)
+    c1, r1 = np.clip(c0 + 1, 0, width - 1), np.clip(r0 + 1, 0, height - 1) * width
+    np.clip(c0, 0, width - 1, out=c0)
+    r0 = np.clip(r0, 0, height - 1) * width
+    top = pixels.take(r0 + c0, axis=0).astype(np.float32)
+    top += (pixels.take(r0 + c1, axis=0) - top) * fc
+    bottom = pixels.take(r1 + c0, axis=0).astype(np.float32)
+    bottom += (pixels.take(r1 + c1, axis=0) - bottom) * fc
+    top += (bottom - top) * fr
+    return np.rint(top, out=top), inside
+
+
+def transform_image(image, matrix, source_extent, extent=None, shape=None, method="Bilinear",
+                    memory_budget=MEMORY_BUDGET):
+    """Transformasi gambar dengan pemetaan balik (inverse mapping) per tile.
+
+    Untuk setiap piksel hasil dihitung posisinya di gambar sumber lewat invers
+    matriks transformasi (matriks yang sama seperti untuk titik bangun datar),
+    lalu warnanya diambil dengan metode Nearest atau Bilinear. Piksel di luar
+    gambar sumber dibuat transparan. Tile dibatasi ``memory_budget`` byte.
+
+    Mengembalikan ``(gambar_hasil, extent_hasil)``.
+    """
+    image = np.asarray(image)
+    if image.ndim == 2:
+        image = image[..., np.newaxis]
+    if extent is None:
+        extent = transformed_extent(matrix, source_extent)
+    if shape is None:
+        shape = output_shape(image.shape, source_extent, extent)
+    height, width = shape
+    channels = image.shape[2]
+
+    # Indeks piksel hasil -> koordinat dunia -> (invers transformasi) -> indeks piksel sumber
+    to_source = (
+        np.linalg.inv(_pixel_to_world(source_extent, image.shape))
+        @ np.linalg.inv(matrix)
+        @ _pixel_to_world(extent, shape)
+    )
+    sample = _sample_nearest if method == "Nearest" else _sample_bilinear
+    output = np.zeros((height, width, channels), dtype=image.dtype)
+    cols = np.arange(width, dtype=np.float64)
+
+    tile_rows = _tile_rows(width, channels, memory_budget)
+    for start in range(0, height, tile_rows):
+        stop = min(start + tile_rows, height)
+        rows = np.arange(start, stop, dtype=np.float64)[:, np.newaxis]
+        src_col = to_source[0, 0] * cols + to_source[0, 1] * rows + to_source[0, 2]
+        src_row = to_source[1, 0] * cols + to_source[1, 1] * rows + to_source[1, 2]
+        values, inside = sample(image, src_col, src_row)
+        output[start:stop][inside] = values[inside]
+
+    if output.shape[2] == 1:
+        output = output[..., 0]
+    return output, extent
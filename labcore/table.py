@@ -0,0 +1,103 @@
+import io
+
+import numpy as np
+
+# Kolom tabel hasil: nomor titik, koordinat asli, dan koordinat hasil transformasi
+TABLE_COLUMNS = ("No", "x", "y", "x'", "y'")
+EXPORT_CHUNK_ROWS = 65_536
+
+
+def _column(original, transformed, name):
+    if name == "No":
+        return np.arange(1, len(original) + 1)
+    source = original if name in ("x", "y") else transformed
+    return source[:, 0 if name.startswith("x") else 1]
+
+
+def sort_order(original, transformed, column="No", descending=False):
+    """Urutan baris (indeks) untuk kolom yang dipilih; None berarti urutan asli."""
+    if column == "No":
+        return np.arange(len(original))[::-1] if descending else None
+    order = np.argsort(_column(original, transformed, column), kind="stable")
+    return order[::-1] if descending else order
+
+
+def page_frame(original, transformed, order=None, page=0, page_size=100):
+    """DataFrame numerik untuk satu halaman saja; tabel penuh tidak pernah dibentuk."""
+    import pandas as pd
+
+    start = page * page_size
+    stop = min(start + page_size, len(original))
+    rows = np.arange(start, stop) if order is None else order[start:stop]
+    return pd.DataFrame({
+        "No": rows + 1,
+        "x": original[rows, 0],
+        "y": original[rows, 1],
+        "x'": transformed[rows, 0],
+        "y'": transformed[rows, 1],
+    })
+
+
+def page_count(n_rows, page_size):
+    return max(1, -(-n_rows // page_size))
+
+
+# --- Ekspor Bertahap ---
+
+def _export_schema():
+    import pyarrow as pa
+
+    return pa.schema([("No", pa.int64())] + [(name, pa.float64()) for name in TABLE_COLUMNS[1:]])
+
+
+def iter_batches(original, transformed, chunk_rows=EXPORT_CHUNK_ROWS):
+    """RecordBatch Arrow per potongan baris; kolom diambil langsung dari array titik."""
+    import pyarrow as pa
+
+    schema = _export_schema()
+    for start in range(0, len(original), chunk_rows):
+        stop = min(start + chunk_rows, len(original))
+        columns = [pa.array(np.arange(start + 1, stop + 1, dtype=np.int64))]
+        for source in (original, transformed):
+            block = np.asarray(source[start:stop], dtype=np.float64)
+            columns += [pa.array(block[:, 0]), pa.array(block[:, 1])]
+        yield pa.RecordBatch.from_arrays(columns, schema=schema)
+
+
+def write_csv(original, transformed, sink, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Tulis CSV hasil transformasi ke ``sink`` (path atau file biner) per potongan.
+
+    Penulis CSV Arrow (C++) langsung mengalirkan tiap potongan ke ``sink``, jadi
+    memori puncak hanya satu potongan, bukan seluruh file.
+    """
+    import pyarrow.csv as pa_csv
+
+    with pa_csv.CSVWriter(sink, _export_schema()) as writer:
+        for batch in iter_batches(original, transformed, chunk_rows):
+            writer.write_batch(batch)
+
+
+def write_parquet(original, transformed, sink, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Tulis Parquet hasil transformasi ke ``sink`` (path atau file biner); satu row group per potongan."""
+    import pyarrow.parquet as pq
+
+    with pq.ParquetWriter(sink, _export_schema()) as writer:
+        for batch in iter_batches(original, transformed, chunk_rows):
+            writer.write_batch(batch)
+
+
+# ``st.download_button`` membutuhkan seluruh isi file di memori, jadi dua fungsi di
+# bawah dibuat saat tombol diklik tetapi tetap menampung seluruh file sebagai bytes
+
+def export_csv(original, transformed, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Bytes CSV hasil transformasi (seluruh file; lihat ``write_csv`` untuk ditulis bertahap)."""
+    buffer = io.BytesIO()
+    write_csv(original, transformed, buffer, chunk_rows)
+    return buffer.getvalue()
+
+
+def export_parquet(original, transformed, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Bytes Parquet hasil transformasi (seluruh file; lihat ``write_parquet`` untuk ditulis bertahap)."""
+    buffer = io.BytesIO()
+    write_parquet(original, transformed, buffer, chunk_rows)
+    return buffer.getvalue()
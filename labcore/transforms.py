@@ -0,0 +1,99 @@
+import numpy as np
+
+# --- Matriks Transformasi Homogen 3x3 ---
+
+REFLECTION_AXES = ("Sumbu X", "Sumbu Y", "Garis y=x", "Garis y=-x", "Garis y=mx+k")
+
+
+def translation_matrix(tx, ty):
+    """Matriks Translasi sejauh (tx, ty)."""
+    return np.array([[1.0, 0.0, tx],
+                     [0.0, 1.0, ty],
+                     [0.0, 0.0, 1.0]])
+
+
+def rotation_matrix(angle_deg, cx=0, cy=0):
+    """Matriks Rotasi sebesar angle_deg derajat terhadap pusat (cx, cy)."""
+    angle_rad = np.radians(angle_deg)
+    cos, sin = np.cos(angle_rad), np.sin(angle_rad)
+    # Geser ke pusat, putar, lalu geser kembali: T(c) @ R @ T(-c)
+    return np.array([[cos, -sin, cx - cos * cx + sin * cy],
+                     [sin,  cos, cy - sin * cx - cos * cy],
+                     [0.0,  0.0, 1.0]])
+
+
+def reflection_matrix(axis_choice, slope=0.0, intercept=0.0):
+    """Matriks Refleksi terhadap sumbu X, sumbu Y, garis y=x, y=-x, atau garis y = slope*x + intercept."""
+    if axis_choice == "Sumbu X":
+        return np.diag([1.0, -1.0, 1.0])
+    elif axis_choice == "Sumbu Y":
+        return np.diag([-1.0, 1.0, 1.0])
+    elif axis_choice == "Garis y=x":
+        return np.array([[0.0, 1.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 1.0]])
+    elif axis_choice == "Garis y=-x":
+        return np.array([[0.0, -1.0, 0.0], [-1.0, 0.0, 0.0], [0.0, 0.0, 1.0]])
+    elif axis_choice == "Garis y=mx+k":
+        # Cermin terhadap garis bersudut theta melalui (0, k): T(0, k) @ M(theta) @ T(0, -k)
+        theta = np.arctan(slope)
+        cos2, sin2 = np.cos(2 * theta), np.sin(2 * theta)
+        mirror = np.array([[cos2, sin2, 0.0], [sin2, -cos2, 0.0], [0.0, 0.0, 1.0]])
+        return translation_matrix(0, intercept) @ mirror @ translation_matrix(0, -intercept)
+    return np.eye(3)
+
+
+def dilation_matrix(scale_factor, cx=0, cy=0):
+    """Matriks Dilatasi dengan faktor skala terhadap pusat (cx, cy)."""
+    return np.array([[scale_factor, 0.0, cx * (1 - scale_factor)],
+                     [0.0, scale_factor, cy * (1 - scale_factor)],
+                     [0.0, 0.0, 1.0]])
+
+
+def transformation_matrix(transformation_type, params):
+    """Matriks untuk satu transformasi dengan parameter seperti pada ``apply_transformation``."""
+    if transformation_type == "Translasi":
+        tx, ty = params
+        return translation_matrix(tx, ty)
+    elif transformation_type == "Rotasi":
+        angle, cx, cy = params
+        return rotation_matrix(angle, cx, cy)
+    elif transformation_type == "Refleksi":
+        return reflection_matrix(*params)
+    elif transformation_type == "Dilatasi":
+        scale, cx, cy = params
+        return dilation_matrix(scale, cx, cy)
+    return np.eye(3)
+
+
+# --- Komposisi dan Penerapan ---
+
+def compose(steps):
+    """Gabungkan rantai transformasi [(jenis, params), ...] menjadi satu matriks.
+
+    Mengembalikan ``(matriks_total, matriks_kumulatif)`` dengan matriks_kumulatif[i]
+    adalah gabungan langkah pertama sampai langkah ke-i (untuk hasil antara).
+    """
+    total = np.eye(3)
+    cumulative = []
+    for transformation_type, params in steps:
+        total = transformation_matrix(transformation_type, params) @ total
+        cumulative.append(total)
+    return total, cumulative
+
+
+def apply_matrix(matrix, points):
+    """Terapkan matriks homogen 3x3 ke array titik (N, 2) dengan satu perkalian matriks."""
+    points = np.asarray(points, dtype=float)
+    return points @ matrix[:2, :2].T + matrix[:2, 2]
+
+
+def apply_transformation(shape_points, transformation_type, params):
+    """Menerapkan transformasi ke semua titik pada bangun."""
+    return apply_matrix(transformation_matrix(transformation_type, params), shape_points)
+
+
+def apply_chain(shape_points, steps):
+    """Terapkan rantai transformasi; hasil akhir beserta titik hasil tiap langkah."""
+    _, cumulative = compose(steps)
+    intermediate = [apply_matrix(matrix, shape_points) for matrix in cumulative]
+    final = intermediate[-1] if intermediate else np.asarray(shape_points, dtype=float)
+    return final, intermediate
@@ -0,0 +1,101 @@
+import numpy as np
+
+from .transforms import compose
+
+# Titik yang dianimasikan dibatasi agar ukuran frame yang dikirim ke browser tetap kecil
+MAX_TWEEN_POINTS = 2000
+
+# Garis cermin (titik pada garis, vektor normal) untuk refleksi bawaan
+_MIRROR_LINES = {
+    "Sumbu X": ((0.0, 0.0), (0.0, 1.0)),
+    "Sumbu Y": ((0.0, 0.0), (1.0, 0.0)),
+    "Garis y=x": ((0.0, 0.0), (-1.0, 1.0)),
+    "Garis y=-x": ((0.0, 0.0), (1.0, 1.0)),
+}
+
+
+def _batch(count):
+    matrices = np.zeros((count, 3, 3))
+    matrices[:, 2, 2] = 1.0
+    return matrices
+
+
+def _mirror_line(params):
+    axis = params[0]
+    if axis in _MIRROR_LINES:
+        point, normal = _MIRROR_LINES[axis]
+    else:
+        slope, intercept = params[1], params[2]
+        point, normal = (0.0, intercept), (-slope, 1.0)
+    normal = np.asarray(normal) / np.hypot(*normal)
+    return np.asarray(point), normal
+
+
+def tween_matrices(transformation_type, params, t):
+    """Matriks (F, 3, 3) di antara identitas (t = 0) dan transformasi penuh (t = 1).
+
+    Rotasi mengikuti busur (sudut t·θ), dilatasi memakai faktor 1 + t·(k - 1),
+    translasi bergerak sepanjang vektor (t·tx, t·ty), dan refleksi dianimasikan
+    sebagai "lipatan": jarak titik ke garis cermin menyusut lalu berbalik arah.
+    """
+    t = np.asarray(t, dtype=float)
+    matrices = _batch(len(t))
+    if transformation_type == "Translasi":
+        tx, ty = params
+        matrices[:, 0, 0] = matrices[:, 1, 1] = 1.0
+        matrices[:, 0, 2], matrices[:, 1, 2] = t * tx, t * ty
+    elif transformation_type == "Rotasi":
+        angle, cx, cy = params
+        angle_rad = np.radians(angle) * t
+        cos, sin = np.cos(angle_rad), np.sin(angle_rad)
+        matrices[:, 0, 0], matrices[:, 0, 1] = cos, -sin
+        matrices[:, 1, 0], matrices[:, 1, 1] = sin, cos
+        matrices[:, 0, 2] = cx - cos * cx + sin * cy
+        matrices[:, 1, 2] = cy - sin * cx - cos * cy
+    elif transformation_type == "Dilatasi":
+        scale, cx, cy = params
+        factor = 1 + t * (scale - 1)
+        matrices[:, 0, 0] = matrices[:, 1, 1] = factor
+        matrices[:, 0, 2], matrices[:, 1, 2] = cx * (1 - factor), cy * (1 - factor)
+    elif transformation_type == "Refleksi":
+        # p' = p - 2t (n · (p - p0)) n
+        point, normal = _mirror_line(params)
+        outer = np.outer(normal, normal)
+        matrices[:, :2, :2] = np.eye(2) - 2 * t[:, np.newaxis, np.newaxis] * outer
+        matrices[:, :2, 2] = 2 * t[:, np.newaxis] * (outer @ point)
+    else:
+        matrices[:] = np.eye(3)
+    return matrices
+
+
+def chain_tween_matrices(steps, n_frames=60):
+    """Matriks semua frame untuk rantai transformasi; langkah dianimasikan bergantian.
+
+    Frame dibagi rata ke tiap langkah. Selama langkah ke-i berjalan, langkah
+    sebelumnya sudah diterapkan penuh: M(t) = tween_i(t) @ kumulatif_(i-1).
+    """
+    if not steps:
+        return np.repeat(np.eye(3)[np.newaxis], n_frames, axis=0)
+    _, cumulative = compose(steps)
+    previous = [np.eye(3)] + cumulative[:-1]
+    progress = np.linspace(0, len(steps), n_frames)
+    index = np.minimum(progress.astype(int), len(steps) - 1)
+    matrices = np.empty((n_frames, 3, 3))
+    for step, ((transformation_type, params), before) in enumerate(zip(steps, previous)):
+        selected = index == step
+        matrices[selected] = tween_matrices(transformation_type, params, progress[selected] - step) @ before
+    return matrices
+
+
+def tween_frames(points, steps, n_frames=60):
+    """Posisi titik di semua frame (F, N, 2), dihitung dalam satu operasi array."""
+    points = np.asarray(points, dtype=float)
+    matrices = chain_tween_matrices(steps, n_frames)
+    return np.einsum("fij,nj->fni", matrices[:, :2, :2], points) + matrices[:, np.newaxis, :2, 2]
+
+
+def subsample(points, max_points=MAX_TWEEN_POINTS):
+    """Ambil paling banyak max_points titik dengan jarak indeks rata (bentuk tetap terbaca)."""
+    if len(points) <= max_points:
+        return np.asarray(points)
+    return np.asarray(points)[np.linspace(0, len(points) - 1, max_points).astype(int)]
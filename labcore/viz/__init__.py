@@ -0,0 +1,22 @@
+"""Pembuat grafik di atas kernel labcore.
+
+Tiap submodul memuat pustaka grafiknya sendiri saat pertama kali diakses:
+``viz.quadratic`` dan ``viz.geometry`` (Matplotlib), ``viz.hypercube`` dan
+``viz.tween`` (Plotly). ``viz.backend`` mengatur siklus hidup figure Matplotlib
+dan pilihan renderer.
+"""
+import importlib
+
+_SUBMODULES = ("backend", "geometry", "hypercube", "quadratic", "tween")
+
+__all__ = list(_SUBMODULES)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES))
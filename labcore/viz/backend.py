@@ -0,0 +1,170 @@
+"""Siklus hidup figure Matplotlib dan pemilihan renderer grafik.
+
+Figure dibuat langsung dari ``matplotlib.figure.Figure`` (tanpa registry
+pyplot) sehingga tidak menumpuk di server, dan dilepas secara eksplisit
+dengan ``release``. ``FigurePool`` menyimpan figure per sesi untuk dipakai
+ulang antar-rerun: artist diperbarui (``set_data``) alih-alih dibangun ulang,
+dan hasil rasterisasi terakhir dipakai lagi bila isinya tidak berubah.
+
+Matplotlib baru dimuat saat figure pertama dibuat, jadi pengukur memori bisa
+ditampilkan tanpa memuatnya.
+"""
+import io
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+
+# Renderer: PNG/SVG dirender di server (Matplotlib), "plotly" digambar di browser
+RENDERERS = {
+    "png": "Matplotlib (PNG)",
+    "svg": "Matplotlib (SVG)",
+    "plotly": "Plotly (Interaktif di Browser)",
+}
+POOL_MAX_FIGURES = 4
+
+# Figure yang dibuat lewat modul ini dan belum dilepas
+_live = weakref.WeakSet()
+_pools = weakref.WeakSet()
+_rendered = {"count": 0, "bytes": 0}
+_lock = threading.Lock()
+
+
+def new_figure(figsize, dpi=100, **subplots_kw):
+    """Figure baru di luar pyplot; mengembalikan (fig, axes) seperti ``plt.subplots``."""
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize, dpi=dpi)
+    axes = fig.subplots(**subplots_kw)
+    with _lock:
+        _live.add(fig)
+    return fig, axes
+
+
+def release(fig):
+    """Lepas figure sekarang juga (artist dihapus) tanpa menunggu garbage collector."""
+    with _lock:
+        _live.discard(fig)
+    fig.clear()
+
+
+def to_bytes(fig, image_format="png", dpi=200):
+    """Rasterisasi figure ke PNG/SVG dengan pengaturan yang sama seperti ``st.pyplot``."""
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=image_format, bbox_inches="tight", dpi=dpi if image_format == "png" else None)
+    data = buffer.getvalue()
+    with _lock:
+        _rendered["count"] += 1
+        _rendered["bytes"] += len(data)
+    return data
+
+
+def image_source(data, image_format):
+    """Sumber untuk ``st.image``: string SVG atau bytes PNG."""
+    return data.decode("utf-8") if image_format == "svg" else data
+
+
+def render_once(fig, image_format="png", dpi=200):
+    """Rasterisasi figure sekali pakai lalu langsung dilepas."""
+    try:
+        return to_bytes(fig, image_format, dpi)
+    finally:
+        release(fig)
+
+
+class FigurePool:
+    """Figure yang dipakai ulang antar-rerun (satu pool per sesi, maksimal ``max_figures``).
+
+    ``factory()`` membuat objek plot dengan atribut ``fig``; objek itu
+    memperbarui artist-nya sendiri. Figure yang paling lama tidak dipakai
+    dilepas saat pool penuh.
+    """
+
+    def __init__(self, max_figures=POOL_MAX_FIGURES):
+        self.max_figures = max_figures
+        self._entries = OrderedDict()  # kunci -> [plot, signature, bytes]
+        with _lock:
+            _pools.add(self)
+
+    def get(self, key, factory):
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = [factory(), None, None]
+            while len(self._entries) > self.max_figures:
+                _, (old, _, _) = self._entries.popitem(last=False)
+                release(old.fig)
+        self._entries.move_to_end(key)
+        return entry
+
+    def render(self, key, factory, signature, draw, image_format="png", dpi=200):
+        """Bytes gambar untuk figure ``key``; ``draw(plot)`` dan rasterisasi hanya bila ``signature`` berubah."""
+        entry = self.get(key, factory)
+        signature = (signature, image_format, dpi)
+        if entry[1] != signature:
+            draw(entry[0])
+            entry[2] = to_bytes(entry[0].fig, image_format, dpi)
+            entry[1] = signature
+        return entry[2]
+
+    def clear(self):
+        while self._entries:
+            _, (plot, _, _) = self._entries.popitem()
+            release(plot.fig)
+
+    def stats(self):
+        # Kanvas Agg hanya dibuat sementara saat savefig, jadi yang ditahan adalah gambar terakhir
+        return {
+            "figures": len(self._entries),
+            "image_bytes": sum(len(data) for _, _, data in self._entries.values() if data),
+        }
+
+
+def plotly_nbytes(fig):
+    """Perkiraan memori figure Plotly: array koordinat di semua trace dan frame."""
+    traces = list(fig.data) + [trace for frame in fig.frames for trace in frame.data]
+    total = sys.getsizeof(fig)
+    for trace in traces:
+        for name in ("x", "y", "z"):
+            values = trace[name] if name in trace else None
+            if values is not None:
+                total += getattr(values, "nbytes", None) or sys.getsizeof(values)
+    return total
+
+
+def memory_stats():
+    """Pengukur memori grafik untuk seluruh proses."""
+    with _lock:
+        live = len(_live)
+        pools = list(_pools)
+        rendered = dict(_rendered)
+    totals = {"figures": 0, "image_bytes": 0}
+    for pool in pools:
+        for name, value in pool.stats().items():
+            totals[name] += value
+    pyplot = sys.modules.get("matplotlib.pyplot")
+    return {
+        "live_figures": live,
+        "pyplot_figures": len(pyplot.get_fignums()) if pyplot else 0,
+        "pools": len(pools),
+        "pooled_figures": totals["figures"],
+        "pooled_bytes": totals["image_bytes"],
+        "rendered_count": rendered["count"],
+        "rendered_bytes": rendered["bytes"],
+    }
+
+
+def show_gauges():
+    """Panel sidebar: jumlah figure hidup dan byte yang ditahan/dirender."""
+    import streamlit as st
+
+    with st.sidebar.expander("🧮 Memori Grafik"):
+        stats = memory_stats()
+        col1, col2 = st.columns(2)
+        col1.metric("Figure hidup", stats["live_figures"])
+        col2.metric("Figure pyplot", stats["pyplot_figures"])
+        col1.metric("Figure di pool", stats["pooled_figures"])
+        col2.metric("Memori pool", f"{stats['pooled_bytes'] / 1024 ** 2:,.1f} MB")
+        st.caption(
+            f"{stats['pools']} pool sesi · {stats['rendered_count']:,} kali render · "
+            f"{stats['rendered_bytes'] / 1024 ** 2:,.1f} MB gambar dihasilkan"
+        )
@@ -0,0 +1,93 @@
+import numpy as np
+
+from . import backend
+from ..lod import MARKER_THRESHOLD, decimate_to_pixels, label_indices, symmetric_limit
+
+FIGSIZE = (8, 8)
+DPI = 100
+
+
+class ShapePlot:
+    """Figure bangun asli dan hasil transformasi yang bisa dipakai ulang.
+
+    Garis, sumbu, dan grid dibuat sekali; ``update`` hanya mengganti data garis
+    (``set_data``), batas sumbu, judul, serta gambar dan label koordinat.
+    """
+
+    def __init__(self):
+        self.fig, self.ax = backend.new_figure(FIGSIZE, DPI)
+        ax = self.ax
+        self.original_line, = ax.plot([], [], 'b-', label='Asli (Original)', alpha=0.6)
+        self.transformed_line, = ax.plot([], [], 'r-', label='Hasil Transformasi', alpha=0.9)
+        ax.axhline(0, color='gray', linestyle='--')
+        ax.axvline(0, color='gray', linestyle='--')
+        # Memastikan sumbu memiliki rasio 1:1
+        ax.set_aspect('equal', adjustable='box')
+        ax.set_xlabel('Sumbu X')
+        ax.set_ylabel('Sumbu Y')
+        ax.grid(True, linestyle='dotted')
+        # Gambar raster dan label koordinat dibuat ulang setiap update
+        self.overlays = []
+
+    def update(self, original_points, transformed_points, title, view=None, images=()):
+        """Gambar ulang untuk titik baru.
+
+        ``view`` = ((xmin, xmax), (ymin, ymax)) untuk memperbesar area tertentu.
+        ``images`` = [(gambar, extent, alpha), ...] digambar di bawah garis bangun.
+        Garis dikurangi sampai resolusi piksel dan label koordinat hanya ditampilkan
+        bila jumlah titik (di area tampilan) cukup sedikit.
+        """
+        ax = self.ax
+        for artist in self.overlays:
+            artist.remove()
+        self.overlays = []
+
+        # Batas sumbu (dihitung dengan operasi vektor tanpa menggabungkan array)
+        if view is None:
+            max_val = symmetric_limit(original_points, transformed_points)
+            xlim = ylim = (-max_val, max_val)
+        else:
+            xlim, ylim = view
+        resolution = (FIGSIZE[0] * DPI, FIGSIZE[1] * DPI)
+
+        # Menggabungkan titik awal dan akhir untuk visualisasi bentuk tertutup
+        original_closed = decimate_to_pixels(np.vstack([original_points, original_points[:1]]), xlim, ylim, resolution)
+        transformed_closed = decimate_to_pixels(np.vstack([transformed_points, transformed_points[:1]]), xlim, ylim, resolution)
+        few_points = max(len(original_closed), len(transformed_closed)) <= MARKER_THRESHOLD
+
+        # Gambar raster (mode Unggah Gambar) di lapisan paling bawah
+        for image, extent, alpha in images:
+            self.overlays.append(ax.imshow(image, extent=extent, alpha=alpha, zorder=0, interpolation='nearest'))
+
+        self.original_line.set_data(original_closed[:, 0], original_closed[:, 1])
+        self.original_line.set_marker('o' if few_points else 'None')
+        self.transformed_line.set_data(transformed_closed[:, 0], transformed_closed[:, 1])
+        self.transformed_line.set_marker('*' if few_points else 'None')
+
+        # Menampilkan koordinat titik (hanya bila jumlahnya cukup sedikit)
+        for i in label_indices(original_points, xlim, ylim):
+            x, y = original_points[i]
+            self.overlays.append(ax.text(x, y, f'P{i+1}({x:.1f}, {y:.1f})', color='blue', fontsize=9))
+        for i in label_indices(transformed_points, xlim, ylim):
+            x, y = transformed_points[i]
+            self.overlays.append(ax.text(x, y, f"P'{i+1}({x:.1f}, {y:.1f})", color='red', fontsize=9, ha='right'))
+
+        ax.set_xlim(*xlim)
+        ax.set_ylim(*ylim)
+        ax.set_title(title)
+        # Legenda dibuat ulang agar penanda titik ikut berubah
+        ax.legend()
+        return self.fig
+
+
+def plot_shape(original_points, transformed_points, title, view=None, images=()):
+    """Membuat plot sekali pakai untuk bangun asli dan hasil transformasi (lihat ``ShapePlot.update``).
+
+    Lepas dengan ``backend.release(fig)`` bila sudah tidak dipakai.
+    """
+    return ShapePlot().update(original_points, transformed_points, title, view, images)
+
+
+def figure_png(fig, dpi=200):
+    """Bytes PNG figure dengan pengaturan yang sama seperti ``st.pyplot``."""
+    return backend.to_bytes(fig, "png", dpi)
@@ -0,0 +1,224 @@
+import os
+
+import numpy as np
+import plotly.graph_objects as go
+from plotly.colors import qualitative
+
+from ..cache import LRUCache
+from ..hypercube import hypercube_edge_path, hypercube_edges, hypercube_vertices
+from ..projection import AXIS_NAMES, perspective_project, plane_name, rotation_matrices, rotation_matrix
+from .backend import plotly_nbytes
+
+# Satu warna per sumbu (maksimal 10 sumbu)
+AXIS_COLORS = qualitative.Plotly
+
+# Figure animasi dibagi antar-sesi (seperti figure tahap pipeline ber-scope global),
+# dibatasi jumlah entri dan total ukuran; entri = (go.Figure, perkiraan byte)
+ANIMATION_CACHE_MAX_MB = float(os.environ.get("ANIMATION_CACHE_MAX_MB", 128))
+_animation_cache = LRUCache(
+    max_entries=32, max_bytes=int(ANIMATION_CACHE_MAX_MB * 1024 * 1024), sizeof=lambda entry: entry[1]
+)
+
+
+def edge_segments(projected_3d, edges):
+    """Koordinat semua rusuk dalam satu array (3E, 3) dengan NaN sebagai pemisah segmen."""
+    segments = np.full((len(edges), 3, 3), np.nan, dtype=np.float32)
+    segments[:, 0] = projected_3d[edges[:, 0]]
+    segments[:, 1] = projected_3d[edges[:, 1]]
+    return segments.reshape(-1, 3)
+
+
+def path_points(projected_3d, path):
+    """Koordinat lintasan rusuk (lihat ``hypercube_edge_path``); indeks -1 menjadi NaN."""
+    points = projected_3d[path].astype(np.float32)
+    points[path < 0] = np.nan
+    return points
+
+
+def axis_colorscale(n):
+    """Colorscale bertingkat sehingga nilai 0..n-1 masing-masing mendapat satu warna sumbu."""
+    scale = []
+    for k in range(n):
+        color = AXIS_COLORS[k % len(AXIS_COLORS)]
+        scale.append([k / n, color])
+        scale.append([(k + 1) / n, color])
+    return scale
+
+
+def edge_trace(projected_3d, edges, axes=None, path=None):
+    """Satu trace Scatter3d untuk semua rusuk.
+
+    Bila ``axes`` diberikan, tiap rusuk menjadi segmen terpisah yang diwarnai
+    menurut sumbunya. Tanpa warna, ``path`` (lintasan Euler) dipakai agar setiap
+    titik sudut tidak dikirim berulang kali.
+    """
+    line = dict(color='blue', width=2)
+    if axes is not None:
+        xyz = edge_segments(projected_3d, edges)
+        n_axes = int(axes.max()) + 1
+        line = dict(
+            color=np.repeat(axes, 3).astype(np.int8),
+            colorscale=axis_colorscale(n_axes),
+            cmin=-0.5, cmax=n_axes - 0.5,
+            width=3,
+        )
+    elif path is not None:
+        xyz = path_points(projected_3d, path)
+    else:
+        xyz = edge_segments(projected_3d, edges)
+    return go.Scatter3d(
+        x=xyz[:, 0], y=xyz[:, 1], z=xyz[:, 2],
+        mode='lines',
+        line=line,
+        connectgaps=False,
+        hoverinfo='skip',
+        name='Rusuk',
+        showlegend=False
+    )
+
+
+def build_hypercube_figure(projected_3d, edges, title, axes=None, path=None):
+    """Gambar rusuk (satu trace) dan titik hasil proyeksi hypercube ke ruang 3D."""
+    fig = go.Figure()
+    fig.add_trace(edge_trace(projected_3d, edges, axes, path))
+
+    # Menambahkan titik
+    vertices = projected_3d.astype(np.float32)
+    fig.add_trace(go.Scatter3d(
+        x=vertices[:, 0], y=vertices[:, 1], z=vertices[:, 2],
+        mode='markers',
+        marker=dict(size=4, color='red'),
+        name='Vertices'
+    ))
+
+    if axes is not None:
+        # Legenda warna sumbu berupa trace kosong
+        for k in range(int(axes.max()) + 1):
+            fig.add_trace(go.Scatter3d(
+                x=[None], y=[None], z=[None], mode='lines',
+                line=dict(color=AXIS_COLORS[k % len(AXIS_COLORS)], width=4),
+                name=f'Rusuk sumbu {AXIS_NAMES[k]}'
+            ))
+
+    fig.update_layout(
+        title=title,
+        scene=dict(
+            xaxis=dict(title='X'),
+            yaxis=dict(title='Y'),
+            zaxis=dict(title='Z'),
+            aspectmode='cube' # Menjaga rasio aspek tetap
+        ),
+        width=700, height=700
+    )
+    return fig
+
+
+def figure_stats(fig, build_seconds):
+    """Jumlah trace, waktu build, dan ukuran payload JSON figure (diserialisasi sekali lagi)."""
+    return {
+        "traces": len(fig.data),
+        "build_ms": build_seconds * 1000,
+        "payload_bytes": len(fig.to_json().encode("utf-8")),
+    }
+
+
+def build_animation_figure(n, base_plane_angles, animated_planes, w_factor, n_frames=72, fps=30):
+    """Figure Plotly berisi satu siklus rotasi penuh sebagai frame animasi.
+
+    Hasil di-cache per (dimensi, sudut awal, bidang, perspektif, frame) dalam LRU
+    yang dibatasi byte. Figure yang sama dikembalikan ke semua pemanggil, jadi
+    perlakukan sebagai read-only (``st.plotly_chart`` hanya membacanya).
+    """
+    key = (n, tuple(base_plane_angles), tuple(animated_planes), float(w_factor), n_frames, fps)
+    entry = _animation_cache.get(key)
+    if entry is None:
+        fig = _animation_figure(*key)
+        _animation_cache.put(key, (fig, plotly_nbytes(fig)))
+        return fig
+    return entry[0]
+
+
+def _animation_figure(n, base_plane_angles, animated_planes, w_factor, n_frames, fps):
+    """Bangun figure animasi tanpa cache (lihat ``build_animation_figure``).
+
+    Semua frame dihitung dalam satu operasi tensor: matriks rotasi (F, N, N),
+    titik hasil rotasi (F, V, N), lalu proyeksi (F, V, 3). Pemutaran berjalan di browser.
+    """
+    vertices = hypercube_vertices(n)
+    edges, _ = hypercube_edges(n)
+    path = hypercube_edge_path(n)
+
+    angles = np.repeat(np.linspace(0, 360, n_frames, endpoint=False)[:, np.newaxis], len(animated_planes), axis=1)
+    matrices = rotation_matrices(n, animated_planes, angles, base=rotation_matrix(n, base_plane_angles))
+    projected = perspective_project(vertices @ matrices.transpose(0, 2, 1), w_factor).astype(np.float32)
+    lines = projected[:, path]
+    lines[:, path < 0] = np.nan
+
+    planes_label = ", ".join(plane_name(plane) for plane in animated_planes)
+    fig = build_hypercube_figure(
+        projected[0], edges, f'Animasi Hypercube {n}D (rotasi bidang {planes_label})', path=path
+    )
+    fig.frames = [
+        go.Frame(
+            name=str(f),
+            traces=[0, 1],
+            data=[
+                go.Scatter3d(x=lines[f, :, 0], y=lines[f, :, 1], z=lines[f, :, 2]),
+                go.Scatter3d(x=projected[f, :, 0], y=projected[f, :, 1], z=projected[f, :, 2]),
+            ],
+        )
+        for f in range(n_frames)
+    ]
+
+    # Rentang sumbu tetap agar kamera tidak "melompat" antar frame
+    finite = projected.reshape(-1, 3)
+    finite = finite[np.isfinite(finite).all(axis=1)]
+    low, high = finite.min(axis=0), finite.max(axis=0)
+    play_args = dict(frame=dict(duration=1000 / fps, redraw=True), transition=dict(duration=0), fromcurrent=True, mode="immediate")
+    fig.update_layout(
+        scene=dict(
+            xaxis=dict(title='X', range=[low[0], high[0]]),
+            yaxis=dict(title='Y', range=[low[1], high[1]]),
+            zaxis=dict(title='Z', range=[low[2], high[2]]),
+            aspectmode='cube'
+        ),
+        updatemenus=[dict(
+            type="buttons",
+            showactive=False,
+            buttons=[
+                dict(label="▶ Putar", method="animate", args=[None, play_args]),
+                dict(label="⏸ Jeda", method="animate",
+                     args=[[None], dict(frame=dict(duration=0, redraw=False), mode="immediate")]),
+            ],
+        )],
+    )
+    return fig
+
+
+def build_slice_figure(points_3d, simplices, title):
+    """Gambar irisan hypercube: permukaan hull (Mesh3d) dan titik-titik potongnya."""
+    fig = go.Figure()
+    if simplices is not None:
+        fig.add_trace(go.Mesh3d(
+            x=points_3d[:, 0], y=points_3d[:, 1], z=points_3d[:, 2],
+            i=simplices[:, 0], j=simplices[:, 1], k=simplices[:, 2],
+            color='lightskyblue', opacity=0.5, flatshading=True,
+            name='Irisan'
+        ))
+    fig.add_trace(go.Scatter3d(
+        x=points_3d[:, 0], y=points_3d[:, 1], z=points_3d[:, 2],
+        mode='markers',
+        marker=dict(size=4, color='red'),
+        name='Titik potong rusuk'
+    ))
+    fig.update_layout(
+        title=title,
+        scene=dict(
+            xaxis=dict(title='X'),
+            yaxis=dict(title='Y'),
+            zaxis=dict(title='Z'),
+            aspectmode='cube'
+        ),
+        width=700, height=700
+    )
+    return fig
@@ -0,0 +1,146 @@
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.colors import ListedColormap, TwoSlopeNorm
+
+from . import backend
+from ..quadratic import SWEEP_LABELS, X_MAX, X_MIN, compute_metrics, evaluate_family
+
+
+class ParabolaPlot:
+    """Figure parabola yang bisa dipakai ulang antar-rerun.
+
+    Sumbu, garis bantu, dan grid dibuat sekali; ``update`` hanya mengganti data
+    kurva (``set_data``), posisi titik, batas sumbu Y, dan legenda.
+    """
+
+    def __init__(self):
+        self.fig, self.ax = backend.new_figure((10, 6))
+        ax = self.ax
+        self.curve, = ax.plot([], [], color='orange', linewidth=3)
+        self.vertex_point = ax.scatter([], [], color='red', zorder=5, label='Titik Puncak')
+        self.intercept_point = ax.scatter([], [], color='blue', zorder=5, label='Titik Potong Y')
+
+        # Pengaturan Sumbu dan Garis Bantu
+        ax.axhline(0, color='gray', linewidth=0.8, linestyle='--')
+        ax.axvline(0, color='gray', linewidth=0.8, linestyle='--')
+        ax.grid(True, linestyle=':', alpha=0.6)
+        ax.set_xlabel('Sumbu X', fontsize=12)
+        ax.set_ylabel('Sumbu Y / f(x)', fontsize=12)
+        ax.set_title('Grafik Parabola')
+        # Batas sumbu X tetap (-10 s.d. 10)
+        ax.set_xlim(X_MIN, X_MAX)
+
+    def update(self, a, b, c):
+        """Gambar ulang untuk koefisien baru; mengembalikan metrik grafik."""
+        metrics, x_plot, y_plot = compute_metrics(a, b, c)
+        self.curve.set_data(x_plot, y_plot)
+        self.curve.set_label(f"a={a:g}, b={b:g}, c={c:g}")
+        self.vertex_point.set_offsets([[metrics["x_puncak"], metrics["y_puncak"]]])
+        self.intercept_point.set_offsets([[0, c]])
+        # Batas sumbu Y adaptif
+        self.ax.set_ylim(metrics["ax_min_y"], metrics["ax_max_y"])
+        # Legenda dibuat ulang agar label koefisien ikut berubah
+        self.ax.legend()
+        return metrics
+
+
+def render_parabola(a, b, c, image_format="png", pool=None):
+    """Gambar grafik parabola dan kembalikan bytes gambar + metrik.
+
+    Dengan ``pool`` (``backend.FigurePool`` milik sesi) figure dipakai ulang;
+    tanpa pool figure dibuat sekali pakai lalu dilepas.
+    """
+    if pool is None:
+        plot = ParabolaPlot()
+        metrics = plot.update(a, b, c)
+        return {"image": backend.render_once(plot.fig, image_format), "format": image_format, "metrics": metrics}
+    metrics = {}
+    image = pool.render("parabola", ParabolaPlot, (a, b, c), lambda plot: metrics.update(plot.update(a, b, c)),
+                        image_format)
+    return {"image": image, "format": image_format, "metrics": metrics or compute_metrics(a, b, c)[0]}
+
+
+def build_parabola_figure(a, b, c):
+    """Figure Plotly (digambar di browser) setara ``ParabolaPlot``."""
+    import plotly.graph_objects as go
+
+    metrics, x_plot, y_plot = compute_metrics(a, b, c)
+    fig = go.Figure([
+        go.Scatter(x=x_plot, y=y_plot, mode='lines', name=f"a={a:g}, b={b:g}, c={c:g}",
+                   line=dict(color='orange', width=3)),
+        go.Scatter(x=[metrics["x_puncak"]], y=[metrics["y_puncak"]], mode='markers', name='Titik Puncak',
+                   marker=dict(color='red', size=10)),
+        go.Scatter(x=[0], y=[c], mode='markers', name='Titik Potong Y', marker=dict(color='blue', size=10)),
+    ])
+    fig.update_layout(
+        title='Grafik Parabola',
+        xaxis=dict(title='Sumbu X', range=[X_MIN, X_MAX], zeroline=True),
+        yaxis=dict(title='Sumbu Y / f(x)', range=[metrics["ax_min_y"], metrics["ax_max_y"]], zeroline=True),
+        height=600,
+    )
+    return fig, metrics
+
+
+def render_family(coeffs, image_format="png"):
+    """Gambar K parabola sekaligus dengan satu LineCollection."""
+    family = evaluate_family(coeffs)
+    segments = np.stack([family["x"], family["y"]], axis=-1)
+
+    fig, ax = backend.new_figure((10, 6))
+    lines = LineCollection(segments, array=coeffs[:, 0], cmap="viridis", linewidths=1.5, alpha=0.8)
+    ax.add_collection(lines)
+    fig.colorbar(lines, ax=ax, label="Koefisien a")
+
+    # Titik puncak semua kurva dalam satu scatter
+    ax.scatter(family["vertices"][:, 0], family["vertices"][:, 1], color='red', s=8, zorder=5, label='Titik Puncak')
+
+    ax.axhline(0, color='gray', linewidth=0.8, linestyle='--')
+    ax.axvline(0, color='gray', linewidth=0.8, linestyle='--')
+    ax.grid(True, linestyle=':', alpha=0.6)
+    ax.set_xlabel('Sumbu X', fontsize=12)
+    ax.set_ylabel('Sumbu Y / f(x)', fontsize=12)
+    ax.set_title(f'Keluarga {len(coeffs)} Parabola')
+    ax.set_xlim(X_MIN, X_MAX)
+    ax.set_ylim(*family["y_limits"])
+    ax.legend()
+
+    return {"image": backend.render_once(fig, image_format), "format": image_format, "vertices": family["vertices"]}
+
+
+def render_sweep(sweep, quantity, b_now, c_now, image_format="png"):
+    """Gambar peta panas satu besaran di bidang b-c plus profil pada c saat ini."""
+    data = sweep[quantity]
+    extent = (sweep["b"][0], sweep["b"][-1], sweep["c"][0], sweep["c"][-1])
+
+    fig, (ax_map, ax_profile) = backend.new_figure((10, 11), nrows=2, ncols=1, gridspec_kw={"height_ratios": [3, 1]})
+    if quantity == "root_count":
+        image = ax_map.imshow(data, origin="lower", extent=extent, aspect="auto", interpolation="nearest",
+                              cmap=ListedColormap(["#d9d9d9", "#fdae61", "#2b83ba"]), vmin=-0.5, vmax=2.5)
+        fig.colorbar(image, ax=ax_map, ticks=[0, 1, 2], label=SWEEP_LABELS[quantity])
+    elif quantity == "discriminant":
+        limit = float(np.nanmax(np.abs(data))) or 1.0
+        image = ax_map.imshow(data, origin="lower", extent=extent, aspect="auto", interpolation="nearest", cmap="RdBu_r",
+                              norm=TwoSlopeNorm(0.0, -limit, limit))
+        fig.colorbar(image, ax=ax_map, label=SWEEP_LABELS[quantity])
+    else:
+        image = ax_map.imshow(data, origin="lower", extent=extent, aspect="auto", interpolation="nearest", cmap="viridis")
+        fig.colorbar(image, ax=ax_map, label=SWEEP_LABELS[quantity])
+
+    ax_map.scatter(b_now, c_now, color='red', marker='x', s=80, zorder=5, label='(b, c) saat ini')
+    ax_map.set_xlabel('Koefisien b')
+    ax_map.set_ylabel('Koefisien c')
+    ax_map.set_title(f"{SWEEP_LABELS[quantity]} di bidang b-c")
+    ax_map.legend(loc="upper right")
+
+    # Irisan 1D: profil besaran sepanjang b pada nilai c saat ini
+    row = int(np.abs(sweep["c"] - c_now).argmin())
+    ax_profile.plot(sweep["b"], data[row], color='orange')
+    ax_profile.axvline(b_now, color='red', linewidth=0.8, linestyle='--')
+    ax_profile.grid(True, linestyle=':', alpha=0.6)
+    ax_profile.set_xlabel('Koefisien b')
+    ax_profile.set_ylabel(SWEEP_LABELS[quantity])
+    ax_profile.set_title(f"Irisan pada c = {sweep['c'][row]:.2f}")
+
+    fig.tight_layout()
+    # Grid sudah sepadat piksel layar, jadi dpi standar cukup dan jauh lebih cepat
+    return {"image": backend.render_once(fig, image_format, dpi=100), "format": image_format}
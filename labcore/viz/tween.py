@@ -0,0 +1,91 @@
+import numpy as np
+import plotly.graph_objects as go
+
+from ..lod import MARKER_THRESHOLD, decimate_to_pixels, label_indices, symmetric_limit
+from ..tween import subsample, tween_frames
+
+# Resolusi acuan untuk mengurangi titik garis (lebar plot di browser, dalam piksel)
+SHAPE_RESOLUTION = (1400, 1400)
+
+
+def build_shape_figure(original_points, transformed_points, title, view=None):
+    """Figure Plotly statis (digambar di browser) setara ``viz.geometry.plot_shape``.
+
+    Garis dikurangi sampai resolusi layar sebelum dikirim, dan label koordinat
+    hanya ditampilkan bila jumlah titik cukup sedikit.
+    """
+    if view is None:
+        limit = float(symmetric_limit(original_points, transformed_points))
+        xlim = ylim = (-limit, limit)
+    else:
+        xlim, ylim = view
+    original_closed = decimate_to_pixels(np.vstack([original_points, original_points[:1]]), xlim, ylim, SHAPE_RESOLUTION)
+    transformed_closed = decimate_to_pixels(np.vstack([transformed_points, transformed_points[:1]]), xlim, ylim, SHAPE_RESOLUTION)
+    mode = 'lines+markers' if max(len(original_closed), len(transformed_closed)) <= MARKER_THRESHOLD else 'lines'
+
+    fig = go.Figure([
+        go.Scatter(x=original_closed[:, 0], y=original_closed[:, 1], mode=mode, name='Asli (Original)',
+                   line=dict(color='blue'), opacity=0.6),
+        go.Scatter(x=transformed_closed[:, 0], y=transformed_closed[:, 1], mode=mode, name='Hasil Transformasi',
+                   line=dict(color='red'), marker=dict(symbol='star', size=9)),
+    ])
+    for points, color, prefix, position in (
+        (original_points, 'blue', 'P', 'top right'), (transformed_points, 'red', "P'", 'top left')
+    ):
+        labels = label_indices(points, xlim, ylim)
+        if len(labels):
+            fig.add_trace(go.Scatter(
+                x=points[labels, 0], y=points[labels, 1], mode='text', showlegend=False, hoverinfo='skip',
+                text=[f'{prefix}{i+1}({x:.1f}, {y:.1f})' for i, (x, y) in zip(labels, points[labels])],
+                textposition=position, textfont=dict(color=color, size=11),
+            ))
+    fig.update_layout(
+        title=title,
+        xaxis=dict(title='Sumbu X', range=list(xlim), zeroline=True),
+        yaxis=dict(title='Sumbu Y', range=list(ylim), zeroline=True, scaleanchor='x', scaleratio=1),
+        height=700,
+    )
+    return fig
+
+
+def build_tween_figure(points, steps, title, n_frames=60, fps=30):
+    """Figure Plotly berisi animasi dari bangun asli ke hasil transformasi.
+
+    Semua frame dihitung sekaligus lalu dikirim sebagai frame Plotly, sehingga
+    pemutaran (dan pemutaran ulang) berjalan di browser tanpa rerun script.
+    """
+    points = subsample(points)
+    frames = tween_frames(points, steps, n_frames).astype(np.float32)
+    # Bentuk tertutup: titik pertama diulang di akhir
+    closed = np.concatenate([frames, frames[:, :1]], axis=1)
+
+    fig = go.Figure([
+        go.Scatter(x=closed[0, :, 0], y=closed[0, :, 1], mode='lines', name='Asli (Original)',
+                   line=dict(color='blue', dash='dot'), opacity=0.6),
+        go.Scatter(x=closed[0, :, 0], y=closed[0, :, 1], mode='lines', name='Hasil Transformasi',
+                   line=dict(color='red', width=3)),
+    ])
+    fig.frames = [
+        go.Frame(name=str(f), traces=[1], data=[go.Scatter(x=closed[f, :, 0], y=closed[f, :, 1])])
+        for f in range(n_frames)
+    ]
+
+    # Rentang sumbu tetap (simetris, seperti plot statis) agar grafik tidak "melompat"
+    limit = float(np.ceil(np.abs(frames).max())) + 1
+    play_args = dict(frame=dict(duration=1000 / fps, redraw=False), transition=dict(duration=0), fromcurrent=True, mode="immediate")
+    fig.update_layout(
+        title=title,
+        xaxis=dict(title='Sumbu X', range=[-limit, limit], zeroline=True),
+        yaxis=dict(title='Sumbu Y', range=[-limit, limit], zeroline=True, scaleanchor='x', scaleratio=1),
+        height=700,
+        updatemenus=[dict(
+            type="buttons",
+            showactive=False,
+            buttons=[
+                dict(label="▶ Putar", method="animate", args=[None, play_args]),
+                dict(label="⏸ Jeda", method="animate",
+                     args=[[None], dict(frame=dict(duration=0, redraw=False), mode="immediate")]),
+            ],
+        )],
+    )
+    return fig
@@ -1,11 +1,27 @@
+import sys
+import time
+from pathlib import Path
+
 import streamlit as st
-import numpy as np
-import plotly.graph_objects as go
-from scipy.spatial import ConvexHull # Untuk menggambar garis pada proyeksi
+
+from assets import asset_source, preload_assets
+
+# Paket inti (labcore) ada di akar repo; SciPy baru dimuat saat irisan pertama dihitung
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from labcore import perf
+from labcore.cross_section import KNIFE_DIRECTIONS, edge_classification, slice_polytope
+from labcore.hypercube import MAX_DIMENSION, hypercube_edge_path, hypercube_edges, hypercube_vertices
+from labcore.pipeline import Pipeline, global_cache, session_cache
+from labcore.projection import perspective_project, plane_name, rotate_points, rotation_planes
+from labcore.viz.backend import plotly_nbytes
+from labcore.viz.hypercube import build_animation_figure, build_hypercube_figure, build_slice_figure, figure_stats
 
 # --- Konfigurasi Halaman ---
 st.set_page_config(layout="wide", page_title="Virtual Lab Dimensi 5: Memahami Hyper-Ruang")
 
+# Pengukuran waktu per fase rerun (aktif bila LAB_PERF=1)
+timer = perf.start("lebihgacorrr")
+
 st.title("🌌 Virtual Lab: Memahami Dimensi Kelima")
 st.markdown("""
 Selamat datang di lab virtual ini\! Kita akan menjelajahi konsep dimensi yang lebih tinggi, 
@@ -24,27 +40,47 @@ st.markdown("""
 Mari kita pahami dimensi dengan membangun dari yang paling sederhana:
 """)
 
+@st.cache_resource
+def get_assets():
+    """Diagram dimensi dimuat sekali ke memori dan dipakai semua sesi (tanpa akses internet)."""
+    return preload_assets()
+
+# /app/static hanya menunjuk ke folder static lab ini bila app.py adalah skrip utama
+# server (bukan dijalankan sebagai halaman host multipage di akar repo)
+STATIC_SERVING = (
+    st.get_option("server.enableStaticServing")
+    and Path(sys.argv[0]).resolve().parent == Path(__file__).resolve().parent
+)
+
+def show_asset(name, caption):
+    """Tampilkan diagram lokal; bila aset hilang, tampilkan keterangan teks saja."""
+    asset = get_assets().get(name)
+    if asset is None:
+        st.caption(f"🖼️ {caption} (gambar tidak tersedia)")
+        return
+    st.image(asset_source(asset, STATIC_SERVING), caption=caption)
+
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
     st.subheader("Titik (0D)")
     st.write("Tidak punya panjang, lebar, atau tinggi. Hanya posisi.")
-    st.image("https://upload.wikimedia.org/wikipedia/commons/thumb/c/cf/Point.svg/100px-Point.svg.png", caption="Titik (0D)")
+    show_asset("dimensi-0d-titik.svg", caption="Titik (0D)")
 
 with col2:
     st.subheader("Garis (1D)")
     st.write("Dibuat dengan menggerakkan titik. Hanya punya panjang.")
-    st.image("https://upload.wikimedia.org/wikipedia/commons/thumb/1/1a/Line_segment.svg/150px-Line_segment.svg.png", caption="Garis (1D)")
+    show_asset("dimensi-1d-garis.svg", caption="Garis (1D)")
 
 with col3:
     st.subheader("Kotak (2D)")
     st.write("Dibuat dengan menggerakkan garis. Punya panjang dan lebar.")
-    st.image("https://upload.wikimedia.org/wikipedia/commons/thumb/a/aa/Square_flat.svg/150px-Square_flat.svg.png", caption="Kotak (2D)")
+    show_asset("dimensi-2d-kotak.svg", caption="Kotak (2D)")
 
 with col4:
     st.subheader("Kubus (3D)")
     st.write("Dibuat dengan menggerakkan kotak. Punya panjang, lebar, dan tinggi.")
-    st.image("https://upload.wikimedia.org/wikipedia/commons/thumb/3/36/Cube.svg/150px-Cube.svg.png", caption="Kubus (3D)")
+    show_asset("dimensi-3d-kubus.svg", caption="Kubus (3D)")
 
 st.markdown("""
 **Konsep Kunci:** Setiap dimensi baru "dibuat" dengan menggerakkan objek dari dimensi sebelumnya dalam arah yang tegak lurus dengan semua dimensi yang sudah ada.
@@ -66,101 +102,111 @@ rotation_angle_xz = st.sidebar.slider("Rotasi (XZ)", 0, 360, 45, help="Rotasi di
 rotation_angle_yz = st.sidebar.slider("Rotasi (YZ)", 0, 360, 45, help="Rotasi di bidang YZ")
 perspective_w = st.sidebar.slider("Perspektif Dimensi ke-4 (W)", -1.0, 1.0, 0.5, 0.01, help="Menyesuaikan perspektif dari dimensi W")
 
-
-def rotate_4d(points, angle_xy, angle_xz, angle_yz):
-    """Rotasi 4D (hanya 3 bidang rotasi 2D untuk kesederhanaan)."""
-    R_xy = np.array([
-        [np.cos(np.radians(angle_xy)), -np.sin(np.radians(angle_xy)), 0, 0],
-        [np.sin(np.radians(angle_xy)),  np.cos(np.radians(angle_xy)), 0, 0],
-        [0, 0, 1, 0],
-        [0, 0, 0, 1]
-    ])
-    R_xz = np.array([
-        [np.cos(np.radians(angle_xz)), 0, -np.sin(np.radians(angle_xz)), 0],
-        [0, 1, 0, 0],
-        [np.sin(np.radians(angle_xz)), 0,  np.cos(np.radians(angle_xz)), 0],
-        [0, 0, 0, 1]
-    ])
-    R_yz = np.array([
-        [1, 0, 0, 0],
-        [0, np.cos(np.radians(angle_yz)), -np.sin(np.radians(angle_yz)), 0],
-        [0, np.sin(np.radians(angle_yz)),  np.cos(np.radians(angle_yz)), 0],
-        [0, 0, 0, 1]
-    ])
-    return (R_xy @ R_xz @ R_yz @ points.T).T
-
-def project_4d_to_3d(points_4d, w_factor=0.5):
-    """Proyeksi perspektif dari 4D ke 3D."""
-    projected = []
-    for p in points_4d:
-        x, y, z, w = p
-        # Faktor skala berbasis perspektif dari dimensi w
-        # Semakin jauh di dimensi w, semakin kecil proyeksi
-        # w_factor mengontrol "kedalaman" w
-        divisor = (w_factor - w)
-        if divisor == 0: # Hindari pembagian nol
-            projected.append([x,y,z]) # atau tangani sesuai kebutuhan
-            continue
-        projected_x = x / divisor
-        projected_y = y / divisor
-        projected_z = z / divisor
-        projected.append([projected_x, projected_y, projected_z])
-    return np.array(projected)
-
-# Titik-titik Hypercube (Tesseract) 4D
-# Ada 16 titik (2^4)
-tesseract_points_4d = np.array([
-    [-1, -1, -1, -1], [ 1, -1, -1, -1], [-1,  1, -1, -1], [ 1,  1, -1, -1],
-    [-1, -1,  1, -1], [ 1, -1,  1, -1], [-1,  1,  1, -1], [ 1,  1,  1, -1],
-    [-1, -1, -1,  1], [ 1, -1, -1,  1], [-1,  1, -1,  1], [ 1,  1, -1,  1],
-    [-1, -1,  1,  1], [ 1, -1,  1,  1], [-1,  1,  1,  1], [ 1,  1,  1,  1]
-])
-
-# Rotasi Tesseract 4D
-rotated_tesseract = rotate_4d(tesseract_points_4d, rotation_angle_xy, rotation_angle_xz, rotation_angle_yz)
-# Proyeksi ke 3D
-projected_tesseract_3d = project_4d_to_3d(rotated_tesseract, perspective_w)
-
-# Menghubungkan titik-titik (edges) untuk tesseract (ini sedikit kompleks, tapi esensinya mirip kubus ganda)
-# Ada 32 garis untuk tesseract (2 * 12 (kubus) + 8 (menghubungkan kubus))
-edges = []
-for i in range(16):
-    for j in range(i + 1, 16):
-        if np.sum(np.abs(tesseract_points_4d[i] - tesseract_points_4d[j])) == 2: # Hanya menghubungkan titik yang berbeda 1 dimensi
-            edges.append((i, j))
-
-fig_tesseract = go.Figure()
-
-for edge in edges:
-    p1 = projected_tesseract_3d[edge[0]]
-    p2 = projected_tesseract_3d[edge[1]]
-    fig_tesseract.add_trace(go.Scatter3d(
-        x=[p1[0], p2[0]], y=[p1[1], p2[1]], z=[p1[2], p2[2]],
-        mode='lines',
-        line=dict(color='blue', width=2),
-        showlegend=False
-    ))
-
-# Menambahkan titik
-fig_tesseract.add_trace(go.Scatter3d(
-    x=projected_tesseract_3d[:,0], y=projected_tesseract_3d[:,1], z=projected_tesseract_3d[:,2],
-    mode='markers',
-    marker=dict(size=4, color='red'),
-    name='Vertices'
-))
-
-fig_tesseract.update_layout(
-    title='Proyeksi Tesseract (Hypercube 4D) ke Ruang 3D',
-    scene=dict(
-        xaxis=dict(title='X'),
-        yaxis=dict(title='Y'),
-        zaxis=dict(title='Z'),
-        aspectmode='cube' # Menjaga rasio aspek tetap
-    ),
-    width=700, height=700
+# Bidang rotasi tambahan (melalui W dan dimensi yang lebih tinggi)
+extra_planes = st.sidebar.multiselect(
+    "Bidang Rotasi Tambahan",
+    [plane for plane in rotation_planes(MAX_DIMENSION) if plane not in ((0, 1), (0, 2), (1, 2))],
+    format_func=plane_name,
+    help="Rotasi di bidang yang melibatkan W, V, ... membuat objek 'berputar keluar-masuk' dirinya sendiri."
 )
-
-st.plotly_chart(fig_tesseract, use_container_width=True)
+plane_angles = [((0, 1), rotation_angle_xy), ((0, 2), rotation_angle_xz), ((1, 2), rotation_angle_yz)]
+for plane in extra_planes:
+    angle = st.sidebar.slider(f"Rotasi ({plane_name(plane)})", 0, 360, 0, key=f"rotasi_{plane_name(plane)}")
+    plane_angles.append((plane, angle))
+color_by_axis = st.sidebar.checkbox("Warnai Rusuk Menurut Sumbu", value=False)
+show_render_stats = st.sidebar.checkbox("Tampilkan Statistik Render", value=False)
+
+# Mode animasi: satu siklus rotasi dihitung sekali lalu diputar di browser
+st.sidebar.subheader("Animasi Rotasi")
+animate = st.sidebar.checkbox("Mode Animasi (diputar di browser)", value=False)
+if animate:
+    animated_planes = st.sidebar.multiselect(
+        "Bidang yang Diputar",
+        rotation_planes(MAX_DIMENSION),
+        default=[(0, 3)],
+        format_func=plane_name
+    )
+    n_frames = st.sidebar.slider("Jumlah Frame per Putaran", 24, 240, 72, 12)
+    fps = st.sidebar.slider("Kecepatan (frame/detik)", 10, 60, 30)
+
+
+def planes_for_dimension(n):
+    """Pilih rotasi bidang yang ada di ruang N dimensi."""
+    return tuple((plane, angle) for plane, angle in plane_angles if plane[1] < n)
+
+def animation_for_dimension(n):
+    """Figure animasi (dari cache) untuk hypercube N dimensi, atau None bila tidak ada bidang yang cocok."""
+    planes = tuple(plane for plane in animated_planes if plane[1] < n)
+    if not planes:
+        return None
+    return build_animation_figure(n, planes_for_dimension(n), planes, perspective_w, n_frames, fps)
+
+# --- Tahap Pipeline (rotasi → proyeksi → figure) ---
+# Kunci tiap tahap = hash isi input di hulunya; menggeser slider perspektif misalnya
+# hanya menghitung ulang proyeksi dan figure, rotasi dan daftar rusuk diambil dari cache
+pipeline = Pipeline(session_cache("lebihgacorrr"), global_cache("lebihgacorrr"))
+
+def add_projection_stages(prefix):
+    """Tahap rotasi, proyeksi, dan rusuk untuk satu hypercube (input ``<prefix>_n`` dan ``<prefix>_planes``)."""
+    @pipeline.stage(f"{prefix}_rotate", f"{prefix}_n", f"{prefix}_planes", scope="global")
+    def rotate_stage(n, planes):
+        # Titik-titik hypercube (2^N) dibuat dari bit-bit indeks titik, lalu diputar dengan satu matriks gabungan
+        return rotate_points(hypercube_vertices(n), planes)
+
+    @pipeline.stage(f"{prefix}_project", f"{prefix}_rotate", "perspective", scope="global")
+    def project_stage(rotated, w_factor):
+        return perspective_project(rotated, w_factor)
+
+    @pipeline.stage(f"{prefix}_edges", f"{prefix}_n", scope="global")
+    def edges_stage(n):
+        # Rusuk menghubungkan titik yang berbeda tepat 1 bit (1 dimensi); (rusuk, sumbu)
+        return hypercube_edges(n)
+
+add_projection_stages("tesseract")
+add_projection_stages("hypercube")
+
+@pipeline.stage("tesseract_figure", "tesseract_project", "tesseract_edges", sizeof=plotly_nbytes)
+def tesseract_figure_stage(projected, edges):
+    return build_hypercube_figure(projected, edges[0], 'Proyeksi Tesseract (Hypercube 4D) ke Ruang 3D')
+
+@pipeline.stage("hypercube_figure", "hypercube_n", "hypercube_project", "hypercube_edges", "color_by_axis", sizeof=plotly_nbytes)
+def hypercube_figure_stage(n, projected, edges, color_by_axis):
+    edge_list, edge_axes = edges
+    return build_hypercube_figure(
+        projected, edge_list,
+        f'Proyeksi Hypercube {n}D ({len(projected)} titik, {len(edge_list)} rusuk) ke Ruang 3D',
+        axes=edge_axes if color_by_axis else None, path=hypercube_edge_path(n)
+    )
+
+@pipeline.stage("slice", "slice_dim", "knife_direction", "knife_offset", "perspective", scope="global")
+def slice_stage(n, direction, offset, w_factor):
+    return slice_polytope(n, direction, offset, w_factor)
+
+@pipeline.stage("slice_figure", "slice_dim", "slice", sizeof=plotly_nbytes)
+def slice_figure_stage(n, polytope):
+    slice_3d, slice_simplices = polytope
+    return build_slice_figure(
+        slice_3d, slice_simplices,
+        f'Irisan Hypercube {n}D: polytope {n - 1}D dengan {len(slice_3d)} titik sudut'
+        + (' (diproyeksikan ke 3D)' if n > 4 else '')
+    )
+
+# Tesseract 4D: 16 titik dan 32 rusuk (2 * 12 (kubus) + 8 (menghubungkan kubus))
+pipeline.feed(
+    perspective=perspective_w, color_by_axis=color_by_axis,
+    tesseract_n=4, tesseract_planes=planes_for_dimension(4),
+)
+with timer.phase("compute"):
+    # Rotasi Tesseract 4D lalu proyeksi ke 3D
+    pipeline["tesseract_project"]
+
+with timer.phase("figure"):
+    fig_tesseract = pipeline["tesseract_figure"]
+    if animate:
+        fig_tesseract = animation_for_dimension(4) or fig_tesseract
+with timer.phase("serialize"):
+    st.plotly_chart(fig_tesseract, use_container_width=True)
+timer.record_bytes("plotly", lambda: len(fig_tesseract.to_json()))
 st.markdown("""
 **Perhatikan:**
 * Saat Anda menggeser sudut rotasi, bentuk proyeksi Tesseract ini berubah. Ini adalah "bayangan" dari objek 4D yang berputar di ruang 4D.
@@ -215,6 +261,64 @@ with col_5d_2:
     * **Penteract (5D):** $5 \times 2^4 = 80$ rusuk
     """)
 
+st.subheader("Proyeksi Hypercube N-Dimensi ke 3D")
+n_dim = st.selectbox(
+    "Dimensi Hypercube",
+    tuple(range(5, MAX_DIMENSION + 1)),
+    help="Proyeksi dilakukan bertahap: N-D → (N-1)-D → ... → 3D dengan perspektif yang sama seperti Tesseract. "
+         "Semua bidang rotasi dari sidebar yang ada di dimensi ini ikut diterapkan."
+)
+pipeline.feed(hypercube_n=n_dim, hypercube_planes=planes_for_dimension(n_dim))
+hypercube_edge_list, _ = pipeline["hypercube_edges"]
+
+build_start = time.perf_counter()
+with timer.phase("compute"):
+    pipeline["hypercube_project"]
+
+with timer.phase("figure"):
+    fig_hypercube = pipeline["hypercube_figure"]
+    if animate:
+        fig_hypercube = animation_for_dimension(n_dim) or fig_hypercube
+build_seconds = time.perf_counter() - build_start
+with timer.phase("serialize"):
+    st.plotly_chart(fig_hypercube, use_container_width=True)
+timer.record_bytes("plotly", lambda: len(fig_hypercube.to_json()))
+if show_render_stats:
+    stats = figure_stats(fig_hypercube, build_seconds)
+    st.caption(
+        f"Semua {len(hypercube_edge_list)} rusuk dikemas dalam satu trace (total {stats['traces']} trace), "
+        f"payload {stats['payload_bytes'] / 1024:.1f} KB, waktu build {stats['build_ms']:.1f} ms."
+    )
+
+st.subheader("Irisan Hypercube dengan Hyper-Pisau")
+col_knife_1, col_knife_2 = st.columns(2)
+with col_knife_1:
+    slice_dim = st.selectbox("Dimensi Hypercube yang Diiris", (4, 5, 6, 7, 8), index=1)
+with col_knife_2:
+    knife_direction = st.selectbox(
+        "Arah Hyper-Pisau",
+        KNIFE_DIRECTIONS,
+        help="Diagonal utama: pisau tegak lurus diagonal (1, 1, ..., 1). Sumbu terakhir: pisau bergerak sepanjang dimensi ke-N."
+    )
+max_height = edge_classification(slice_dim, knife_direction)["max_height"]
+knife_position = st.slider(
+    "Posisi Hyper-Pisau",
+    -1.0, 1.0, 0.0, 0.01,
+    help="Posisi relatif pisau dari satu ujung hypercube (-1) ke ujung lainnya (1)."
+)
+pipeline.feed(slice_dim=slice_dim, knife_direction=knife_direction, knife_offset=knife_position * max_height)
+with timer.phase("compute"):
+    pipeline["slice"]
+with timer.phase("figure"):
+    fig_slice = pipeline["slice_figure"]
+with timer.phase("serialize"):
+    st.plotly_chart(fig_slice, use_container_width=True)
+timer.record_bytes("plotly", lambda: len(fig_slice.to_json()))
+st.caption(
+    "Setiap titik merah adalah tempat sebuah rusuk hypercube menembus hyper-pisau. "
+    "Geser pisau untuk melihat irisan muncul, berubah bentuk, dan menghilang."
+)
+
 st.markdown("""
 **Kesimpulan:**
 Memahami dimensi ke-5 bukanlah tentang melihatnya, tetapi tentang **memahami strukturnya secara matematis**
@@ -224,3 +328,7 @@ Ini adalah latihan dalam abstraksi dan penalaran spasial yang melampaui pengalam
 
 st.divider()
 st.info("Anda bisa menemukan lebih banyak tentang topik ini dengan mencari 'Hypercube', 'Tesseract', atau 'Penteract'.")
+
+pipeline.show_panel()
+perf.show_panel(timer)
+timer.finish()
@@ -0,0 +1,105 @@
+import hashlib
+from collections import namedtuple
+from pathlib import Path
+
+# Folder "static" di samping app.py dilayani Streamlit di /app/static/ bila
+# server.enableStaticServing aktif (lengkap dengan header ETag/Last-Modified)
+STATIC_DIR = Path(__file__).parent / "static"
+STATIC_URL = "/app/static"
+
+Asset = namedtuple("Asset", ["name", "svg", "etag", "shipped"])
+
+_SIZE = 150
+_STROKE = 'stroke="#1f3b73" stroke-width="4" stroke-linecap="round"'
+_DOT = 'fill="#d62728"'
+
+
+def _svg(body):
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{_SIZE}" height="{_SIZE}" '
+        f'viewBox="0 0 {_SIZE} {_SIZE}">\n{body}\n</svg>\n'
+    )
+
+
+def _dots(points, radius=6):
+    return "\n".join(f'<circle cx="{x}" cy="{y}" r="{radius}" {_DOT}/>' for x, y in points)
+
+
+def _segments(pairs):
+    return "\n".join(f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" {_STROKE}/>' for (x1, y1), (x2, y2) in pairs)
+
+
+def draw_point():
+    """Titik (0D)."""
+    return _svg(_dots([(75, 75)], radius=10))
+
+
+def draw_line():
+    """Garis (1D): titik yang digerakkan."""
+    ends = [(25, 75), (125, 75)]
+    return _svg(_segments([ends]) + "\n" + _dots(ends))
+
+
+def draw_square():
+    """Kotak (2D): garis yang digerakkan."""
+    corners = [(30, 30), (120, 30), (120, 120), (30, 120)]
+    sides = list(zip(corners, corners[1:] + corners[:1]))
+    return _svg(_segments(sides) + "\n" + _dots(corners))
+
+
+def draw_cube():
+    """Kubus (3D): kotak yang digerakkan, digambar dengan proyeksi miring."""
+    front = [(20, 50), (100, 50), (100, 130), (20, 130)]
+    back = [(x + 30, y - 30) for x, y in front]
+    sides = list(zip(front, front[1:] + front[:1])) + list(zip(back, back[1:] + back[:1]))
+    sides += list(zip(front, back))
+    return _svg(_segments(sides) + "\n" + _dots(front + back, radius=5))
+
+
+# Nama file -> fungsi penggambar
+DIAGRAMS = {
+    "dimensi-0d-titik.svg": draw_point,
+    "dimensi-1d-garis.svg": draw_line,
+    "dimensi-2d-kotak.svg": draw_square,
+    "dimensi-3d-kubus.svg": draw_cube,
+}
+
+
+def load_asset(name):
+    """Muat aset dari folder static; bila tidak ada, gambar ulang di memori.
+
+    Mengembalikan None bila aset tidak dikenal dan tidak ada di disk.
+    """
+    path = STATIC_DIR / name
+    shipped = path.is_file()
+    if shipped:
+        svg = path.read_text(encoding="utf-8")
+    elif name in DIAGRAMS:
+        svg = DIAGRAMS[name]()
+    else:
+        return None
+    etag = hashlib.sha1(svg.encode("utf-8")).hexdigest()
+    return Asset(name, svg, etag, shipped)
+
+
+def preload_assets(names=tuple(DIAGRAMS)):
+    """Muat semua aset sekaligus ke memori (dipanggil sekali saat server mulai)."""
+    return {name: load_asset(name) for name in names}
+
+
+def asset_source(asset, static_serving=False):
+    """Sumber untuk ``st.image``: URL static (bisa di-cache browser) atau string SVG."""
+    if static_serving and asset.shipped:
+        return f"{STATIC_URL}/{asset.name}?v={asset.etag[:12]}"
+    return asset.svg
+
+
+def write_static_assets():
+    """Tulis ulang file SVG di folder static dari fungsi penggambar."""
+    STATIC_DIR.mkdir(exist_ok=True)
+    for name, draw in DIAGRAMS.items():
+        (STATIC_DIR / name).write_text(draw(), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    write_static_assets()
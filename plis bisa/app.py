@@ -1,10 +1,14 @@
+import io
+import sys
+from pathlib import Path
+
+import numpy as np
 import streamlit as st
 
-# --- Fungsi untuk Luas Persegi ---
-def luas_persegi(sisi):
-  """Menghitung luas persegi: sisi * sisi"""
-  luas = sisi * sisi
-  return luas
+# --- Fungsi untuk Luas Persegi (kernel di labcore/persegi.py, bisa dipakai tanpa Streamlit) ---
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from labcore import perf
+from labcore.persegi import CHUNK_SIZE, UNITS, UPLOAD_TYPES, SideParseError, iter_luas_chunks, load_sides, luas_persegi, parse_sides, write_csv
 
 # --- Konfigurasi Halaman Streamlit ---
 st.set_page_config(
@@ -13,9 +17,79 @@ st.set_page_config(
     layout="centered"
 )
 
+# Pengukuran waktu per fase rerun (aktif bila LAB_PERF=1)
+timer = perf.start("plis_bisa")
+
 st.title('📐 Kalkulator Luas Persegi Sederhana')
 st.caption('Aplikasi ini menghitung luas persegi menggunakan Streamlit.')
 
+mode = st.radio('Mode', ('Satu Persegi', 'Banyak Persegi (Batch)'), horizontal=True)
+
+# --- Mode Batch: banyak sisi sekaligus ---
+if mode == 'Banyak Persegi (Batch)':
+    source = st.radio('Sumber Sisi', ('Tempel Daftar', 'Unggah File'), horizontal=True)
+    try:
+        if source == 'Tempel Daftar':
+            text = st.text_area('Daftar panjang sisi (pisahkan dengan spasi, koma, atau baris baru)', value='1, 2.5, 3, 10')
+            with timer.phase("input"):
+                sides = parse_sides(text)
+        else:
+            uploaded = st.file_uploader('File sisi (kolom pertama CSV/TXT, atau NPY 1D)', type=UPLOAD_TYPES)
+            if uploaded is None:
+                st.info('Unggah file untuk memulai.')
+                timer.finish()
+                st.stop()
+            with timer.phase("input"):
+                sides = load_sides(uploaded.name, uploaded.getvalue())
+    except SideParseError as exc:
+        if exc.errors:
+            st.error("Format daftar sisi salah:\n" + "\n".join(f"- Nilai ke-{index}: '{token}' bukan angka" for index, token in exc.errors))
+        else:
+            st.error(f"File sisi tidak bisa dibaca: {exc}")
+        timer.finish()
+        st.stop()
+
+    unit_cols = st.columns(2)
+    unit_in = unit_cols[0].selectbox('Satuan sisi', list(UNITS), index=list(UNITS).index('satuan'))
+    unit_out = unit_cols[1].selectbox('Satuan luas', list(UNITS), index=list(UNITS).index(unit_in))
+
+    # Hasil dikirim ke browser per potongan begitu selesai dihitung: ringkasan diperbarui
+    # setiap potongan dan tabel potongan yang dipilih tampil tanpa menunggu potongan lainnya
+    metric_slots = [column.empty() for column in st.columns(3)]
+    warning_slot = st.empty()
+    n_chunks = max(-(-len(sides) // CHUNK_SIZE), 1)
+    page = st.number_input('Potongan', min_value=1, max_value=n_chunks, value=1, step=1)
+    table_slot = st.empty()
+    progress = st.progress(0.0, text='Menghitung...')
+    n_done = n_invalid = 0
+    total = 0.0
+    with timer.phase("compute"):
+        for index, (start, chunk, areas, invalid) in enumerate(iter_luas_chunks(sides, unit_in, unit_out)):
+            n_done += len(chunk)
+            n_invalid += int(invalid.sum())
+            total += float(np.nansum(areas))
+            metric_slots[0].metric('Jumlah Persegi', f'{n_done:,}')
+            metric_slots[1].metric('Sisi Tidak Sah', f'{n_invalid:,}')
+            metric_slots[2].metric(f'Total Luas ({unit_out}²)', f'{total:,.2f}')
+            if n_invalid:
+                warning_slot.warning('Sisi negatif atau bukan angka berhingga tidak dihitung (luas kosong).')
+            if index == int(page) - 1:
+                table_slot.dataframe({'Sisi': chunk, f'Luas ({unit_out}²)': areas}, use_container_width=True)
+            progress.progress(n_done / max(len(sides), 1), text=f'{n_done:,} dari {len(sides):,} persegi')
+    progress.empty()
+    if not n_done:
+        metric_slots[0].metric('Jumlah Persegi', '0')
+
+    def results_csv():
+        output = io.StringIO()
+        write_csv(sides, output, unit_in, unit_out)
+        return output.getvalue()
+
+    st.download_button('⬇️ Unduh Hasil (CSV)', results_csv, file_name='luas_persegi.csv', mime='text/csv')
+    perf.show_panel(timer)
+    timer.finish()
+    st.stop()
+
 # --- Input dari Pengguna ---
 # Gunakan st.number_input untuk input numerik
 s = st.number_input(
@@ -37,3 +111,6 @@ if st.button('Hitung Luas'):
 
     # Opsional: Tampilkan rumus
     st.info(f"Rumus: Luas = sisi * sisi = {s} * {s} = {hasil_luas:.2f}")
+
+perf.show_panel(timer)
+timer.finish()
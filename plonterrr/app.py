@@ -1,136 +1,37 @@
+import os
+import sys
+from functools import partial
+from pathlib import Path
+
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
-
-# --- Fungsi Transformasi Geometri ---
-
-def translate(point, tx, ty):
-    """Menerapkan Translasi pada titik (x, y)."""
-    T = np.array([[1, 0, tx],
-                  [0, 1, ty],
-                  [0, 0, 1]])
-    P = np.array([[point[0]], [point[1]], [1]])
-    P_prime = T @ P
-    return P_prime[0, 0], P_prime[1, 0]
-
-def rotate(point, angle_deg, cx=0, cy=0):
-    """Menerapkan Rotasi terhadap pusat (cx, cy)."""
-    angle_rad = np.radians(angle_deg)
-    
-    # 1. Translasi titik ke pusat (cx, cy)
-    x_translated = point[0] - cx
-    y_translated = point[1] - cy
-    
-    # 2. Rotasi
-    x_rotated = x_translated * np.cos(angle_rad) - y_translated * np.sin(angle_rad)
-    y_rotated = x_translated * np.sin(angle_rad) + y_translated * np.cos(angle_rad)
-    
-    # 3. Translasi kembali
-    x_final = x_rotated + cx
-    y_final = y_rotated + cy
-    
-    return x_final, y_final
-
-def reflect(point, axis_choice):
-    """Menerapkan Refleksi terhadap sumbu X, Y, atau garis y=x."""
-    x, y = point
-    if axis_choice == "Sumbu X":
-        return x, -y
-    elif axis_choice == "Sumbu Y":
-        return -x, y
-    elif axis_choice == "Garis y=x":
-        return y, x
-    return x, y
-
-def dilate(point, scale_factor, cx=0, cy=0):
-    """Menerapkan Dilatasi terhadap pusat (cx, cy)."""
-    # Menggeser titik ke pusat
-    x_translated = point[0] - cx
-    y_translated = point[1] - cy
-    
-    # Skala
-    x_scaled = x_translated * scale_factor
-    y_scaled = y_translated * scale_factor
-    
-    # Menggeser kembali
-    x_final = x_scaled + cx
-    y_final = y_scaled + cy
-    
-    return x_final, y_final
 
-def apply_transformation(shape_points, transformation_type, params):
-    """Menerapkan transformasi ke semua titik pada bangun."""
-    transformed_points = []
-    
-    if transformation_type == "Translasi":
-        tx, ty = params
-        for p in shape_points:
-            transformed_points.append(translate(p, tx, ty))
-            
-    elif transformation_type == "Rotasi":
-        angle, cx, cy = params
-        for p in shape_points:
-            transformed_points.append(rotate(p, angle, cx, cy))
-            
-    elif transformation_type == "Refleksi":
-        axis = params[0]
-        for p in shape_points:
-            transformed_points.append(reflect(p, axis))
-
-    elif transformation_type == "Dilatasi":
-        scale, cx, cy = params
-        for p in shape_points:
-            transformed_points.append(dilate(p, scale, cx, cy))
-            
-    return np.array(transformed_points)
-
-# --- Visualisasi Grafik ---
-
-def plot_shape(original_points, transformed_points, title):
-    """Membuat plot untuk bangun asli dan hasil transformasi."""
-    fig, ax = plt.subplots(figsize=(8, 8))
-    
-    # Menggabungkan titik awal dan akhir untuk visualisasi bentuk tertutup
-    original_closed = np.vstack([original_points, original_points[0]])
-    transformed_closed = np.vstack([transformed_points, transformed_points[0]])
-    
-    # Plot bangun asli
-    ax.plot(original_closed[:, 0], original_closed[:, 1], 'bo-', label='Asli (Original)', alpha=0.6)
-    
-    # Plot hasil transformasi
-    ax.plot(transformed_closed[:, 0], transformed_closed[:, 1], 'r*-', label='Hasil Transformasi', alpha=0.9)
-    
-    # Pengaturan plot
-    ax.axhline(0, color='gray', linestyle='--')
-    ax.axvline(0, color='gray', linestyle='--')
-    
-    # Menampilkan koordinat titik
-    for i, (x, y) in enumerate(original_points):
-        ax.text(x, y, f'P{i+1}({x:.1f}, {y:.1f})', color='blue', fontsize=9)
-    for i, (x, y) in enumerate(transformed_points):
-        ax.text(x, y, f"P'{i+1}({x:.1f}, {y:.1f})", color='red', fontsize=9, ha='right')
-        
-    # Memastikan sumbu memiliki rasio 1:1
-    ax.set_aspect('equal', adjustable='box')
-    
-    # Batas sumbu
-    all_coords = np.vstack([original_points, transformed_points])
-    max_val = np.ceil(np.max(np.abs(all_coords))) + 1
-    ax.set_xlim(-max_val, max_val)
-    ax.set_ylim(-max_val, max_val)
-    
-    ax.set_title(title)
-    ax.set_xlabel('Sumbu X')
-    ax.set_ylabel('Sumbu Y')
-    ax.legend()
-    ax.grid(True, linestyle='dotted')
-    
-    return fig
+# Paket inti (labcore) ada di akar repo; Matplotlib/Plotly baru dimuat sesuai mode tampilan
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from labcore import perf, viz
+from labcore.ingest import UPLOAD_TYPES, CoordinateParseError, content_hash, load_upload, parse_text
+from labcore.pipeline import Keyed, Pipeline, global_cache, session_cache
+from labcore.raster import IMAGE_TYPES, RESAMPLING_METHODS, image_corners, image_extent, load_image, transform_image
+from labcore.table import TABLE_COLUMNS, export_csv, export_parquet, page_count, page_frame, sort_order
+from labcore.transforms import REFLECTION_AXES, apply_chain, compose
+from labcore.tween import subsample
+
+# --- Pengaturan Tabel ---
+
+PAGE_SIZES = (25, 100, 500)
+INTERMEDIATE_ROWS = 100  # baris hasil antara per langkah yang ditampilkan
+
+# --- Pengaturan Grafik ---
+
+PLOT_RENDERER = os.environ.get("PLOT_RENDERER", "png")  # "png", "svg", atau "plotly"
 
 # --- Antarmuka Streamlit ---
 
 st.set_page_config(layout="wide", page_title="Lab Virtual Transformasi Geometri")
 
+# Pengukuran waktu per fase rerun (aktif bila LAB_PERF=1)
+timer = perf.start("plonterrr")
+
 st.title("🔬 Lab Virtual Transformasi Geometri")
 st.markdown("""
 Aplikasi interaktif ini memungkinkan Anda untuk memvisualisasikan **Translasi, Rotasi, Refleksi, dan Dilatasi**
@@ -143,88 +44,333 @@ st.sidebar.header("⚙️ Pengaturan Bangun dan Transformasi")
 # 1. Input Bangun Datar
 st.sidebar.subheader("1. Tentukan Bangun Datar Awal")
 default_points = "1,1; 3,1; 3,3; 1,3"
-point_input = st.sidebar.text_area(
-    "Masukkan Koordinat Titik (Contoh: x1,y1; x2,y2; ...)",
-    value=default_points
+input_source = st.sidebar.radio(
+    "Sumber Titik",
+    ("Ketik Koordinat", "Unggah File", "Unggah Gambar"),
+    horizontal=True
 )
 
+@st.cache_resource(max_entries=8)
+def load_uploaded_points(digest, file_name, _data):
+    """Muat titik dari file unggahan; di-cache per hash isi file (array read-only/memory-map)."""
+    return load_upload(file_name, _data, digest)
+
+@st.cache_resource(max_entries=4)
+def load_uploaded_image(digest, _data):
+    """Decode gambar unggahan sekali per hash isi file (array RGBA read-only)."""
+    image = load_image(_data)
+    image.flags.writeable = False
+    return image
+
+def figure_pool():
+    """Figure Matplotlib milik sesi ini, dipakai ulang antar-rerun."""
+    if "figure_pool" not in st.session_state:
+        st.session_state.figure_pool = viz.backend.FigurePool()
+    return st.session_state.figure_pool
+
+def uploaded_digest(uploaded):
+    """Hash isi file unggahan, dihitung sekali per file (bukan setiap rerun)."""
+    digests = st.session_state.setdefault("upload_digests", {})
+    if uploaded.file_id not in digests:
+        digests[uploaded.file_id] = content_hash(uploaded.getvalue())
+    return digests[uploaded.file_id]
+
+# --- Tahap Pipeline (parse → transform → layout → render) ---
+# Kunci tiap tahap = hash isi input di hulunya; tahap yang kuncinya sama diambil dari cache
+pipeline = Pipeline(session_cache("plonterrr"), global_cache("plonterrr"))
+
+@pipeline.stage("parse", "text", scope="global")
+def parse_stage(text):
+    return parse_text(text)
+
+@pipeline.stage("transform", "points", "steps", scope="global")
+def transform_stage(points, steps):
+    # Seluruh rantai digabung menjadi satu matriks 3x3 lalu diterapkan sekaligus;
+    # hasilnya dibagi antar-sesi, jadi dibuat read-only
+    transformed, intermediate = apply_chain(points, steps)
+    for array in (transformed, *intermediate):
+        array.flags.writeable = False
+    return transformed, intermediate
+
+@pipeline.stage("image_transform", "image", "image_box", "steps", "resampling", scope="global")
+def image_transform_stage(image, image_box, steps, resampling):
+    # Gambar raster ditransformasi dengan matriks gabungan yang sama (pemetaan balik per piksel)
+    total_matrix, _ = compose(steps)
+    result_image, result_box = transform_image(image, total_matrix, image_box, method=resampling)
+    result_image.flags.writeable = False
+    return result_image, result_box
+
+@pipeline.stage("table_order", "points", "transform", "sort_column", "descending")
+def table_order_stage(points, transformed, sort_column, descending):
+    return sort_order(points, transformed[0], sort_column, descending)
+
+@pipeline.stage("table_page", "points", "transform", "table_order", "page", "page_size")
+def table_page_stage(points, transformed, order, page, page_size):
+    return page_frame(points, transformed[0], order, page, page_size)
+
+@pipeline.stage("shape_layout", "points", "transform", "title", "view", sizeof=viz.backend.plotly_nbytes)
+def shape_layout_stage(points, transformed, title, view):
+    return viz.tween.build_shape_figure(points, transformed[0], title, view=view)
+
+@pipeline.stage("tween_layout", "points", "steps", "title", "n_frames", "fps", scope="global", sizeof=viz.backend.plotly_nbytes)
+def tween_layout_stage(points, steps, title, n_frames, fps):
+    return viz.tween.build_tween_figure(points, steps, title, n_frames, fps)
+
+@pipeline.stage("render", "points", "transform", "title", "view", "layers", "image_format")
+def render_stage(points, transformed, title, view, layers, image_format):
+    # Figure sesi dipakai ulang: hanya data artist yang diganti sebelum dirasterisasi
+    plot = figure_pool().get("bangun", viz.geometry.ShapePlot)[0]
+    return viz.backend.to_bytes(plot.update(points, transformed[0], title, view, layers), image_format)
+
+def show_parse_errors(exc):
+    """Tampilkan lokasi baris/kolom yang salah di sidebar."""
+    details = "\n".join(f"- Baris {line}, kolom {column}: {message}" for line, column, message in exc.errors)
+    st.sidebar.error(f"Format koordinat salah:\n{details}")
+
 # Parsing input
+original_points = np.array([[0, 0], [1, 1]]) # Titik default aman
+points_key = "default"
+source_image = None
 try:
-    points_list = [tuple(map(float, p.split(','))) for p in point_input.split(';') if p.strip()]
-    if len(points_list) < 2:
-         st.sidebar.error("Masukkan minimal 2 titik (x,y) yang dipisahkan oleh tanda semi-kolon (;).")
-         original_points = np.array([[0, 0], [1, 1]]) # Titik default aman
+    if input_source == "Unggah Gambar":
+        uploaded = st.sidebar.file_uploader("File Gambar", type=IMAGE_TYPES)
+        parsed_points = None
+        if uploaded is not None:
+            image_digest = uploaded_digest(uploaded)
+            with timer.phase("input"):
+                image = load_uploaded_image(image_digest, uploaded.getvalue())
+            image_size = st.sidebar.number_input(
+                "Ukuran Gambar (sisi terpanjang, satuan)", min_value=0.5, max_value=20.0, value=5.0, step=0.5
+            )
+            image_box = image_extent(image.shape, image_size)
+            # Bangun datar = keempat sudut gambar, jadi tabel dan plot tetap berlaku
+            parsed_points = image_corners(image_box)
+            parsed_key = f"gambar:{image_digest}:{image_size}"
+            source_image = (image_digest, image, image_box)
+            st.sidebar.caption(f"{image.shape[1]:,} × {image.shape[0]:,} piksel dari {uploaded.name}")
+            with st.sidebar.expander("🖼️ Pengaturan Resampling"):
+                resampling = st.radio("Metode Interpolasi", RESAMPLING_METHODS, horizontal=True)
+    elif input_source == "Ketik Koordinat":
+        point_input = st.sidebar.text_area(
+            "Masukkan Koordinat Titik (Contoh: x1,y1; x2,y2; ...)",
+            value=default_points
+        )
+        pipeline.feed(text=point_input)
+        with timer.phase("input"):
+            parsed_points = pipeline["parse"]
+        parsed_key = pipeline.key("parse")
+    else:
+        uploaded = st.sidebar.file_uploader(
+            "File Koordinat",
+            type=UPLOAD_TYPES,
+            help="CSV/TXT: dua kolom x,y (header opsional). NPY: array (N, 2). "
+                 "F64/BIN/F32: pasangan float64/float32 little-endian tanpa header."
+        )
+        parsed_points = None
+        if uploaded is not None:
+            with timer.phase("input"):
+                parsed_points = load_uploaded_points(uploaded_digest(uploaded), uploaded.name, uploaded.getvalue())
+            parsed_key = f"file:{uploaded_digest(uploaded)}"
+            st.sidebar.caption(f"{len(parsed_points):,} titik dimuat dari {uploaded.name}")
+    if parsed_points is None:
+        st.sidebar.info("Unggah file untuk memulai.")
+    elif len(parsed_points) < 2:
+        st.sidebar.error("Masukkan minimal 2 titik (x,y) yang dipisahkan oleh tanda semi-kolon (;).")
     else:
-        original_points = np.array(points_list)
-except Exception:
-    st.sidebar.error("Format input koordinat salah. Gunakan format 'x1,y1; x2,y2'.")
-    original_points = np.array([[0, 0], [1, 1]])
+        original_points, points_key = parsed_points, parsed_key
+except CoordinateParseError as exc:
+    show_parse_errors(exc)
 
-# 2. Pilih Transformasi
+# 2. Pilih Transformasi (bisa berupa rantai beberapa transformasi)
 st.sidebar.subheader("2. Pilih Jenis Transformasi")
-transform_type = st.sidebar.selectbox(
-    "Pilih Transformasi:",
-    ("Translasi", "Rotasi", "Refleksi", "Dilatasi")
+n_steps = st.sidebar.number_input(
+    "Jumlah Transformasi Berurutan",
+    min_value=1, max_value=5, value=1, step=1,
+    help="Transformasi diterapkan berurutan dan digabung menjadi satu matriks."
 )
 
 # --- Kontrol Transformasi ---
-params = []
-
-if transform_type == "Translasi":
-    st.sidebar.markdown("---")
-    st.sidebar.subheader("Translasi (Pergeseran)")
-    tx = st.sidebar.slider("Pergeseran pada Sumbu X ($T_x$)", -10.0, 10.0, 2.0, 0.5)
-    ty = st.sidebar.slider("Pergeseran pada Sumbu Y ($T_y$)", -10.0, 10.0, 1.0, 0.5)
-    params = [tx, ty]
-    st.markdown(f"**Translasi** $T=({tx}, {ty})$")
-    
-elif transform_type == "Rotasi":
-    st.sidebar.markdown("---")
-    st.sidebar.subheader("Rotasi (Perputaran)")
-    angle = st.sidebar.slider("Sudut Rotasi (Derajat)", -360, 360, 90, 5)
-    cx = st.sidebar.number_input("Pusat Rotasi X ($C_x$)", value=0.0)
-    cy = st.sidebar.number_input("Pusat Rotasi Y ($C_y$)", value=0.0)
-    params = [angle, cx, cy]
-    st.markdown(f"**Rotasi** sebesar ${angle}^\circ$ terhadap pusat $C({cx}, {cy})$")
-    
-elif transform_type == "Refleksi":
-    st.sidebar.markdown("---")
-    st.sidebar.subheader("Refleksi (Pencerminan)")
-    axis = st.sidebar.selectbox(
-        "Pilih Sumbu Pencerminan:",
-        ("Sumbu X", "Sumbu Y", "Garis y=x")
+def transformation_controls(step):
+    """Widget sidebar untuk satu langkah transformasi; mengembalikan (jenis, params, deskripsi)."""
+    suffix = "" if step == 0 else f" (Langkah {step + 1})"
+    key = f"langkah_{step}"
+    transform_type = st.sidebar.selectbox(
+        f"Pilih Transformasi{suffix}:",
+        ("Translasi", "Rotasi", "Refleksi", "Dilatasi"),
+        key=f"{key}_jenis"
     )
-    params = [axis]
-    st.markdown(f"**Refleksi** terhadap **{axis}**")
-    
-elif transform_type == "Dilatasi":
-    st.sidebar.markdown("---")
-    st.sidebar.subheader("Dilatasi (Perkalian/Pengecilan)")
-    scale = st.sidebar.slider("Faktor Skala ($k$)", 0.1, 5.0, 2.0, 0.1)
-    cx = st.sidebar.number_input("Pusat Dilatasi X ($C_x$)", value=0.0)
-    cy = st.sidebar.number_input("Pusat Dilatasi Y ($C_y$)", value=0.0)
-    params = [scale, cx, cy]
-    st.markdown(f"**Dilatasi** dengan faktor skala $k={scale}$ terhadap pusat $C({cx}, {cy})$")
+    params = []
+    description = ""
+
+    if transform_type == "Translasi":
+        st.sidebar.markdown("---")
+        st.sidebar.subheader(f"Translasi (Pergeseran){suffix}")
+        tx = st.sidebar.slider("Pergeseran pada Sumbu X ($T_x$)", -10.0, 10.0, 2.0, 0.5, key=f"{key}_tx")
+        ty = st.sidebar.slider("Pergeseran pada Sumbu Y ($T_y$)", -10.0, 10.0, 1.0, 0.5, key=f"{key}_ty")
+        params = [tx, ty]
+        description = f"**Translasi** $T=({tx}, {ty})$"
+
+    elif transform_type == "Rotasi":
+        st.sidebar.markdown("---")
+        st.sidebar.subheader(f"Rotasi (Perputaran){suffix}")
+        angle = st.sidebar.slider("Sudut Rotasi (Derajat)", -360, 360, 90, 5, key=f"{key}_sudut")
+        cx = st.sidebar.number_input("Pusat Rotasi X ($C_x$)", value=0.0, key=f"{key}_cx")
+        cy = st.sidebar.number_input("Pusat Rotasi Y ($C_y$)", value=0.0, key=f"{key}_cy")
+        params = [angle, cx, cy]
+        description = f"**Rotasi** sebesar ${angle}^\circ$ terhadap pusat $C({cx}, {cy})$"
+
+    elif transform_type == "Refleksi":
+        st.sidebar.markdown("---")
+        st.sidebar.subheader(f"Refleksi (Pencerminan){suffix}")
+        axis = st.sidebar.selectbox(
+            "Pilih Sumbu Pencerminan:",
+            REFLECTION_AXES,
+            key=f"{key}_sumbu"
+        )
+        params = [axis]
+        description = f"**Refleksi** terhadap **{axis}**"
+        if axis == "Garis y=mx+k":
+            m = st.sidebar.number_input("Gradien Garis ($m$)", value=1.0, step=0.5, key=f"{key}_m")
+            k = st.sidebar.number_input("Titik Potong Sumbu Y ($k$)", value=0.0, step=0.5, key=f"{key}_k")
+            params = [axis, m, k]
+            description = f"**Refleksi** terhadap garis $y = {m}x + {k}$"
+
+    elif transform_type == "Dilatasi":
+        st.sidebar.markdown("---")
+        st.sidebar.subheader(f"Dilatasi (Perkalian/Pengecilan){suffix}")
+        scale = st.sidebar.slider("Faktor Skala ($k$)", 0.1, 5.0, 2.0, 0.1, key=f"{key}_skala")
+        cx = st.sidebar.number_input("Pusat Dilatasi X ($C_x$)", value=0.0, key=f"{key}_dx")
+        cy = st.sidebar.number_input("Pusat Dilatasi Y ($C_y$)", value=0.0, key=f"{key}_dy")
+        params = [scale, cx, cy]
+        description = f"**Dilatasi** dengan faktor skala $k={scale}$ terhadap pusat $C({cx}, {cy})$"
+
+    return transform_type, params, description
+
+steps = []
+for step in range(int(n_steps)):
+    transform_type, params, description = transformation_controls(step)
+    steps.append((transform_type, params))
+    st.markdown(f"{step + 1}. {description}" if n_steps > 1 else description)
+
+# 3. Tampilan: grafik statis atau animasi transisi dari bangun asli ke hasil
+st.sidebar.subheader("3. Tampilan")
+view_mode = st.sidebar.radio("Mode Tampilan", ("Grafik Statis", "Animasi Transisi"), horizontal=True)
+if view_mode == "Animasi Transisi":
+    tween_n_frames = st.sidebar.slider("Jumlah Frame", 20, 120, 60, 10)
+    tween_fps = st.sidebar.slider("Kecepatan (frame/detik)", 10, 60, 30, 5)
+else:
+    renderers = list(viz.backend.RENDERERS)
+    plot_renderer = st.sidebar.selectbox(
+        "Renderer Grafik", renderers, index=renderers.index(PLOT_RENDERER), format_func=viz.backend.RENDERERS.get,
+        help="PNG/SVG dirender Matplotlib di server; Plotly digambar di browser (bisa digeser dan diperbesar)."
+    )
+
+# Zoom area tertentu (label titik muncul bila titik di area cukup sedikit)
+zoom_view = None
+with st.sidebar.expander("🔍 Perbesar Area Grafik"):
+    if st.checkbox("Aktifkan zoom", value=False):
+        zoom_cx = st.number_input("Pusat Area X", value=0.0)
+        zoom_cy = st.number_input("Pusat Area Y", value=0.0)
+        zoom_half = st.number_input("Setengah Lebar Area", min_value=0.01, value=5.0)
+        zoom_view = ((zoom_cx - zoom_half, zoom_cx + zoom_half), (zoom_cy - zoom_half, zoom_cy + zoom_half))
 
 # --- Eksekusi dan Visualisasi ---
 if len(original_points) >= 2:
-    transformed_points = apply_transformation(original_points, transform_type, params)
-    
     # Judul Plot
-    plot_title = f"Visualisasi Transformasi: {transform_type}"
-    
+    plot_title = f"Visualisasi Transformasi: {' → '.join(step_type for step_type, _ in steps)}"
+
+    pipeline.feed(
+        points=Keyed(original_points, points_key),
+        steps=tuple((step_type, tuple(params)) for step_type, params in steps),
+        title=plot_title, view=zoom_view, layers=(),
+    )
+    with timer.phase("compute"):
+        transformed_points, intermediate_points = pipeline["transform"]
+    if source_image is not None:
+        image_digest, image, image_box = source_image
+        pipeline.feed(image=Keyed(image, image_digest), image_box=image_box, resampling=resampling)
+        with timer.phase("compute"), st.spinner("Mentransformasi gambar..."):
+            result_image, result_box = pipeline["image_transform"]
+        # Lapisan gambar (asli transparan di bawah hasil) dikunci dengan kunci tahapnya
+        pipeline.feed(layers=Keyed(
+            ((image, image_box, 0.35), (result_image, result_box, 1.0)), pipeline.key("image_transform")
+        ))
+
     # Tampilkan Plot
-    fig = plot_shape(original_points, transformed_points, plot_title)
-    st.pyplot(fig)
+    if view_mode == "Animasi Transisi":
+        pipeline.feed(n_frames=tween_n_frames, fps=tween_fps)
+        with timer.phase("figure"), st.spinner("Menyiapkan animasi..."):
+            fig = pipeline["tween_layout"]
+        with timer.phase("serialize"):
+            st.plotly_chart(fig, use_container_width=True)
+        timer.record_bytes("plotly", lambda: len(fig.to_json()))
+        n_tween_points = len(subsample(original_points))
+        if n_tween_points < len(original_points):
+            st.caption(f"Animasi memakai {n_tween_points:,} dari {len(original_points):,} titik.")
+    elif plot_renderer == "plotly" and source_image is None:
+        with timer.phase("figure"):
+            fig = pipeline["shape_layout"]
+        with timer.phase("serialize"):
+            st.plotly_chart(fig, use_container_width=True)
+        timer.record_bytes("plotly", lambda: len(fig.to_json()))
+    else:
+        # Digambar dan dirasterisasi ulang hanya bila salah satu input di hulunya berubah
+        pipeline.feed(image_format="png" if plot_renderer == "plotly" else plot_renderer)
+        with timer.phase("figure"):
+            image_data = pipeline["render"]
+        with timer.phase("serialize"):
+            st.image(viz.backend.image_source(image_data, pipeline["image_format"]), use_container_width=True)
+        timer.record_bytes(pipeline["image_format"], len(image_data))
+        if plot_renderer == "plotly":
+            st.caption("Lapisan gambar belum didukung renderer Plotly, jadi grafik ditampilkan sebagai PNG.")
     
     st.subheader("📋 Data Titik Hasil Transformasi")
     
-    # Persiapan data untuk tabel
-    data_table = []
-    for i, (orig, trans) in enumerate(zip(original_points, transformed_points)):
-        data_table.append({
-            "Titik Asli": f"P{i+1}({orig[0]:.2f}, {orig[1]:.2f})",
-            "Titik Transformasi": f"P'{i+1}({trans[0]:.2f}, {trans[1]:.2f})"
-        })
-        
-    st.dataframe(data_table, use_container_width=True)
+    # Tabel numerik per halaman (diurutkan di server); baris lain tidak dibentuk
+    table_cols = st.columns([2, 1, 1, 1])
+    sort_column = table_cols[0].selectbox("Urutkan Berdasarkan", TABLE_COLUMNS, key="tabel_urut")
+    descending = table_cols[1].checkbox("Menurun", value=False, key="tabel_menurun")
+    page_size = table_cols[2].selectbox("Baris per Halaman", PAGE_SIZES, key="tabel_ukuran")
+    n_pages = page_count(len(original_points), page_size)
+    page = table_cols[3].number_input(f"Halaman (1–{n_pages:,})", min_value=1, max_value=n_pages, value=1, step=1, key="tabel_halaman")
+
+    pipeline.feed(sort_column=sort_column, descending=descending, page=int(page) - 1, page_size=page_size)
+    with timer.phase("table"):
+        st.dataframe(
+            pipeline["table_page"],
+            use_container_width=True, hide_index=True,
+            column_config={name: st.column_config.NumberColumn(format="%.2f") for name in TABLE_COLUMNS[1:]}
+        )
+
+    # Ekspor baru dibuat saat tombol diklik; Streamlit menahan seluruh file unduhan sebagai bytes,
+    # jadi memori ekspor sebanding dengan jumlah titik (hanya tabel di layar yang per halaman)
+    export_cols = st.columns(2)
+    export_cols[0].download_button(
+        "⬇️ Unduh CSV", partial(export_csv, original_points, transformed_points),
+        file_name="hasil_transformasi.csv", mime="text/csv", use_container_width=True
+    )
+    export_cols[1].download_button(
+        "⬇️ Unduh Parquet", partial(export_parquet, original_points, transformed_points),
+        file_name="hasil_transformasi.parquet", mime="application/octet-stream", use_container_width=True
+    )
+
+    if len(steps) > 1:
+        with st.expander("🔎 Hasil Antara Tiap Langkah dan Matriks Gabungan"):
+            for step, ((step_type, _), points) in enumerate(zip(steps, intermediate_points)):
+                st.markdown(f"**Langkah {step + 1}: {step_type}**")
+                # Hanya beberapa baris pertama yang dikirim ke browser
+                head = points[:INTERMEDIATE_ROWS]
+                st.dataframe(
+                    {"x": head[:, 0], "y": head[:, 1]},
+                    use_container_width=True, height=150
+                )
+                if len(points) > INTERMEDIATE_ROWS:
+                    st.caption(f"{INTERMEDIATE_ROWS:,} dari {len(points):,} titik ditampilkan.")
+            total_matrix, _ = compose(steps)
+            st.markdown("**Matriks transformasi gabungan (koordinat homogen):**")
+            st.dataframe(np.round(total_matrix, 4), use_container_width=True)
+
+viz.backend.show_gauges()
+pipeline.show_panel()
+perf.show_panel(timer)
+timer.finish()
@@ -0,0 +1,111 @@
+"""Host multipage: keempat lab dalam satu proses Streamlit.
+
+Jalankan dari akar repo:
+    streamlit run streamlit_app.py
+
+Setiap lab tetap berupa skrip ``app.py`` mandiri (masih bisa dijalankan sendiri).
+Host hanya mengimpor Streamlit; NumPy/Matplotlib/Plotly/SciPy dimuat saat halaman
+lab pertama kali dibuka lalu dipakai bersama semua halaman dan sesi, begitu juga
+``st.cache_resource``/``st.cache_data``. ``st.set_page_config`` di setiap lab
+tetap berlaku untuk halamannya sendiri.
+"""
+import sys
+import threading
+import time
+from pathlib import Path
+
+import streamlit as st
+
+ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(ROOT))
+from labcore.perf import rss_bytes
+
+# (folder, judul, ikon, url)
+LABS = (
+    ("gacorrrr", "Fungsi Kuadrat", "🔬", "fungsi-kuadrat"),
+    ("lebihgacorrr", "Dimensi Kelima", "🌌", "dimensi-kelima"),
+    ("plonterrr", "Transformasi Geometri", "📐", "transformasi-geometri"),
+    ("plis bisa", "Luas Persegi", "🟦", "luas-persegi"),
+)
+
+
+# --- Statistik per halaman (dibagi semua sesi dalam proses ini) ---
+
+@st.cache_resource
+def page_stats():
+    """Biaya kunjungan pertama (waktu, RSS, modul baru) dan waktu rerun terakhir per lab."""
+    return {}, threading.Lock()
+
+
+@st.cache_resource
+def compiled_app(path, mtime):
+    """Bytecode app.py lab; dikompilasi ulang hanya bila file berubah."""
+    return compile(path.read_bytes(), str(path), "exec")
+
+
+def run_lab(folder):
+    """Jalankan app.py lab sebagai halaman, seolah-olah skrip utama."""
+    path = ROOT / folder / "app.py"
+    # Modul pendamping lab (misalnya assets.py di lebihgacorrr) diimpor dari foldernya
+    if str(path.parent) not in sys.path:
+        sys.path.insert(0, str(path.parent))
+    code = compiled_app(path, path.stat().st_mtime_ns)
+
+    stats, lock = page_stats()
+    with lock:
+        first = folder not in stats
+    modules_before, rss_before = len(sys.modules), rss_bytes()
+    start = time.perf_counter()
+    try:
+        exec(code, {"__name__": "__main__", "__file__": str(path), "__builtins__": __builtins__})
+    finally:
+        # st.stop()/st.rerun() di dalam lab juga lewat sini
+        elapsed = (time.perf_counter() - start) * 1000
+        rss_after = rss_bytes()
+        with lock:
+            entry = stats.setdefault(folder, {"visits": 0})
+            if first and "first_ms" not in entry:
+                entry["first_ms"] = elapsed
+                entry["new_modules"] = len(sys.modules) - modules_before
+                entry["rss_delta"] = None if rss_before is None else rss_after - rss_before
+            entry["visits"] += 1
+            entry["last_ms"] = elapsed
+
+
+def show_stats():
+    with st.sidebar.expander("📊 Biaya per Halaman"):
+        stats, lock = page_stats()
+        with lock:
+            rows = {folder: dict(entry) for folder, entry in stats.items()}
+        rss = rss_bytes()
+        if rss is not None:
+            st.caption(f"RSS proses: {rss / 1024 ** 2:,.1f} MB")
+        if not rows:
+            st.caption("Belum ada halaman yang dibuka.")
+            return
+        titles = {folder: title for folder, title, _, _ in LABS}
+        table = {"Halaman": [], "Kunjungan": [], "Buka pertama": [], "Modul baru": [], "Δ RSS": [], "Rerun terakhir": []}
+        for folder, entry in rows.items():
+            table["Halaman"].append(titles[folder])
+            table["Kunjungan"].append(entry["visits"])
+            table["Buka pertama"].append(f"{entry.get('first_ms', 0):,.0f} ms")
+            table["Modul baru"].append(entry.get("new_modules", 0))
+            delta = entry.get("rss_delta")
+            table["Δ RSS"].append("-" if delta is None else f"{delta / 1024 ** 2:+,.1f} MB")
+            table["Rerun terakhir"].append(f"{entry['last_ms']:,.0f} ms")
+        st.dataframe(table, hide_index=True, use_container_width=True)
+        st.caption("Δ RSS dan modul baru diukur saat halaman pertama kali dibuka di proses ini; "
+                   "dependensi yang sudah dimuat halaman lain tidak dihitung lagi.")
+
+
+# --- Navigasi ---
+
+def _page(folder, title, icon, url_path):
+    def page():
+        run_lab(folder)
+    return st.Page(page, title=title, icon=icon, url_path=url_path, default=folder == LABS[0][0])
+
+
+navigation = st.navigation([_page(*lab) for lab in LABS])
+show_stats()
+navigation.run()
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Paket labcore ada di akar repo (sama seperti aplikasi lab)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,94 @@
+"""Cache LRU dan kunci tahap pipeline."""
+import numpy as np
+import pytest
+
+from labcore.cache import LRUCache
+from labcore.pipeline import Keyed, Pipeline, StageCache, fingerprint
+
+
+def test_lru_evicts_least_recently_used_by_count():
+    cache = LRUCache(max_entries=2, max_bytes=1000, sizeof=len)
+    cache.put("a", b"1")
+    cache.put("b", b"2")
+    assert cache.get("a") == b"1"
+    cache.put("c", b"3")
+    assert "b" not in cache and "a" in cache and "c" in cache
+    assert cache.stats()["evictions"] == 1
+
+
+def test_lru_respects_byte_limit():
+    cache = LRUCache(max_entries=10, max_bytes=10, sizeof=len)
+    cache.put("a", b"x" * 4)
+    cache.put("b", b"x" * 4)
+    cache.put("c", b"x" * 4)
+    assert "a" not in cache and cache.total_bytes == 8
+    # Entri yang lebih besar dari seluruh kapasitas dikembalikan tetapi tidak disimpan
+    assert cache.put("big", b"x" * 11) == b"x" * 11
+    assert "big" not in cache and cache.total_bytes == 8
+    cache.put("b", b"x")
+    assert cache.total_bytes == 5
+
+
+def test_get_or_create_calls_factory_once():
+    cache = LRUCache(max_entries=4, max_bytes=1000, sizeof=lambda value: 1)
+    calls = []
+    for _ in range(3):
+        cache.get_or_create("k", lambda: calls.append(1) or "nilai")
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+
+
+def test_fingerprint_depends_on_content_not_identity():
+    points = np.arange(6.0).reshape(3, 2)
+    assert fingerprint(points) == fingerprint(points.copy())
+    assert fingerprint(points) != fingerprint(points.astype(np.float32))
+    assert fingerprint(points) != fingerprint(points.reshape(2, 3))
+    assert fingerprint({"b": 1, "a": (2, "x")}) == fingerprint({"a": (2, "x"), "b": 1})
+    assert fingerprint((1, 2)) != fingerprint(((1, 2),))
+    assert fingerprint(Keyed(object(), "abc")) == fingerprint(Keyed(None, "abc"))
+    with pytest.raises(TypeError):
+        fingerprint(object())
+
+
+def make_pipeline(caches, calls):
+    pipeline = Pipeline(*caches)
+
+    @pipeline.stage("double", "points", scope="global")
+    def double(points):
+        calls.append("double")
+        return points * 2
+
+    @pipeline.stage("label", "double", "title")
+    def label(doubled, title):
+        calls.append("label")
+        return f"{title}: {doubled.sum():g}"
+
+    return pipeline
+
+
+def test_pipeline_recomputes_only_downstream_of_changed_inputs():
+    caches, calls = (StageCache(), StageCache()), []
+    points = np.ones((4, 2))
+
+    # Rerun pertama: semua tahap dihitung
+    pipeline = make_pipeline(caches, calls)
+    pipeline.feed(points=points, title="A")
+    assert pipeline["label"] == "A: 16"
+    assert calls == ["double", "label"]
+
+    # Rerun dengan input sama (objek array baru): semuanya dari cache
+    pipeline = make_pipeline(caches, calls)
+    pipeline.feed(points=points.copy(), title="A")
+    assert pipeline["label"] == "A: 16"
+    assert calls == ["double", "label"]
+
+    # Judul berubah: hanya tahap di hilirnya yang dihitung ulang
+    pipeline.feed(title="B")
+    assert pipeline["label"] == "B: 16"
+    assert calls == ["double", "label", "label"]
+
+    # Titik berubah: kedua tahap dihitung ulang
+    pipeline.feed(points=points * 3)
+    assert pipeline["label"] == "B: 48"
+    assert calls == ["double", "label", "label", "double", "label"]
@@ -0,0 +1,75 @@
+"""Hypercube N dimensi dan proyeksinya dibandingkan dengan tesseract versi awal."""
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from labcore.hypercube import hypercube_edge_path, hypercube_edges, hypercube_vertices
+from labcore.projection import perspective_project, rotate_points
+
+# Daftar titik tesseract yang ditulis manual di aplikasi versi awal
+TESSERACT = np.array([
+    [-1, -1, -1, -1], [1, -1, -1, -1], [-1, 1, -1, -1], [1, 1, -1, -1],
+    [-1, -1, 1, -1], [1, -1, 1, -1], [-1, 1, 1, -1], [1, 1, 1, -1],
+    [-1, -1, -1, 1], [1, -1, -1, 1], [-1, 1, -1, 1], [1, 1, -1, 1],
+    [-1, -1, 1, 1], [1, -1, 1, 1], [-1, 1, 1, 1], [1, 1, 1, 1],
+])
+
+
+def baseline_edges(vertices):
+    n = len(vertices)
+    return {
+        (i, j) for i in range(n) for j in range(i + 1, n)
+        if np.sum(np.abs(vertices[i] - vertices[j])) == 2
+    }
+
+
+def baseline_rotate_4d(points, angle_xy, angle_xz, angle_yz):
+    def plane(i, j, angle):
+        theta = np.radians(angle)
+        matrix = np.eye(4)
+        matrix[i, i] = matrix[j, j] = np.cos(theta)
+        matrix[i, j], matrix[j, i] = -np.sin(theta), np.sin(theta)
+        return matrix
+    return (plane(0, 1, angle_xy) @ plane(0, 2, angle_xz) @ plane(1, 2, angle_yz) @ points.T).T
+
+
+def baseline_project(points, w_factor):
+    projected = []
+    for x, y, z, w in points:
+        divisor = w_factor - w
+        projected.append([x, y, z] if divisor == 0 else [x / divisor, y / divisor, z / divisor])
+    return np.array(projected)
+
+
+def test_tesseract_vertices_and_edges_match_baseline():
+    assert np.array_equal(hypercube_vertices(4), TESSERACT)
+    edges, axes = hypercube_edges(4)
+    assert {tuple(sorted(edge)) for edge in edges.tolist()} == baseline_edges(TESSERACT)
+    # Rusuk sejajar sumbu yang tercatat
+    assert np.array_equal(np.abs(TESSERACT[edges[:, 1]] - TESSERACT[edges[:, 0]]).argmax(axis=1), axes)
+
+
+@pytest.mark.parametrize("n", range(1, 11))
+def test_edge_counts(n):
+    edges, _ = hypercube_edges(n)
+    assert len(hypercube_vertices(n)) == 2**n
+    assert len(edges) == n * 2 ** (n - 1)
+
+
+@pytest.mark.parametrize("n", range(1, 11))
+def test_edge_path_covers_each_edge_once(n):
+    path = hypercube_edge_path(n).tolist()
+    edges, _ = hypercube_edges(n)
+    walked = Counter(
+        tuple(sorted((u, v))) for u, v in zip(path, path[1:]) if u >= 0 and v >= 0
+    )
+    assert walked == Counter(tuple(sorted(edge)) for edge in edges.tolist())
+
+
+@pytest.mark.parametrize("w_factor", [0.5, -1.0, 1.0])
+def test_projection_matches_baseline(w_factor):
+    planes = (((0, 1), 45), ((0, 2), 30), ((1, 2), 60))
+    rotated = rotate_points(TESSERACT, planes)
+    assert np.allclose(rotated, baseline_rotate_4d(TESSERACT, 45, 30, 60))
+    assert np.allclose(perspective_project(rotated, w_factor), baseline_project(rotated, w_factor))
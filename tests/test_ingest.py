@@ -0,0 +1,93 @@
+"""Jalur galat pembacaan file koordinat dan file sisi persegi."""
+import io
+
+import numpy as np
+import pytest
+
+from labcore import ingest
+from labcore.ingest import CoordinateParseError, load_upload, parse_text
+from labcore.persegi import SideParseError, load_sides, luas_persegi, parse_sides
+
+
+@pytest.fixture(autouse=True)
+def spool_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(ingest, "CACHE_DIR", tmp_path)
+    return tmp_path
+
+
+def npy_bytes(array):
+    buffer = io.BytesIO()
+    np.save(buffer, array, allow_pickle=True)
+    return buffer.getvalue()
+
+
+def npz_bytes():
+    buffer = io.BytesIO()
+    np.savez(buffer, points=np.zeros((3, 2)))
+    return buffer.getvalue()
+
+
+def test_parse_text_reads_points():
+    assert np.array_equal(parse_text("0,0; 4,0; 4,3"), [[0, 0], [4, 0], [4, 3]])
+
+
+def test_parse_text_reports_bad_value_location():
+    with pytest.raises(CoordinateParseError) as info:
+        parse_text("0,0; 4,x; 4,3")
+    line, column, _ = info.value.errors[0]
+    # Kolom = posisi karakter pada baris (titik ke-2 adalah " 4,x")
+    assert (line, " 4,x"[column - 1]) == (2, "x")
+
+
+def test_csv_with_header_and_npy_load_same_points():
+    points = np.array([[0.0, 1.0], [2.5, -3.0]])
+    assert np.array_equal(load_upload("titik.csv", b"x,y\n0,1\n2.5,-3\n"), points)
+    assert np.array_equal(load_upload("titik.npy", npy_bytes(points)), points)
+
+
+@pytest.mark.parametrize("name, data", [
+    ("rusak.npy", b"\x93NUMPY bukan file npy"),
+    ("arsip.npy", npz_bytes()),
+    ("objek.npy", npy_bytes(np.array([[1, "a"]], dtype=object))),
+    ("teks.npy", npy_bytes(np.array([["1", "2"]]))),
+    ("kolom.npy", npy_bytes(np.zeros((3, 3)))),
+    ("latin1.csv", "x,y\n1,2\n3,\xe9\n".encode("latin-1")),
+    ("huruf.csv", b"1,2\n3,empat\n"),
+    ("ganjil.f64", b"\x00" * 12),
+    ("gambar.png", b"\x89PNG"),
+])
+def test_bad_uploads_raise_parse_error(name, data, spool_dir):
+    with pytest.raises(CoordinateParseError):
+        load_upload(name, data)
+    # File spool yang gagal dibaca tidak disimpan
+    assert not list(spool_dir.glob(f"*{name[name.rindex('.'):]}"))
+
+
+def test_empty_csv_is_empty_without_warning(recwarn):
+    assert load_upload("kosong.csv", b"").shape == (0, 2)
+    assert not recwarn.list
+
+
+def test_luas_persegi_matches_baseline():
+    sides = np.array([0.0, 1.0, 2.5, 10.0])
+    assert np.array_equal(luas_persegi(sides), sides * sides)
+    assert luas_persegi(3) == 9
+
+
+@pytest.mark.parametrize("name, data", [
+    ("arsip.npy", npz_bytes()),
+    ("rusak.npy", b"bukan npy"),
+    ("tabel.npy", npy_bytes(np.zeros((3, 2)))),
+    ("teks.npy", npy_bytes(np.array(["1", "2"]))),
+    ("latin1.csv", "sisi\n1\n\xe9\n".encode("latin-1")),
+])
+def test_bad_side_files_raise_side_error(name, data):
+    with pytest.raises(SideParseError):
+        load_sides(name, data)
+
+
+def test_parse_sides_lists_bad_tokens():
+    assert np.array_equal(load_sides("sisi.npy", npy_bytes(np.array([[1], [2]]))), [1.0, 2.0])
+    with pytest.raises(SideParseError) as info:
+        parse_sides("1, dua, 3; x")
+    assert info.value.errors == [(2, "dua"), (4, "x")]
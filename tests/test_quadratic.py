@@ -0,0 +1,56 @@
+"""Rumus fungsi kuadrat dibandingkan dengan perhitungan aplikasi versi awal."""
+import numpy as np
+import pytest
+
+from labcore.quadratic import X_MAX, X_MIN, compute_metrics, real_roots, vertex, vertices, y_axis_limits
+
+COEFFICIENTS = [(1.0, 0.0, 0.0), (1.5, -2.0, 3.0), (-0.5, 4.0, -1.0), (0.1, 10.0, 10.0), (-5.0, -10.0, 0.5)]
+
+
+def baseline_vertex(a, b, c):
+    if a != 0:
+        x_puncak = -b / (2 * a)
+        return x_puncak, a * x_puncak**2 + b * x_puncak + c
+    return 0, c
+
+
+def baseline_y_limits(a, b, c):
+    # Versi awal: ekstrem dari 400 sampel kurva ditambah buffer
+    x_plot = np.linspace(X_MIN, X_MAX, 400)
+    y_plot = a * x_plot**2 + b * x_plot + c
+    y_buffer = max(1.0, (np.max(y_plot) - np.min(y_plot)) * 0.1)
+    return np.min(y_plot) - y_buffer, np.max(y_plot) + y_buffer
+
+
+@pytest.mark.parametrize("a, b, c", COEFFICIENTS + [(0.0, 2.0, 1.0)])
+def test_vertex_matches_baseline(a, b, c):
+    assert vertex(a, b, c) == pytest.approx(baseline_vertex(a, b, c))
+    assert vertices([a, b, c])[0] == pytest.approx(baseline_vertex(a, b, c))
+
+
+@pytest.mark.parametrize("a, b, c", COEFFICIENTS + [(0.0, 2.0, 1.0)])
+def test_y_axis_limits_cover_sampled_curve(a, b, c):
+    # Batas analitik mencakup semua sampel dan hanya berbeda sedikit dari versi sampel
+    low, high = y_axis_limits(a, b, c)
+    base_low, base_high = baseline_y_limits(a, b, c)
+    assert low <= base_low + 1e-9 and high >= base_high - 1e-9
+    assert low == pytest.approx(base_low, abs=0.05) and high == pytest.approx(base_high, abs=0.05)
+
+
+def test_compute_metrics_uses_same_vertex_and_limits():
+    metrics, x_plot, y_plot = compute_metrics(1.5, -2.0, 3.0)
+    assert (metrics["x_puncak"], metrics["y_puncak"]) == pytest.approx(vertex(1.5, -2.0, 3.0))
+    assert (metrics["ax_min_y"], metrics["ax_max_y"]) == pytest.approx(y_axis_limits(1.5, -2.0, 3.0))
+    assert np.allclose(y_plot, 1.5 * x_plot**2 - 2.0 * x_plot + 3.0)
+
+
+def test_real_roots_solve_the_equation():
+    coeffs = np.array([[1.0, -3.0, 2.0], [1.0, 2.0, 1.0], [1.0, 0.0, 1.0], [-2.0, 1.0, 6.0], [0.0, 2.0, -4.0], [0.0, 0.0, 1.0]])
+    roots = real_roots(coeffs)
+    assert roots[0] == pytest.approx([1.0, 2.0])
+    assert roots[1] == pytest.approx([-1.0, -1.0])
+    assert np.isnan(roots[2]).all()
+    assert roots[3] == pytest.approx(np.sort(np.roots([-2.0, 1.0, 6.0])))
+    # Fungsi linear: satu akar di kolom pertama
+    assert roots[4, 0] == pytest.approx(2.0) and np.isnan(roots[4, 1])
+    assert np.isnan(roots[5]).all()
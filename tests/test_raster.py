@@ -0,0 +1,35 @@
+"""Resampling gambar dengan pemetaan balik."""
+import numpy as np
+import pytest
+
+from labcore.raster import image_extent, transform_image
+from labcore.transforms import dilation_matrix, reflection_matrix, rotation_matrix
+
+
+@pytest.fixture
+def image():
+    return np.random.default_rng(0).integers(0, 256, size=(12, 20, 4), dtype=np.uint8)
+
+
+@pytest.mark.parametrize("method", ["Nearest", "Bilinear"])
+def test_identity_keeps_every_pixel(image, method):
+    extent = image_extent(image.shape)
+    result, result_extent = transform_image(image, np.eye(3), extent, method=method)
+    assert result_extent == pytest.approx(extent)
+    assert np.array_equal(result, image)
+
+
+def test_reflection_and_quarter_turn_permute_pixels(image):
+    extent = image_extent(image.shape)
+    flipped, _ = transform_image(image, reflection_matrix("Sumbu Y"), extent, method="Nearest")
+    assert np.array_equal(flipped, image[:, ::-1])
+    turned, _ = transform_image(image, rotation_matrix(90), extent, method="Nearest")
+    assert np.array_equal(turned, np.rot90(image))
+
+
+def test_small_memory_budget_gives_same_result(image):
+    extent = image_extent(image.shape)
+    matrix = rotation_matrix(30, 1.0, 2.0) @ dilation_matrix(1.7)
+    whole, _ = transform_image(image, matrix, extent)
+    tiled, _ = transform_image(image, matrix, extent, memory_budget=1)
+    assert np.array_equal(whole, tiled)
@@ -0,0 +1,60 @@
+"""Matriks transformasi dibandingkan dengan fungsi per titik di aplikasi versi awal."""
+import numpy as np
+import pytest
+
+from labcore.transforms import apply_chain, apply_transformation, compose
+
+POINTS = np.array([[0.0, 0.0], [4.0, 0.0], [4.0, 3.0], [-1.5, 2.5]])
+
+
+def baseline_transform(point, transformation_type, params):
+    x, y = point
+    if transformation_type == "Translasi":
+        tx, ty = params
+        return x + tx, y + ty
+    if transformation_type == "Rotasi":
+        angle, cx, cy = params
+        theta = np.radians(angle)
+        dx, dy = x - cx, y - cy
+        return dx * np.cos(theta) - dy * np.sin(theta) + cx, dx * np.sin(theta) + dy * np.cos(theta) + cy
+    if transformation_type == "Refleksi":
+        return {"Sumbu X": (x, -y), "Sumbu Y": (-x, y), "Garis y=x": (y, x)}[params[0]]
+    if transformation_type == "Dilatasi":
+        scale, cx, cy = params
+        return (x - cx) * scale + cx, (y - cy) * scale + cy
+    return x, y
+
+
+STEPS = [
+    ("Translasi", (2.0, -1.0)),
+    ("Rotasi", (90.0, 0.0, 0.0)),
+    ("Rotasi", (37.0, 1.0, -2.0)),
+    ("Refleksi", ("Sumbu X",)),
+    ("Refleksi", ("Sumbu Y",)),
+    ("Refleksi", ("Garis y=x",)),
+    ("Dilatasi", (2.5, 1.0, 1.0)),
+]
+
+
+@pytest.mark.parametrize("step", STEPS)
+def test_single_step_matches_baseline(step):
+    expected = np.array([baseline_transform(point, *step) for point in POINTS])
+    assert np.allclose(apply_transformation(POINTS, *step), expected)
+
+
+def test_chain_applies_steps_in_order():
+    transformed, intermediate = apply_chain(POINTS, STEPS)
+    expected = POINTS
+    for step, result in zip(STEPS, intermediate):
+        expected = np.array([baseline_transform(point, *step) for point in expected])
+        assert np.allclose(result, expected)
+    assert np.allclose(transformed, expected)
+    assert np.allclose(compose(STEPS)[0] @ np.append(POINTS[2], 1.0), np.append(expected[2], 1.0))
+
+
+def test_reflection_about_line_is_an_involution():
+    step = ("Refleksi", ("Garis y=mx+k", 0.5, 2.0))
+    twice = apply_transformation(apply_transformation(POINTS, *step), *step)
+    assert np.allclose(twice, POINTS)
+    # Titik pada garis tidak berpindah
+    assert np.allclose(apply_transformation([[2.0, 3.0]], *step), [[2.0, 3.0]])
@@ -0,0 +1 @@
+"""Alat pengembang (benchmark, uji beban, ekspor massal); dijalankan dari akar repo."""
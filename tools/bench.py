@@ -0,0 +1,308 @@
+"""Benchmark jalur komputasi dan render semua lab.
+
+Contoh (dari akar repo):
+    python tools/bench.py -o bench.json                 # jalankan semua, simpan JSON
+    python tools/bench.py --quick -k plonterrr          # ukuran kecil, hanya yang cocok
+    python tools/bench.py --baseline bench.json         # bandingkan dengan hasil tersimpan
+
+Mode perbandingan keluar dengan kode 1 bila ada benchmark yang melambat lebih
+dari ``--threshold`` kali dibanding baseline.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from tools.common import git_commit  # noqa: E402
+
+POINT_SIZES = (10, 1_000, 100_000, 1_000_000)
+QUICK_POINT_SIZES = (10, 1_000)
+DIMENSIONS = (4, 6, 8, 10)
+QUICK_DIMENSIONS = (4, 6)
+
+BENCHMARKS = []
+
+
+def benchmark(name, sizes, quick_sizes=None):
+    """Daftarkan benchmark. Fungsi menerima ukuran input dan mengembalikan callable yang diukur."""
+    def register(setup):
+        BENCHMARKS.append((name, tuple(sizes), tuple(quick_sizes or sizes[:2]), setup))
+        return setup
+    return register
+
+
+def _polygon(n):
+    t = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    return np.column_stack([5 * np.cos(t), 5 * np.sin(t) + np.sin(40 * t)])
+
+
+# --- gacorrrr: fungsi kuadrat ---
+
+@benchmark("gacorrrr.compute_metrics", POINT_SIZES, QUICK_POINT_SIZES)
+def bench_parabola(n):
+    from labcore.quadratic import compute_metrics
+    return lambda: compute_metrics(1.5, -2.0, 3.0, n_samples=n)
+
+
+@benchmark("gacorrrr.evaluate_family", (10, 100, 1_000, 5_000), (10, 100))
+def bench_family(k):
+    from labcore.quadratic import evaluate_family
+    coeffs = np.column_stack([np.linspace(-3, 3, k), np.full(k, 1.0), np.full(k, -2.0)])
+    return lambda: evaluate_family(coeffs)
+
+
+@benchmark("gacorrrr.sweep_slice", (250, 1_000, 2_000), (250,))
+def bench_sweep(resolution):
+    from labcore.quadratic import sweep_slice
+    return lambda: sweep_slice(1.0, resolution=(resolution, resolution))
+
+
+@benchmark("gacorrrr.render_parabola", ("png", "svg"), ("png",))
+def bench_render_parabola(image_format):
+    from labcore.viz.quadratic import render_parabola
+    return lambda: render_parabola(1.5, -2.0, 3.0, image_format)
+
+
+# --- lebihgacorrr: hypercube ---
+
+def _plane_angles(n):
+    from labcore.projection import rotation_planes
+    return tuple((plane, 15.0 * (k + 1)) for k, plane in enumerate(rotation_planes(n)))
+
+
+@benchmark("lebihgacorrr.hypercube_edges", DIMENSIONS, QUICK_DIMENSIONS)
+def bench_edges(n):
+    from labcore.hypercube import hypercube_edges, hypercube_vertices
+
+    def run():
+        # Tanpa cache: yang diukur adalah pembuatan rusuk itu sendiri
+        hypercube_vertices.cache_clear()
+        hypercube_edges.cache_clear()
+        return hypercube_edges(n)
+    return run
+
+
+@benchmark("lebihgacorrr.rotate_points", DIMENSIONS, QUICK_DIMENSIONS)
+def bench_rotate(n):
+    from labcore.hypercube import hypercube_vertices
+    from labcore.projection import rotate_points, rotation_matrix
+    vertices, plane_angles = hypercube_vertices(n), _plane_angles(n)
+
+    def run():
+        rotation_matrix.cache_clear()
+        return rotate_points(vertices, plane_angles)
+    return run
+
+
+@benchmark("lebihgacorrr.perspective_project", DIMENSIONS, QUICK_DIMENSIONS)
+def bench_project(n):
+    from labcore.hypercube import hypercube_vertices
+    from labcore.projection import perspective_project, rotate_points
+    rotated = rotate_points(hypercube_vertices(n), _plane_angles(n))
+    return lambda: perspective_project(rotated, 0.5)
+
+
+@benchmark("lebihgacorrr.build_hypercube_figure", DIMENSIONS, QUICK_DIMENSIONS)
+def bench_hypercube_figure(n):
+    from labcore.hypercube import hypercube_edge_path, hypercube_edges, hypercube_vertices
+    from labcore.projection import perspective_project, rotate_points
+    from labcore.viz.hypercube import build_hypercube_figure
+    projected = perspective_project(rotate_points(hypercube_vertices(n), _plane_angles(n)), 0.5)
+    edges, _ = hypercube_edges(n)
+    path = hypercube_edge_path(n)
+    # Termasuk serialisasi JSON, seperti saat figure dikirim ke browser
+    return lambda: build_hypercube_figure(projected, edges, f"{n}D", path=path).to_json()
+
+
+# --- plonterrr: transformasi geometri ---
+
+@benchmark("plonterrr.apply_transformation", POINT_SIZES, QUICK_POINT_SIZES)
+def bench_transform(n):
+    from labcore.transforms import apply_transformation
+    points = _polygon(n)
+    return lambda: apply_transformation(points, "Rotasi", [30, 1.0, 2.0])
+
+
+@benchmark("plonterrr.parse_text", POINT_SIZES, QUICK_POINT_SIZES)
+def bench_parse(n):
+    from labcore.ingest import parse_text
+    text = "; ".join(f"{x:.3f},{y:.3f}" for x, y in _polygon(n))
+    return lambda: parse_text(text)
+
+
+@benchmark("plonterrr.plot_shape", POINT_SIZES, QUICK_POINT_SIZES)
+def bench_plot_shape(n):
+    from labcore.transforms import apply_transformation
+    from labcore.viz import backend
+    from labcore.viz.geometry import plot_shape
+    points = _polygon(n)
+    transformed = apply_transformation(points, "Dilatasi", [1.5, 0.0, 0.0])
+
+    # Termasuk rasterisasi PNG, seperti yang dikirim ke browser
+    return lambda: backend.render_once(plot_shape(points, transformed, "bench"), "png")
+
+
+@benchmark("plonterrr.shape_plot_update", POINT_SIZES, QUICK_POINT_SIZES)
+def bench_shape_update(n):
+    from labcore.transforms import apply_transformation
+    from labcore.viz import backend
+    from labcore.viz.geometry import ShapePlot
+    points = _polygon(n)
+    transformed = apply_transformation(points, "Dilatasi", [1.5, 0.0, 0.0])
+    plot = ShapePlot()
+
+    # Figure yang sama dipakai ulang (seperti FigurePool per sesi): hanya data artist yang diganti
+    return lambda: backend.to_bytes(plot.update(points, transformed, "bench"), "png")
+
+
+@benchmark("plonterrr.build_shape_figure", POINT_SIZES, QUICK_POINT_SIZES)
+def bench_shape_plotly(n):
+    from labcore.transforms import apply_transformation
+    from labcore.viz.tween import build_shape_figure
+    points = _polygon(n)
+    transformed = apply_transformation(points, "Dilatasi", [1.5, 0.0, 0.0])
+    # Termasuk serialisasi JSON, seperti saat figure dikirim ke browser
+    return lambda: build_shape_figure(points, transformed, "bench").to_json()
+
+
+# --- plis bisa: luas persegi ---
+
+@benchmark("plis_bisa.luas_persegi_batch", POINT_SIZES, QUICK_POINT_SIZES)
+def bench_luas(n):
+    from labcore.persegi import luas_persegi_batch
+    sides = np.linspace(0, 100, n)
+    return lambda: luas_persegi_batch(sides, "cm", "m")
+
+
+# --- Pengukuran ---
+
+def measure(run, min_time=0.2, max_repeats=50, min_sample=0.005):
+    """Waktu (detik) per panggilan sampai min_time tercapai, plus puncak alokasi memori.
+
+    Seperti ``timeit``, kasus yang sangat cepat dipanggil berulang dalam satu
+    sampel (minimal ``min_sample`` detik) agar resolusi timer tidak mendominasi.
+    """
+    t0 = time.perf_counter()
+    run()  # pemanasan (import, cache yang tidak sengaja dikosongkan)
+    number = max(1, int(min_sample / max(time.perf_counter() - t0, 1e-9)))
+    times = []
+    start = time.perf_counter()
+    while len(times) < max_repeats and (len(times) < 3 or time.perf_counter() - start < min_time):
+        gc.collect()
+        t0 = time.perf_counter()
+        for _ in range(number):
+            run()
+        times.append((time.perf_counter() - t0) / number)
+
+    # Memori diukur pada ulangan terpisah agar tracemalloc tidak memengaruhi waktu
+    gc.collect()
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "repeats": len(times),
+        "number": number,
+        "min_s": min(times),
+        "median_s": statistics.median(times),
+        "mean_s": statistics.fmean(times),
+        "peak_bytes": peak,
+    }
+
+
+def run_benchmarks(pattern=None, quick=False, min_time=0.2):
+    results = []
+    for name, sizes, quick_sizes, setup in BENCHMARKS:
+        if pattern and pattern not in name:
+            continue
+        for size in quick_sizes if quick else sizes:
+            result = {"name": name, "size": size, **measure(setup(size), min_time)}
+            results.append(result)
+            print(
+                f"{name:<40} {str(size):>9}  {result['median_s'] * 1000:10.3f} ms"
+                f"  {result['peak_bytes'] / 1024 ** 2:8.2f} MB",
+                file=sys.stderr,
+            )
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "quick": quick,
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, threshold=1.25):
+    """Bandingkan median waktu dengan baseline; mengembalikan daftar benchmark yang melambat."""
+    previous = {(r["name"], str(r["size"])): r for r in baseline["results"]}
+    regressions = []
+    print(f"\n{'benchmark':<40} {'ukuran':>9} {'baseline':>11} {'sekarang':>11} {'rasio':>7}  memori")
+    for result in current["results"]:
+        key = (result["name"], str(result["size"]))
+        if key not in previous:
+            continue
+        old = previous[key]
+        ratio = result["median_s"] / old["median_s"] if old["median_s"] else float("inf")
+        memory_ratio = result["peak_bytes"] / old["peak_bytes"] if old["peak_bytes"] else 1.0
+        flag = ""
+        if ratio > threshold:
+            flag = "  << LEBIH LAMBAT"
+            regressions.append({**result, "ratio": ratio})
+        print(
+            f"{key[0]:<40} {key[1]:>9} {old['median_s'] * 1000:9.3f}ms {result['median_s'] * 1000:9.3f}ms"
+            f" {ratio:6.2f}x  {memory_ratio:5.2f}x{flag}"
+        )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark jalur komputasi dan render semua lab.")
+    parser.add_argument("-k", "--filter", help="Hanya benchmark yang namanya memuat teks ini")
+    parser.add_argument("--quick", action="store_true", help="Ukuran input kecil saja (untuk cek cepat)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Durasi minimum pengukuran per kasus (detik)")
+    parser.add_argument("-o", "--output", help="Simpan hasil sebagai JSON ke file ini")
+    parser.add_argument("--baseline", help="File JSON hasil sebelumnya untuk dibandingkan")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="Rasio waktu terhadap baseline yang dianggap regresi (default 1.25)")
+    parser.add_argument("--list", action="store_true", help="Tampilkan daftar benchmark lalu keluar")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, sizes, quick_sizes, _ in BENCHMARKS:
+            print(f"{name:<40} ukuran {sizes} (quick {quick_sizes})")
+        return 0
+
+    current = run_benchmarks(args.filter, args.quick, args.min_time)
+    if args.output:
+        Path(args.output).write_text(json.dumps(current, indent=2), encoding="utf-8")
+    elif not args.baseline:
+        json.dump(current, sys.stdout, indent=2)
+        print()
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare(current, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark melambat lebih dari {args.threshold}x dibanding baseline.")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
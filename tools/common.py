@@ -0,0 +1,15 @@
+"""Fungsi bantu bersama untuk skrip di ``tools/``."""
+import subprocess
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def git_commit():
+    """Hash commit singkat HEAD (None bila bukan repo git)."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
@@ -0,0 +1,455 @@
+"""Ekspor massal grafik dan tabel data lab tanpa Streamlit (untuk lembar kerja).
+
+Manifest berupa CSV atau JSON (daftar objek, atau ``{"jobs": [...]}``); satu
+baris = satu pekerjaan dengan kolom ``lab`` dan parameternya:
+
+    lab        parameter
+    parabola   a, b, c                              (gacorrrr)
+    bangun     points, steps, title                 (plonterrr)
+    hypercube  n, angles, perspective, color_by_axis, title  (lebihgacorrr)
+
+Kolom opsional untuk semua lab: ``id`` (nama file keluaran; bawaan = hash isi
+parameter) dan ``format`` (``png``/``svg``, atau ``html`` Plotly interaktif untuk
+hypercube; plotly.js disematkan kecuali dengan ``--plotlyjs cdn``). Contoh baris CSV:
+
+    lab,a,b,c,points,steps,n,angles
+    parabola,1,-2,-3,,,,
+    bangun,,,,"0,0; 4,0; 4,3","Translasi(2, 1); Rotasi(90, 0, 0)",,
+    hypercube,,,,,,5,"XY=30; XW=45"
+
+``steps`` juga boleh berupa daftar JSON ``[["Refleksi", ["Sumbu X"]], ...]`` dan
+``angles`` berupa objek ``{"XY": 30, "XW": 45}``.
+
+Pekerjaan dijalankan di pool proses; tiap worker memuat Matplotlib/Plotly dan
+figure bangun sekali saja lalu memakainya untuk semua pekerjaannya. Berkas
+ditulis begitu satu pekerjaan selesai dan dicatat di ``ledger.jsonl``, sehingga
+ekspor yang terputus bisa dilanjutkan: pekerjaan yang sudah berhasil dilewati.
+
+Contoh (dari akar repo):
+    python tools/export.py lembar.csv -o ekspor
+    python tools/export.py lembar.json -o ekspor -j 4 --format svg
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from labcore.pipeline import fingerprint  # noqa: E402
+
+LABS = ("parabola", "bangun", "hypercube")
+FORMATS = {
+    "parabola": ("png", "svg"),
+    "bangun": ("png", "svg"),
+    # Plotly tidak bisa membuat gambar statis tanpa kaleido, jadi PNG/SVG digambar Matplotlib
+    "hypercube": ("png", "svg", "html"),
+}
+LEDGER_NAME = "ledger.jsonl"
+
+# Nilai bawaan sama dengan kontrol awal di aplikasi
+DEFAULT_ANGLES = {"XY": 45, "XZ": 45, "YZ": 45}
+DEFAULT_PERSPECTIVE = 0.5
+
+_STEP_PATTERN = re.compile(r"(\w+)\s*\(([^)]*)\)")
+
+
+# --- Manifest ---
+
+def read_manifest(path):
+    """Daftar pekerjaan (dict) dari file CSV atau JSON; sel CSV kosong dianggap tidak diisi."""
+    path = Path(path)
+    text = path.read_text(encoding="utf-8-sig")
+    if path.suffix.lower() == ".json":
+        jobs = json.loads(text)
+        if isinstance(jobs, dict):
+            jobs = jobs["jobs"]
+    else:
+        jobs = [
+            {name.strip(): value.strip() for name, value in row.items() if name and value and value.strip()}
+            for row in csv.DictReader(io.StringIO(text))
+        ]
+    return [job for job in jobs if job]
+
+
+def job_id(job):
+    """Nama keluaran pekerjaan: kolom ``id`` atau hash isi parameternya (stabil antar-run)."""
+    if job.get("id") not in (None, ""):
+        return re.sub(r"[^\w.-]", "_", str(job["id"]))
+    params = {name: value for name, value in job.items() if name != "id"}
+    return f"{job['lab']}-{fingerprint(params)[:12]}"
+
+
+def _number(text):
+    try:
+        return float(text)
+    except ValueError:
+        return text.strip()
+
+
+def parse_steps(steps):
+    """Rantai transformasi dari ``"Translasi(2, 1); Rotasi(90, 0, 0)"`` atau daftar JSON."""
+    if isinstance(steps, str):
+        if steps.lstrip().startswith("["):
+            steps = json.loads(steps)
+        else:
+            steps = [
+                (name, [_number(arg) for arg in args.split(",") if arg.strip()])
+                for name, args in _STEP_PATTERN.findall(steps)
+            ]
+    chain = tuple((name, tuple(params)) for name, params in steps)
+    unknown = [name for name, _ in chain if name not in ("Translasi", "Rotasi", "Refleksi", "Dilatasi")]
+    if unknown:
+        raise ValueError(f"jenis transformasi tidak dikenal: {', '.join(unknown)}")
+    return chain
+
+
+def parse_angles(angles, n):
+    """Tuple ``((i, j), sudut)`` dari ``"XY=30; XW=45"`` atau ``{"XY": 30}``; bidang di luar N dilewati."""
+    from labcore.projection import AXIS_NAMES
+
+    if isinstance(angles, str):
+        # Spasi di sekitar "=" diabaikan ("XY = 30"); entri dipisah titik koma, koma, atau spasi
+        items = [item for item in re.split(r"[;,\s]+", re.sub(r"\s*=\s*", "=", angles.strip())) if item]
+        bad = [item for item in items if item.count("=") != 1]
+        if bad:
+            raise ValueError(f"sudut rotasi {bad[0]!r} harus berbentuk BIDANG=SUDUT, misalnya XY=30")
+        angles = dict(item.split("=", 1) for item in items)
+    plane_angles = []
+    for name, angle in angles.items():
+        name = name.strip().upper()
+        if len(name) != 2 or name[0] == name[1] or any(axis not in AXIS_NAMES for axis in name):
+            raise ValueError(f"bidang rotasi tidak dikenal: {name!r}")
+        try:
+            angle = float(angle)
+        except (TypeError, ValueError):
+            raise ValueError(f"sudut untuk bidang {name} bukan angka: {angle!r}") from None
+        plane = tuple(sorted(AXIS_NAMES.index(axis) for axis in name))
+        if plane[1] < n:
+            plane_angles.append((plane, angle))
+    return tuple(plane_angles)
+
+
+def _flag(value):
+    return value if isinstance(value, bool) else str(value).strip().lower() in ("1", "true", "ya", "yes")
+
+
+# --- Worker ---
+# State per proses worker: pustaka grafik dimuat dan figure bangun dibuat sekali saja
+
+_worker = {}
+
+
+def warm_worker():
+    """Initializer pool: muat Matplotlib/Plotly dan siapkan figure yang dipakai ulang."""
+    from labcore.viz import backend, geometry, hypercube, quadratic  # noqa: F401
+
+    _worker["pool"] = backend.FigurePool()
+    # Render kecil pertama memuat font dan kanvas Agg agar pekerjaan pertama tidak lebih lambat
+    quadratic.render_parabola(1.0, 0.0, 0.0)
+
+
+def _write(path, data):
+    """Tulis atomik: berkas setengah jadi tidak pernah terlihat dengan nama akhirnya."""
+    temporary = path.with_name(path.name + ".tmp")
+    temporary.write_bytes(data.encode("utf-8") if isinstance(data, str) else data)
+    os.replace(temporary, path)
+
+
+def _table_csv(header, columns):
+    buffer = io.StringIO()
+    np.savetxt(buffer, np.column_stack(columns), delimiter=",", header=",".join(header), comments="", fmt="%.10g")
+    return buffer.getvalue()
+
+
+def export_parabola(job, image_format):
+    from labcore.quadratic import compute_metrics, real_roots
+    from labcore.viz.quadratic import render_parabola
+
+    a, b, c = (float(job[name]) for name in ("a", "b", "c"))
+    result = render_parabola(a, b, c, image_format)
+    _, x_plot, y_plot = compute_metrics(a, b, c)
+    roots = real_roots([a, b, c])
+    metrics = {**result["metrics"], "diskriminan": b * b - 4 * a * c, "akar": [float(r) for r in np.ravel(roots) if np.isfinite(r)]}
+    return result["image"], _table_csv(("x", "f(x)"), (x_plot, y_plot)), metrics
+
+
+def export_shape(job, image_format):
+    from labcore.ingest import parse_text
+    from labcore.table import export_csv
+    from labcore.transforms import apply_chain
+    from labcore.viz import backend, geometry
+
+    points = parse_text(job["points"])
+    if len(points) < 2:
+        raise ValueError("bangun membutuhkan minimal 2 titik")
+    steps = parse_steps(job.get("steps", ()))
+    transformed, _ = apply_chain(points, steps)
+    title = job.get("title") or f"Visualisasi Transformasi: {' → '.join(name for name, _ in steps) or 'Identitas'}"
+    plot = _worker["pool"].get("bangun", geometry.ShapePlot)[0]
+    image = backend.to_bytes(plot.update(points, transformed, title), image_format)
+    return image, export_csv(points, transformed), {"titik": len(points), "langkah": len(steps)}
+
+
+def hypercube_figure(projected, edges, axes, title, color_by_axis=False):
+    """Figure Matplotlib 3D setara ``viz.hypercube.build_hypercube_figure`` (untuk PNG/SVG)."""
+    from mpl_toolkits.mplot3d.art3d import Line3DCollection
+
+    from labcore.projection import AXIS_NAMES
+    from labcore.viz import backend
+    from labcore.viz.hypercube import AXIS_COLORS
+
+    fig, ax = backend.new_figure((7, 7), subplot_kw={"projection": "3d"})
+    colors = [AXIS_COLORS[k % len(AXIS_COLORS)] for k in axes] if color_by_axis else "#636EFA"
+    ax.add_collection3d(Line3DCollection(projected[edges], colors=colors, linewidths=1.2))
+    ax.scatter(*projected.T, color="red", s=8, depthshade=False)
+    limit = float(np.abs(projected).max()) or 1.0
+    for set_limit in (ax.set_xlim, ax.set_ylim, ax.set_zlim):
+        set_limit(-limit, limit)
+    ax.set_box_aspect((1, 1, 1))
+    ax.set_xlabel("X")
+    ax.set_ylabel("Y")
+    ax.set_zlabel("Z")
+    ax.set_title(title)
+    if color_by_axis:
+        from matplotlib.lines import Line2D
+
+        ax.legend(handles=[
+            Line2D([], [], color=AXIS_COLORS[k % len(AXIS_COLORS)], label=f"Rusuk sumbu {AXIS_NAMES[k]}")
+            for k in range(int(axes.max()) + 1)
+        ], loc="upper left", fontsize=8)
+    return fig
+
+
+def export_hypercube(job, image_format, plotlyjs="inline"):
+    from labcore.hypercube import hypercube_edge_path, hypercube_edges, hypercube_vertices
+    from labcore.projection import AXIS_NAMES, perspective_project, rotate_points
+    from labcore.viz import backend
+    from labcore.viz.hypercube import build_hypercube_figure
+
+    n = int(float(job.get("n", 4)))
+    planes = parse_angles(job.get("angles", DEFAULT_ANGLES), n)
+    w_factor = float(job.get("perspective", DEFAULT_PERSPECTIVE))
+    color_by_axis = _flag(job.get("color_by_axis", False))
+    vertices = hypercube_vertices(n)
+    projected = perspective_project(rotate_points(vertices, planes), w_factor)
+    edges, axes = hypercube_edges(n)
+    title = job.get("title") or f"Proyeksi Hypercube {n}D ({len(projected)} titik, {len(edges)} rusuk) ke Ruang 3D"
+
+    if image_format == "html":
+        fig = build_hypercube_figure(
+            projected, edges, title, axes=axes if color_by_axis else None, path=hypercube_edge_path(n)
+        )
+        # "inline" = plotly.js ikut disematkan (~4.6 MB) sehingga berkas bisa dibuka tanpa internet
+        image = fig.to_html(include_plotlyjs=True if plotlyjs == "inline" else "cdn", full_html=True)
+    else:
+        image = backend.render_once(hypercube_figure(projected, edges, axes, title, color_by_axis), image_format)
+    header = ("No", *AXIS_NAMES[:n], "X'", "Y'", "Z'")
+    table = _table_csv(header, (np.arange(1, len(vertices) + 1), vertices, projected))
+    return image, table, {"titik": len(vertices), "rusuk": len(edges)}
+
+
+EXPORTERS = {"parabola": export_parabola, "bangun": export_shape, "hypercube": export_hypercube}
+
+
+def run_job(job, name, output_dir, default_format, plotlyjs="inline"):
+    """Kerjakan satu pekerjaan dan tulis berkasnya; mengembalikan catatan untuk ledger."""
+    start = time.perf_counter()
+    record = {"id": name, "lab": job.get("lab")}
+    try:
+        if job.get("lab") not in EXPORTERS:
+            raise ValueError(f"lab harus salah satu dari {LABS}, bukan {job.get('lab')!r}")
+        image_format = str(job.get("format", default_format)).lower()
+        if image_format not in FORMATS[job["lab"]]:
+            raise ValueError(f"format untuk {job['lab']} harus salah satu dari {FORMATS[job['lab']]}")
+        # Hanya ekspor HTML (hypercube) yang memakai pilihan plotly.js
+        options = {"plotlyjs": plotlyjs} if image_format == "html" else {}
+        image, table, metrics = EXPORTERS[job["lab"]](job, image_format, **options)
+        folder = Path(output_dir) / job["lab"]
+        folder.mkdir(parents=True, exist_ok=True)
+        outputs = [folder / f"{name}.{image_format}", folder / f"{name}.csv"]
+        _write(outputs[0], image)
+        _write(outputs[1], table)
+        record.update(status="ok", outputs=[str(path.relative_to(output_dir)) for path in outputs], metrics=metrics)
+    except Exception as exc:  # noqa: BLE001 - satu pekerjaan gagal tidak menghentikan ekspor
+        record.update(status="gagal", error=f"{type(exc).__name__}: {exc}")
+    record["ms"] = (time.perf_counter() - start) * 1000
+    return record
+
+
+# --- Ledger dan Ringkasan ---
+
+def read_ledger(output_dir):
+    """Catatan terakhir per pekerjaan dari ledger (baris rusak akibat putus di tengah dilewati)."""
+    records = {}
+    path = Path(output_dir) / LEDGER_NAME
+    if path.exists():
+        for line in path.read_text(encoding="utf-8").splitlines():
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            records[record["id"]] = record
+    return records
+
+
+def is_done(record, output_dir):
+    return record["status"] == "ok" and all((Path(output_dir) / name).exists() for name in record["outputs"])
+
+
+def write_summaries(records, output_dir, ids):
+    """``ringkasan_<lab>.csv``: satu baris metrik per pekerjaan manifest ini (``ids``) yang berhasil."""
+    for lab in LABS:
+        rows = [
+            record for record in records.values()
+            if record["id"] in ids and record["lab"] == lab and record["status"] == "ok"
+        ]
+        path = Path(output_dir) / f"ringkasan_{lab}.csv"
+        if not rows:
+            # Ringkasan dari manifest sebelumnya tidak boleh tertinggal
+            path.unlink(missing_ok=True)
+            continue
+        fields = ["id", *rows[0]["metrics"], "gambar", "tabel"]
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fields, extrasaction="ignore")
+        writer.writeheader()
+        for record in sorted(rows, key=lambda record: record["id"]):
+            writer.writerow({"id": record["id"], **record["metrics"], "gambar": record["outputs"][0], "tabel": record["outputs"][1]})
+        _write(path, buffer.getvalue())
+
+
+class Progress:
+    """Baris kemajuan di stderr: jumlah selesai, laju, dan perkiraan sisa waktu."""
+
+    def __init__(self, total, interval=0.5):
+        self.total = total
+        self.done = self.failed = 0
+        self.interval = interval if sys.stderr.isatty() else 5.0
+        self.start = self.last = time.perf_counter()
+
+    def update(self, record):
+        self.done += 1
+        self.failed += record["status"] != "ok"
+        now = time.perf_counter()
+        if now - self.last >= self.interval or self.done == self.total:
+            self.last = now
+            print(self.line(), end="\r" if sys.stderr.isatty() else "\n", file=sys.stderr, flush=True)
+
+    def rate(self):
+        elapsed = time.perf_counter() - self.start
+        return self.done / elapsed if elapsed else 0.0
+
+    def line(self):
+        rate = self.rate()
+        remaining = (self.total - self.done) / rate if rate else float("inf")
+        return (
+            f"[{self.done}/{self.total}] {100 * self.done / max(self.total, 1):3.0f}%  {rate:6.1f} pekerjaan/s"
+            f"  sisa ~{remaining:5.0f} s  gagal {self.failed}"
+        )
+
+
+def run_export(jobs, output_dir, workers=None, default_format="png", resume=True, plotlyjs="inline"):
+    """Jalankan semua pekerjaan yang belum selesai; mengembalikan ringkasan per lab."""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    records = read_ledger(output_dir) if resume else {}
+
+    pending, seen = [], set()
+    for job in jobs:
+        name = job_id(job)
+        if name in seen:
+            continue
+        seen.add(name)
+        if not (name in records and is_done(records[name], output_dir)):
+            pending.append((job, name))
+    print(f"{len(seen)} pekerjaan, {len(seen) - len(pending)} sudah selesai, {len(pending)} dikerjakan.", file=sys.stderr)
+
+    progress = Progress(len(pending))
+    workers = workers or os.cpu_count() or 1
+    # Antrian dibatasi agar manifest besar tidak diserialisasi ke pool sekaligus
+    window = workers * 4
+    jobs_iter = iter(pending)
+    with open(output_dir / LEDGER_NAME, "a", encoding="utf-8") as ledger, \
+            ProcessPoolExecutor(workers, initializer=warm_worker) as pool:
+        running = set()
+        try:
+            while True:
+                for job, name in jobs_iter:
+                    running.add(pool.submit(run_job, job, name, output_dir, default_format, plotlyjs))
+                    if len(running) >= window:
+                        break
+                if not running:
+                    break
+                finished, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    record = future.result()
+                    records[record["id"]] = record
+                    ledger.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    ledger.flush()
+                    progress.update(record)
+        except KeyboardInterrupt:
+            # Pekerjaan yang belum tercatat di ledger akan dikerjakan lagi saat dilanjutkan
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    write_summaries(records, output_dir, seen)
+    per_lab = {}
+    for record in records.values():
+        if record["id"] in seen:
+            stats = per_lab.setdefault(record["lab"], {"ok": 0, "gagal": 0, "ms": []})
+            stats["ok" if record["status"] == "ok" else "gagal"] += 1
+            stats["ms"].append(record["ms"])
+    return {
+        "jobs": len(seen),
+        "processed": progress.done,
+        "failed": progress.failed,
+        "wall_s": time.perf_counter() - progress.start,
+        "throughput": progress.rate(),
+        "labs": per_lab,
+        "errors": [record for record in records.values() if record["id"] in seen and record["status"] != "ok"],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ekspor massal grafik dan tabel data lab dari manifest CSV/JSON.")
+    parser.add_argument("manifest", help="File manifest .csv atau .json")
+    parser.add_argument("-o", "--output", default="ekspor", help="Folder keluaran (default: ekspor)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Jumlah proses worker (default: jumlah CPU)")
+    parser.add_argument("--format", default="png", choices=("png", "svg", "html"),
+                        help="Format gambar bila kolom format kosong (html hanya untuk hypercube)")
+    parser.add_argument("--plotlyjs", default="inline", choices=("inline", "cdn"),
+                        help="plotly.js di berkas HTML: disematkan (bisa dibuka offline) atau dimuat dari CDN")
+    parser.add_argument("--restart", action="store_true", help="Abaikan ledger dan kerjakan ulang semuanya")
+    args = parser.parse_args(argv)
+
+    jobs = read_manifest(args.manifest)
+    try:
+        summary = run_export(jobs, args.output, args.workers, args.format, resume=not args.restart,
+                             plotlyjs=args.plotlyjs)
+    except KeyboardInterrupt:
+        print("\nDihentikan. Jalankan perintah yang sama lagi untuk melanjutkan.", file=sys.stderr)
+        return 130
+
+    print(f"\n{'lab':<12} {'ok':>6} {'gagal':>6} {'rata-rata':>11}")
+    for lab, stats in summary["labs"].items():
+        print(f"{lab:<12} {stats['ok']:>6} {stats['gagal']:>6} {np.mean(stats['ms']):>9.0f}ms")
+    print(
+        f"\n{summary['processed']} pekerjaan dikerjakan dalam {summary['wall_s']:.1f} s "
+        f"({summary['throughput']:.1f} pekerjaan/s); hasil di {args.output}"
+    )
+    for record in summary["errors"][:10]:
+        print(f"  ! {record['id']}: {record['error']}")
+    return 1 if summary["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
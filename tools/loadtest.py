@@ -0,0 +1,338 @@
+"""Uji beban lokal: banyak sesi per lab, dijalankan tanpa browser.
+
+Setiap sesi adalah ``AppTest`` Streamlit yang memutar skenario interaksi
+(slider, pilihan, input teks) dengan nilai acak yang dibatasi ke grid widget.
+AppTest tidak aman dipakai lintas thread, jadi sesi-sesi dalam satu proses
+worker hidup bersamaan (berbagi cache dan memori proses seperti di satu server
+Streamlit) tetapi rerun-nya dijalankan berurutan secara bergiliran
+(round-robin). Throughput yang dilaporkan adalah rerun berurutan per detik,
+bukan beban serentak; beban paralel hanya datang dari beberapa proses worker
+(``--processes``) di inti CPU yang berbeda.
+
+Contoh (dari akar repo):
+    python tools/loadtest.py --sessions 200 --steps 5 -o beban.json
+    python tools/loadtest.py -k plonterrr --sessions 50 --processes 2
+    python tools/loadtest.py --sessions 200 --baseline beban.json
+
+Laporan per lab: persentil latensi rerun, throughput berurutan, CPU, RSS puncak, dan
+perkiraan jumlah siswa per proses (hukum Little dengan ``--think-time``).
+Mode perbandingan keluar dengan kode 1 bila p95 atau throughput berurutan memburuk
+lebih dari ``--threshold`` kali dibanding baseline.
+"""
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import sys
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from tools.common import git_commit  # noqa: E402
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def _polygon_text(n):
+    t = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    return "; ".join(f"{5 * np.cos(a):.2f},{5 * np.sin(a):.2f}" for a in t)
+
+
+# --- Skenario ---
+# (jenis widget, label atau awalan key, nilai yang boleh dipilih; None = acak sesuai grid widget).
+# Aksi dijalankan bergiliran; widget yang tidak ada di halaman saat itu diganti rerun biasa.
+
+SCENARIOS = {
+    "gacorrrr": ("gacorrrr/app.py", (
+        ("slider", "1. Nilai Koefisien a", None),
+        ("slider", "2. Nilai Koefisien b", None),
+        ("slider", "3. Nilai Koefisien c", None),
+        ("radio", "Mode Render Grafik", None),
+        ("selectbox", "Renderer Grafik", ("png",) * 3 + ("svg", "plotly")),
+        ("slider", "1. Nilai Koefisien a", None),
+        ("radio", "Mode Lab", ("Grafik Tunggal",) * 4 + ("Keluarga Kurva", "Sapuan Parameter")),
+    )),
+    "lebihgacorrr": ("lebihgacorrr/app.py", (
+        ("slider", "Rotasi (XY)", None),
+        ("slider", "Perspektif Dimensi ke-4 (W)", None),
+        ("slider", "Rotasi (XZ)", None),
+        ("selectbox", "Dimensi Hypercube", None),
+        ("slider", "Posisi Hyper-Pisau", None),
+        ("selectbox", "Dimensi Hypercube yang Diiris", None),
+        ("checkbox", "Warnai Rusuk Menurut Sumbu", None),
+    )),
+    "plonterrr": ("plonterrr/app.py", (
+        ("slider", "langkah_0_", None),
+        ("text_area", "Masukkan Koordinat Titik (Contoh: x1,y1; x2,y2; ...)",
+         ("1,1; 3,1; 3,3; 1,3", "0,0; 4,0; 2,3", _polygon_text(200), _polygon_text(5000))),
+        ("selectbox", "langkah_0_jenis", None),
+        ("slider", "langkah_0_", None),
+        ("selectbox", "tabel_urut", None),
+        ("checkbox", "tabel_menurun", None),
+        ("selectbox", "Renderer Grafik", ("png",) * 3 + ("svg", "plotly")),
+        ("radio", "Mode Tampilan", ("Grafik Statis",) * 3 + ("Animasi Transisi",)),
+    )),
+    "plis_bisa": ("plis bisa/app.py", (
+        ("number_input", "Masukkan panjang sisi persegi (satuan)", tuple(k / 2 for k in range(200))),
+        ("button", "Hitung Luas", None),
+        ("radio", "Mode", ("Satu Persegi",) * 3 + ("Banyak Persegi (Batch)",)),
+        ("text_area", "Daftar panjang sisi (pisahkan dengan spasi, koma, atau baris baru)",
+         ("1, 2.5, 3, 10", " ".join(str(k) for k in range(1000)), "-1, 2, x")),
+    )),
+}
+
+
+def _find(at, kind, name):
+    """Widget jenis ``kind`` dengan label ``name`` atau key yang diawali ``name``."""
+    return [
+        widget for widget in getattr(at, kind)
+        if widget.label == name or (widget.key or "").startswith(name)
+    ]
+
+
+def _grid_value(widget, rng):
+    steps = int(round((widget.max - widget.min) / widget.step))
+    value = widget.min + widget.step * rng.randint(0, steps)
+    return type(widget.value)(round(value, 10))
+
+
+def perform(at, action, rng):
+    """Jalankan satu aksi pada sesi; mengembalikan False bila widgetnya tidak ada (hanya rerun)."""
+    kind, name, values = action
+    widgets = _find(at, kind, name)
+    if not widgets:
+        at.run()
+        return False
+    widget = rng.choice(widgets)
+    if kind == "slider":
+        if isinstance(widget.value, tuple):  # slider rentang: biarkan
+            widget.run()
+        else:
+            widget.set_value(rng.choice(values) if values else _grid_value(widget, rng)).run()
+    elif kind == "selectbox" and values is None:
+        widget.select_index(rng.randrange(len(widget.options))).run()
+    elif kind == "radio" and values is None:
+        widget.set_value(rng.choice(widget.options)).run()
+    elif kind == "checkbox":
+        widget.set_value(not widget.value).run()
+    elif kind == "button":
+        widget.click().run()
+    else:
+        widget.set_value(rng.choice(values)).run()
+    return True
+
+
+# --- Worker (satu proses = satu "server") ---
+
+def run_worker(app, n_sessions, steps, seed, timeout):
+    """Buka ``n_sessions`` sesi lalu jalankan ``steps`` aksi per sesi secara bergiliran."""
+    warnings.filterwarnings("ignore")
+    logging.disable(logging.WARNING)
+    from labcore.perf import rss_bytes
+    from streamlit.testing.v1 import AppTest
+
+    path, actions = SCENARIOS[app]
+    rng = random.Random(seed)
+    rss_start = rss_bytes()
+    usage_start = resource.getrusage(resource.RUSAGE_SELF)
+    wall_start = time.perf_counter()
+
+    sessions, open_ms = [], []
+    for _ in range(n_sessions):
+        at = AppTest.from_file(str(ROOT / path), default_timeout=timeout)
+        start = time.perf_counter()
+        at.run()
+        open_ms.append((time.perf_counter() - start) * 1000)
+        sessions.append(at)
+    rss_sessions = rss_bytes()
+
+    latencies, errors, skipped = [], [], 0
+    for step in range(steps):
+        for index, at in enumerate(sessions):
+            # Tiap sesi mulai dari aksi yang berbeda agar beban tidak seragam
+            action = actions[(index + step) % len(actions)]
+            start = time.perf_counter()
+            try:
+                skipped += not perform(at, action, rng)
+            except Exception as exc:  # noqa: BLE001 - kegagalan sesi dicatat, bukan menghentikan uji
+                errors.append(f"{action[1]}: {type(exc).__name__}: {exc}")
+                continue
+            latencies.append((time.perf_counter() - start) * 1000)
+            if at.exception:
+                errors.append(f"{action[1]}: {at.exception[0].value}")
+
+    wall = time.perf_counter() - wall_start
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    # ru_maxrss: KB di Linux, byte di macOS
+    peak_rss = usage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+    return {
+        "sessions": n_sessions,
+        "open_ms": open_ms,
+        "latencies_ms": latencies,
+        "skipped": skipped,
+        "errors": errors,
+        "wall_s": wall,
+        "cpu_s": (usage.ru_utime - usage_start.ru_utime) + (usage.ru_stime - usage_start.ru_stime),
+        "peak_rss_bytes": peak_rss,
+        "session_rss_bytes": None if rss_start is None else (rss_sessions - rss_start) / max(n_sessions, 1),
+    }
+
+
+# --- Ringkasan ---
+
+def summarize(app, workers, wall, think_time):
+    latencies = np.concatenate([worker["latencies_ms"] for worker in workers]) if workers else np.empty(0)
+    open_ms = np.concatenate([worker["open_ms"] for worker in workers])
+    reruns = len(latencies)
+    per_process = [len(worker["latencies_ms"]) / worker["wall_s"] for worker in workers if worker["wall_s"]]
+    cpu = sum(worker["cpu_s"] for worker in workers)
+    mean_ms = float(latencies.mean()) if reruns else 0.0
+    session_rss = [worker["session_rss_bytes"] for worker in workers if worker["session_rss_bytes"] is not None]
+    throughput_process = float(np.mean(per_process)) if per_process else 0.0
+    return {
+        "app": app,
+        "processes": len(workers),
+        "sessions": sum(worker["sessions"] for worker in workers),
+        "reruns": reruns,
+        "skipped": sum(worker["skipped"] for worker in workers),
+        "errors": sum(len(worker["errors"]) for worker in workers),
+        "error_samples": sorted({error for worker in workers for error in worker["errors"]})[:5],
+        "latency_ms": {
+            **{f"p{q}": float(value) for q, value in zip(PERCENTILES, np.percentile(latencies, PERCENTILES) if reruns else [0] * 4)},
+            "mean": mean_ms,
+            "max": float(latencies.max()) if reruns else 0.0,
+        },
+        "open_ms_p50": float(np.percentile(open_ms, 50)) if len(open_ms) else 0.0,
+        "wall_s": wall,
+        "sequential_rps": reruns / wall if wall else 0.0,
+        "sequential_rps_per_process": throughput_process,
+        "cpu_s": cpu,
+        # 100% = satu inti CPU penuh selama uji berlangsung
+        "cpu_percent": 100 * cpu / wall if wall else 0.0,
+        "peak_rss_mb": max(worker["peak_rss_bytes"] for worker in workers) / 1024 ** 2,
+        "session_rss_kb": float(np.mean(session_rss)) / 1024 if session_rss else None,
+        # Hukum Little: siswa = throughput x (waktu berpikir + latensi)
+        "students_per_process": throughput_process * (think_time + mean_ms / 1000),
+    }
+
+
+def run_app(app, sessions, steps, processes, seed, timeout, think_time):
+    shares = [sessions // processes + (k < sessions % processes) for k in range(processes)]
+    shares = [share for share in shares if share]
+    start = time.perf_counter()
+    # "spawn": tiap worker mulai dari proses bersih, jadi RSS dan CPU-nya hanya milik lab ini
+    with ProcessPoolExecutor(len(shares), mp_context=multiprocessing.get_context("spawn")) as pool:
+        futures = [pool.submit(run_worker, app, share, steps, seed + k, timeout) for k, share in enumerate(shares)]
+        workers = [future.result() for future in futures]
+    return summarize(app, workers, time.perf_counter() - start, think_time)
+
+
+def print_report(results):
+    print(
+        f"\n{'lab':<14} {'sesi':>5} {'rerun':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'rerun/s':>8}"
+        f" {'CPU':>6} {'RSS':>8} {'siswa/proses':>13} {'galat':>6}"
+    )
+    for result in results:
+        latency = result["latency_ms"]
+        print(
+            f"{result['app']:<14} {result['sessions']:>5} {result['reruns']:>6} {latency['p50']:>6.0f}ms"
+            f" {latency['p95']:>6.0f}ms {latency['p99']:>6.0f}ms {result['sequential_rps']:>8.1f}"
+            f" {result['cpu_percent']:>5.0f}% {result['peak_rss_mb']:>6.0f}MB {result['students_per_process']:>13.0f}"
+            f" {result['errors']:>6}"
+        )
+        for sample in result["error_samples"]:
+            print(f"    ! {sample}")
+    print("rerun/s = rerun berurutan per detik (sesi dalam satu proses dijalankan bergiliran, bukan serentak)")
+
+
+def compare(current, baseline, threshold=1.25):
+    """Bandingkan p95 dan throughput per lab dengan baseline; mengembalikan lab yang memburuk."""
+    previous = {result["app"]: result for result in baseline["results"]}
+    regressions = []
+    print(f"\n{'lab':<14} {'p95 lama':>10} {'p95 baru':>10} {'rasio':>7} {'rerun/s lama':>13} {'baru':>8} {'RSS':>7}")
+    for result in current["results"]:
+        old = previous.get(result["app"])
+        if old is None:
+            continue
+        p95_ratio = result["latency_ms"]["p95"] / old["latency_ms"]["p95"] if old["latency_ms"]["p95"] else 1.0
+        throughput_ratio = old["sequential_rps"] / result["sequential_rps"] if result["sequential_rps"] else float("inf")
+        rss_ratio = result["peak_rss_mb"] / old["peak_rss_mb"] if old["peak_rss_mb"] else 1.0
+        flag = ""
+        if p95_ratio > threshold or throughput_ratio > threshold:
+            flag = "  << LEBIH LAMBAT"
+            regressions.append(result["app"])
+        print(
+            f"{result['app']:<14} {old['latency_ms']['p95']:>8.0f}ms {result['latency_ms']['p95']:>8.0f}ms {p95_ratio:>6.2f}x"
+            f" {old['sequential_rps']:>13.1f} {result['sequential_rps']:>8.1f} {rss_ratio:>6.2f}x{flag}"
+        )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Uji beban lokal: banyak sesi bergiliran per lab tanpa browser.")
+    parser.add_argument("-k", "--filter", help="Hanya lab yang namanya memuat teks ini")
+    parser.add_argument("--sessions", type=int, default=100, help="Jumlah sesi yang hidup bersamaan per lab, dijalankan bergiliran (default 100)")
+    parser.add_argument("--steps", type=int, default=5, help="Jumlah interaksi per sesi (default 5)")
+    parser.add_argument("--processes", type=int, default=1, help="Jumlah proses worker paralel per lab (default 1)")
+    parser.add_argument("--think-time", type=float, default=5.0,
+                        help="Rata-rata jeda antar-interaksi seorang siswa (detik) untuk perkiraan kapasitas")
+    parser.add_argument("--timeout", type=float, default=60, help="Batas waktu satu rerun (detik)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed nilai acak skenario")
+    parser.add_argument("-o", "--output", help="Simpan laporan sebagai JSON ke file ini")
+    parser.add_argument("--baseline", help="File JSON laporan sebelumnya untuk dibandingkan")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="Rasio p95/throughput terhadap baseline yang dianggap regresi (default 1.25)")
+    parser.add_argument("--list", action="store_true", help="Tampilkan skenario lalu keluar")
+    args = parser.parse_args(argv)
+
+    apps = [app for app in SCENARIOS if not args.filter or args.filter in app]
+    if args.list:
+        for app in apps:
+            path, actions = SCENARIOS[app]
+            print(f"{app:<14} {path}: " + ", ".join(f"{kind} '{name}'" for kind, name, _ in actions))
+        return 0
+
+    results = []
+    for app in apps:
+        print(f"{app}: {args.sessions} sesi bergiliran x {args.steps} interaksi di {args.processes} proses...", file=sys.stderr)
+        results.append(run_app(app, args.sessions, args.steps, args.processes, args.seed, args.timeout, args.think_time))
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "sessions": args.sessions,
+            "steps": args.steps,
+            "processes": args.processes,
+            "think_time_s": args.think_time,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    print_report(results)
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} lab memburuk lebih dari {args.threshold}x dibanding baseline.")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())